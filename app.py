@@ -1,11 +1,23 @@
-from flask import Flask, render_template, request, jsonify, session
-from main import PageChecker
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context
+from main import PageChecker, DriverPool, egress_pool
+from compact_results import CompactResults, DEFAULT_SPILL_THRESHOLD
+from keyword_index import KeywordIndex, normalize_keyword
+from verdict_cache import VerdictCache, DEFAULT_TTLS, normalize_url
+from job_store import JobStore, JobScheduler
+from rate_limiter import HostRateLimiter
+from work_queue import open_work_queue, KEYWORD_ITEM, URLS_ITEM
+from metrics import metrics
 import threading
 import queue
+from collections import deque
 import time
 from datetime import datetime
 from urllib.parse import urlparse
 import logging
+import os
+import json
+import zlib
+import itertools
 
 # 로깅 설정
 logging.basicConfig(
@@ -17,17 +29,92 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'  # 세션을 위한 시크릿 키
 
-# 작업 상태를 저장할 전역 딕셔너리
+# 작업 상태를 저장할 전역 딕셔너리 (실행 중인 작업의 메모리 상태)
 tasks = {}
 
+# 끝난 작업 상태
+FINISHED_STATUSES = ('completed', 'error', 'cancelled')
+
+# 작업별로 메모리에 보관할 낙장 URL 수 (넘으면 임시 파일에 기록)
+RESULTS_SPILL_THRESHOLD = int(os.environ.get('RESULTS_SPILL_THRESHOLD', DEFAULT_SPILL_THRESHOLD))
+# /status 응답 한 번에 보낼 최대 낙장 URL 수
+STATUS_PAGE_SIZE = int(os.environ.get('STATUS_PAGE_SIZE', 1000))
+# 작업별로 /stream 재접속에 대비해 보관할 최근 이벤트 수 (지난 이벤트는 /status?since=로 다시 받음)
+EVENT_BUFFER_SIZE = int(os.environ.get('EVENT_BUFFER_SIZE', 1000))
+
+# 재시작해도 작업과 진행 상황이 남도록 저장하는 작업 저장소
+job_store = JobStore(os.environ.get('JOB_STORE_PATH', 'jobs.db'))
+
+# 여러 노드의 워커(worker.py)에 검사를 나누어 맡길 작업 대기열
+# (SQLite 파일 경로 또는 redis://..., 지정하지 않으면 이 프로세스에서 직접 검사)
+WORK_QUEUE = os.environ.get('WORK_QUEUE')
+work_queue = open_work_queue(WORK_QUEUE) if WORK_QUEUE else None
+# 워커 한 명이 한 번에 검사할 URL 수
+URL_CHUNK_SIZE = int(os.environ.get('URL_CHUNK_SIZE', 20))
+# 워커 결과를 확인하는 간격 (초)
+COORDINATOR_POLL_INTERVAL = float(os.environ.get('COORDINATOR_POLL_INTERVAL', 0.5))
+
+# 작업 간에 공유하는 ChromeDriver 풀 (동시에 띄우는 브라우저 수 제한)
+driver_pool = DriverPool(
+    size=int(os.environ.get('DRIVER_POOL_SIZE', 2)),
+    max_pages=int(os.environ.get('DRIVER_MAX_PAGES', 200))
+)
+# 대기 중인 드라이버의 프로세스를 주기적으로 확인하여 죽은 드라이버를 미리 교체
+driver_pool.start_supervisor(float(os.environ.get('DRIVER_SUPERVISE_INTERVAL', 5.0)))
+# 작업 간에 공유하는 URL 판정 캐시
+verdict_cache = VerdictCache(
+    os.environ.get('VERDICT_CACHE_PATH', 'verdict_cache.db'),
+    ttls={
+        'dead': float(os.environ.get('VERDICT_CACHE_TTL_DEAD', DEFAULT_TTLS['dead'])),
+        'alive': float(os.environ.get('VERDICT_CACHE_TTL_ALIVE', DEFAULT_TTLS['alive']))
+    }
+)
+# 작업 간에 공유하는 호스트별 요청 속도 제한기
+rate_limiter = HostRateLimiter()
+# 첫 작업이 드라이버 기동을 기다리지 않도록 미리 생성 (워커에 맡기는 경우 제외)
+if work_queue is None:
+    threading.Thread(
+        target=driver_pool.prewarm,
+        args=(int(os.environ.get('DRIVER_POOL_PREWARM', 1)),),
+        daemon=True
+    ).start()
+
 class SearchTask:
     def __init__(self):
         self.progress = 0
         self.current_keyword = ""
-        self.status = "running"
+        self.status = "queued"
         self.results = None
         self.last_update = datetime.now()
         self.driver = None  # ChromeDriver 인스턴스 저장
+        # /stream으로 전달할 최근 (이벤트 이름, 데이터) 목록과 그 첫 이벤트의 id
+        self.events = deque(maxlen=EVENT_BUFFER_SIZE)
+        self.event_base = 0
+        self.event_cond = threading.Condition()
+    
+    def results_dict(self):
+        """저장/응답용 결과 딕셔너리 (결과가 없으면 None)"""
+        if isinstance(self.results, CompactResults):
+            return self.results.to_dict()
+        return self.results
+
+    def close(self):
+        """결과 임시 파일 정리"""
+        if isinstance(self.results, CompactResults):
+            self.results.close()
+
+    def emit(self, event, data):
+        """스트리밍 구독자에게 전달할 이벤트 추가 (가장 오래된 이벤트부터 밀려남)"""
+        with self.event_cond:
+            if len(self.events) == self.events.maxlen:
+                self.event_base += 1
+            self.events.append((event, data))
+            self.event_cond.notify_all()
+
+    def events_from(self, index):
+        """id가 index 이상인 보관 중인 이벤트와 그 첫 id (event_cond를 잡은 채 호출)"""
+        start = max(index, self.event_base)
+        return list(itertools.islice(self.events, start - self.event_base, None)), start
 
 def safe_driver_quit(driver):
     """안전하게 ChromeDriver를 종료하는 함수"""
@@ -40,22 +127,35 @@ def safe_driver_quit(driver):
 def background_task(task_id, keywords):
     task = tasks[task_id]
     checker = None
+    if task.status == "cancelled":
+        # 대기 중에 취소된 작업
+        task.emit('status', {'status': task.status, 'progress': task.progress})
+        return
+    task.status = "running"
+    job_store.update_job(task_id, status=task.status)
     
     try:
-        checker = PageChecker()
+        checker = PageChecker(driver_pool=driver_pool, cache=verdict_cache, rate_limiter=rate_limiter)
         task.driver = checker.driver  # driver 인스턴스 저장
         total_keywords = len(keywords)
         
-        results = {
-            'total_sites': 0,
-            'error_pages': 0,
-            'error_urls': [],
-            'domain_stats': {}
-        }
+        # 진행 중에도 /status로 변경분을 조회할 수 있도록 바로 연결
+        results = CompactResults(spill_threshold=RESULTS_SPILL_THRESHOLD)
+        task.results = results
+        seen = set()  # 이미 검사한 URL (키워드 간 중복 제거)
+        index = KeywordIndex(aggregate=False)  # 표기만 다른 키워드의 검색 결과 재사용 (URL 집계는 하지 않음)
+        
+        # 중단된 작업이면 저장된 체크포인트부터 이어서 진행
+        completed = job_store.completed_keywords(task_id)
+        results.add_verdicts(seen, job_store.verdicts(task_id))
+        if completed:
+            logger.info(f"작업 재개: {task_id} ({len(completed)}/{total_keywords} 키워드 완료)")
         
         for idx, keyword in enumerate(keywords):
             if task.status == "cancelled":
                 break
+            if idx in completed:
+                continue
                 
             # 현재 키워드 진행 상태 업데이트
             task.current_keyword = keyword
@@ -65,59 +165,54 @@ def background_task(task_id, keywords):
             
             try:
                 # 키워드 검색 및 결과 처리
-                search_results = checker.search_naver(keyword)
-                urls = search_results['urls']
+                urls = checker.new_urls(checker.search_keyword(keyword, index), seen)
+                task.emit('keyword', {'keyword': keyword, 'urls': urls})
                 
                 if urls:
-                    results['total_sites'] += len(urls)
-                    
-                    # 도메인 통계 업데이트
-                    for domain, count in search_results['domain_stats'].items():
-                        if domain not in results['domain_stats']:
-                            results['domain_stats'][domain] = {
-                                'total': 0,
-                                'errors': 0
-                            }
-                        results['domain_stats'][domain]['total'] += count
-                    
                     # URL 체크 진행률 계산을 위한 변수
                     total_urls = len(urls)
-                    for url_idx, url in enumerate(urls):
-                        if task.status == "cancelled":
-                            break
-                            
+                    checked = [0]
+                    
+                    def on_result(url, is_error, elapsed, reason):
                         # URL 체크 진행률 업데이트
-                        url_progress = (url_idx * 100) // total_urls
+                        checked[0] += 1
+                        url_progress = (checked[0] * 100) // total_urls
                         task.progress = base_progress + (url_progress // total_keywords)
                         task.last_update = datetime.now()
-                        
-                        try:
-                            if checker.check_url(url):
-                                results['error_pages'] += 1
-                                results['error_urls'].append(url)
-                                domain = urlparse(url).netloc
-                                if domain in results['domain_stats']:
-                                    results['domain_stats'][domain]['errors'] += 1
-                        except Exception as url_error:
-                            logger.error(f"URL 체크 중 에러 발생: {url} - {str(url_error)}")
-                            continue
+                        task.emit('verdict', {'url': url, 'is_error': is_error, 'reason': reason, 'progress': task.progress})
+                        job_store.save_verdict(task_id, idx, url, is_error)
+                    
+                    try:
+                        batch = checker.check_urls(
+                            urls,
+                            on_result=on_result,
+                            should_stop=lambda: task.status == "cancelled"
+                        )
+                        results.merge(batch)
+                        # 이번 키워드에서 늘어난 도메인 통계 전달
+                        task.emit('domain_stats', batch['domain_stats'])
+                    except Exception as url_error:
+                        logger.error(f"URL 체크 중 에러 발생: {keyword} - {str(url_error)}")
                 
                 # 키워드 완료 후 진행률 업데이트
                 task.progress = ((idx + 1) * 100) // total_keywords
                 task.last_update = datetime.now()
+                if task.status != "cancelled":
+                    job_store.complete_keyword(task_id, idx, keyword)
+                    job_store.update_job(task_id, progress=task.progress)
                 
             except Exception as keyword_error:
                 logger.error(f"키워드 처리 중 에러 발생: {keyword} - {str(keyword_error)}")
                 continue
         
-        # 작업 완료 전 결과 저장
-        task.results = results
-        task.progress = 100
-        task.status = "completed"
+        if task.status != "cancelled":
+            task.progress = 100
+            task.status = "completed"
         
     except Exception as e:
         logger.error(f"작업 실행 중 에러 발생: {str(e)}")
         task.status = "error"
+        task.close()
         task.results = {'error': str(e)}
     finally:
         try:
@@ -126,11 +221,183 @@ def background_task(task_id, keywords):
                 if not task.results and task.status != "error":
                     task.status = "error"
                     task.results = {'error': '검색 결과를 가져오는데 실패했습니다.'}
-                # 드라이버 안전 종료
-                safe_driver_quit(checker.driver)
+                # 드라이버를 풀에 반납
+                checker.close()
             task.driver = None
         except Exception as cleanup_error:
             logger.error(f"정리 작업 중 에러 발생: {str(cleanup_error)}")
+        job_store.update_job(task_id, status=task.status, progress=task.progress, results=task.results_dict())
+        task.emit('status', {'status': task.status, 'progress': task.progress})
+
+def coordinate_task(task_id, keywords):
+    """작업을 작업 대기열에 나누어 넣고 워커들이 보고한 결과를 모음 (WORK_QUEUE 설정 시)
+
+    키워드마다 검색 항목을 넣고, 워커가 보고한 검색 결과 중 이 작업에서 처음 나온
+    URL만 URL_CHUNK_SIZE개씩 묶어 검사 항목으로 다시 넣는다. 키워드의 모든 묶음이
+    보고되면 키워드 완료 체크포인트를 남긴다. 표기만 다른 키워드(normalize_keyword가
+    같은 키워드)는 처음 키워드만 검색하고, 나머지는 그 검색 결과를 재사용하여 처음
+    키워드와 함께 완료한다 (background_task의 KeywordIndex와 같은 동작).
+    """
+    task = tasks[task_id]
+    if task.status == "cancelled":
+        task.emit('status', {'status': task.status, 'progress': task.progress})
+        return
+    task.status = "running"
+    job_store.update_job(task_id, status=task.status)
+
+    try:
+        results = CompactResults(spill_threshold=RESULTS_SPILL_THRESHOLD)
+        task.results = results
+        seen = set()  # 판정을 받은 URL
+        queued = set()  # 검사 항목으로 넣은 URL (키워드 간 중복 제거)
+        total_keywords = len(keywords)
+
+        # 중단된 작업이면 저장된 체크포인트부터 이어서 진행
+        completed = job_store.completed_keywords(task_id)
+        results.add_verdicts(seen, job_store.verdicts(task_id))
+        queued.update(seen)
+        # 이전 실행이 남긴 항목과 결과는 버리고 끝나지 않은 키워드부터 다시 넣음
+        work_queue.purge(task_id)
+        outstanding = {}  # 키워드 인덱스 -> 남은 URL 묶음 (None이면 검색 결과 대기 중)
+        index = KeywordIndex(aggregate=False)  # 표기만 다른 키워드의 검색 결과 재사용 (URL 집계는 하지 않음)
+        first_of = {}  # 정규화 키워드 -> 검색을 맡은 키워드 인덱스
+        followers = {}  # 검색을 맡은 키워드 인덱스 -> 그 검색 결과를 재사용하는 키워드 인덱스 목록
+        for idx, keyword in enumerate(keywords):
+            if idx in completed:
+                continue
+            key = normalize_keyword(keyword)
+            if key in first_of:
+                followers[first_of[key]].append(idx)
+                continue
+            first_of[key] = idx
+            followers[idx] = []
+            work_queue.put(task_id, KEYWORD_ITEM, {'keyword_idx': idx, 'keyword': keyword})
+            outstanding[idx] = None
+        done = len(completed)
+        cursor = 0
+
+        while outstanding and task.status != "cancelled":
+            batch, cursor = work_queue.results(task_id, cursor)
+            if not batch:
+                time.sleep(COORDINATOR_POLL_INTERVAL)
+                continue
+            for result in batch:
+                idx = result['keyword_idx']
+                if idx not in outstanding:
+                    continue
+                keyword = keywords[idx]
+                if result['kind'] == KEYWORD_ITEM:
+                    if outstanding[idx] is not None:
+                        continue
+                    if 'error' in result:
+                        logger.error(f"키워드 처리 중 에러 발생: {keyword} - {result['error']}")
+                        del outstanding[idx]
+                        continue
+                    index.add(keyword, result['urls'])
+                    for follower in followers[idx]:
+                        # 검색 결과의 URL은 모두 처음 키워드가 검사하므로 새 URL이 없음
+                        if index.lookup(keywords[follower]) is not None:
+                            metrics.inc('serp_reused')
+                            logger.info(f"검색 결과 재사용: {keywords[follower]}")
+                        task.emit('keyword', {'keyword': keywords[follower], 'urls': []})
+                    urls = []
+                    for url in result['urls']:
+                        key = normalize_url(url)
+                        if key not in queued:
+                            queued.add(key)
+                            urls.append(url)
+                    task.current_keyword = keyword
+                    task.emit('keyword', {'keyword': keyword, 'urls': urls})
+                    chunks = set()
+                    for start in range(0, len(urls), URL_CHUNK_SIZE):
+                        chunk = f"{idx}:{start}"
+                        work_queue.put(task_id, URLS_ITEM, {
+                            'keyword_idx': idx,
+                            'chunk': chunk,
+                            'urls': urls[start:start + URL_CHUNK_SIZE]
+                        })
+                        chunks.add(chunk)
+                    outstanding[idx] = chunks
+                elif outstanding[idx] is not None and result['chunk'] in outstanding[idx]:
+                    outstanding[idx].discard(result['chunk'])
+                    if 'error' in result:
+                        logger.error(f"URL 체크 중 에러 발생: {keyword} - {result['error']}")
+                    verdicts = result.get('verdicts', [])
+                    for url, is_error, reason in verdicts:
+                        job_store.save_verdict(task_id, idx, url, is_error)
+                        task.emit('verdict', {'url': url, 'is_error': is_error, 'reason': reason,
+                                              'progress': task.progress})
+                    domain_stats = {}
+                    for url, is_error in results.add_verdicts(seen, [(url, is_error) for url, is_error, _ in verdicts]):
+                        stats = domain_stats.setdefault(urlparse(url).netloc, {'total': 0, 'errors': 0})
+                        stats['total'] += 1
+                        stats['errors'] += int(is_error)
+                    if domain_stats:
+                        task.emit('domain_stats', domain_stats)
+
+                if outstanding[idx] is not None and not outstanding[idx]:
+                    # 키워드의 모든 URL 묶음 완료 (검색 결과를 재사용한 키워드도 함께 완료)
+                    del outstanding[idx]
+                    for finished in [idx] + followers[idx]:
+                        done += 1
+                        job_store.complete_keyword(task_id, finished, keywords[finished])
+                    task.progress = (done * 100) // total_keywords
+                    task.last_update = datetime.now()
+                    job_store.update_job(task_id, progress=task.progress)
+
+        if task.status != "cancelled":
+            task.progress = 100
+            task.status = "completed"
+
+    except Exception as e:
+        logger.error(f"작업 실행 중 에러 발생: {str(e)}")
+        task.status = "error"
+        task.close()
+        task.results = {'error': str(e)}
+    finally:
+        try:
+            # 취소되었거나 끝난 작업의 남은 항목은 워커가 가져가지 않도록 정리
+            work_queue.purge(task_id)
+        except Exception as cleanup_error:
+            logger.error(f"정리 작업 중 에러 발생: {str(cleanup_error)}")
+        job_store.update_job(task_id, status=task.status, progress=task.progress, results=task.results_dict())
+        task.emit('status', {'status': task.status, 'progress': task.progress})
+
+# 동시에 실행할 작업 수와 대기열 크기를 제한하는 스케줄러
+# (작업 대기열이 있으면 검사는 워커가 하고 여기서는 조정만 함)
+scheduler = JobScheduler(
+    coordinate_task if work_queue is not None else background_task,
+    concurrency=int(os.environ.get('JOB_CONCURRENCY', 2)),
+    max_queue=int(os.environ.get('JOB_QUEUE_SIZE', 100))
+)
+resume_lock = threading.Lock()
+resumed = False
+
+@app.before_request
+def resume_jobs():
+    """서버 재시작 전에 끝나지 않은 작업을 이어서 실행 (첫 요청 시 한 번)
+
+    개발 서버의 리로더 부모 프로세스는 요청을 처리하지 않으므로
+    작업이 두 프로세스에서 중복 실행되지 않는다.
+    """
+    global resumed
+    with resume_lock:
+        if resumed:
+            return
+        resumed = True
+    
+    def submit_all(jobs):
+        for job in jobs:
+            scheduler.submit(job['task_id'], job['keywords'], block=True)
+    
+    jobs = job_store.unfinished_jobs()
+    for job in jobs:
+        task = SearchTask()
+        task.progress = job['progress']
+        tasks[job['task_id']] = task
+        logger.info(f"중단된 작업 재등록: {job['task_id']}")
+    # 대기열이 가득 차도 요청이 막히지 않도록 별도 스레드에서 등록
+    threading.Thread(target=submit_all, args=(jobs,), daemon=True).start()
 
 @app.route('/')
 def index():
@@ -143,25 +410,71 @@ def search():
     
     task_id = str(time.time())
     tasks[task_id] = SearchTask()
+    job_store.create_job(task_id, keywords)
     
-    # 백그라운드 작업 시작
-    thread = threading.Thread(
-        target=background_task, 
-        args=(task_id, keywords)
-    )
-    thread.daemon = True
-    thread.start()
+    # 백그라운드 작업 등록 (동시 실행 수를 넘으면 대기열에서 순서를 기다림)
+    if not scheduler.submit(task_id, keywords):
+        del tasks[task_id]
+        job_store.update_job(task_id, status="error", results={'error': '대기 중인 작업이 너무 많습니다.'})
+        return jsonify({'error': '대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.'}), 503
     
     return jsonify({'task_id': task_id})
 
+def not_modified(tag: str):
+    """클라이언트가 가진 응답과 같으면 304 응답 (본문 직렬화 생략)"""
+    if tag in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{tag}"', 'Cache-Control': 'no-cache'})
+    return None
+
+def tagged_json(data, tag: str):
+    """ETag를 붙인 JSON 응답"""
+    response = jsonify(data)
+    response.set_etag(tag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 @app.route('/status/<task_id>')
 def get_status(task_id):
+    """작업 상태 조회
+
+    since(마지막으로 받은 version)를 주면 진행 중에도 그 이후의 변경분만 보내며,
+    limit으로 한 번에 보낼 낙장 URL 수를 제한한다. has_more가 참이면 응답의
+    version으로 다시 요청해 나머지를 받는다. 응답이 바뀌지 않았으면
+    If-None-Match에 대해 304를 돌려준다.
+    """
     cleanup_tasks()  # 오래된 작업 정리
+    since = request.args.get('since', type=int)
+    # 0 이하이면 URL 없이 version만 앞으로 가므로 최소 1개씩 보냄
+    limit = max(1, request.args.get('limit', default=STATUS_PAGE_SIZE, type=int))
     
     if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
+        # 메모리에서 정리된 작업은 작업 저장소에서 조회
+        job = job_store.get_job(task_id)
+        if not job:
+            return jsonify({'error': 'Task not found'}), 404
+        tag = f"stored-{job['status']}-{job['progress']}"
+        cached = not_modified(tag)
+        if cached:
+            return cached
+        response = {
+            'status': job['status'],
+            'progress': job['progress'],
+            'current_keyword': ''
+        }
+        if job['status'] in ['completed', 'error'] and job['results']:
+            response['results'] = job['results']
+        return tagged_json(response, tag)
         
     task = tasks[task_id]
+    results = task.results
+    version = results.version if isinstance(results, CompactResults) else 0
+    tag = (
+        f"{task.status}-{task.progress}-{zlib.crc32(task.current_keyword.encode('utf-8'))}"
+        f"-{version}-{since}-{limit}"
+    )
+    cached = not_modified(tag)
+    if cached:
+        return cached
     
     response = {
         'status': task.status,
@@ -169,17 +482,89 @@ def get_status(task_id):
         'current_keyword': task.current_keyword
     }
     
-    # 작업이 완료되었거나 에러가 발생한 경우에만 결과 포함
-    if task.status in ['completed', 'error'] and task.results:
-        response['results'] = task.results
+    if since is not None and isinstance(results, CompactResults):
+        # since 이후 변경분만 전달
+        changes, next_version, has_more = results.changes(since, limit)
+        response.update(results=changes, version=next_version, has_more=has_more)
+    elif task.status in ['completed', 'error'] and results:
+        # 작업이 완료되었거나 에러가 발생한 경우에만 전체 결과 포함
+        response['results'] = task.results_dict()
+    
+    return tagged_json(response, tag)
+
+@app.route('/stream/<task_id>')
+def stream_task(task_id):
+    """작업 결과를 Server-Sent Events로 실시간 전달
+
+    keyword(검색된 URL), verdict(URL 판정), domain_stats(도메인 통계 증가분),
+    status(작업 종료) 이벤트를 발생 순서대로 보낸다. 재접속 시 Last-Event-ID
+    이후의 이벤트부터 이어서 보낸다. 작업마다 최근 EVENT_BUFFER_SIZE개의 이벤트만
+    보관하므로, 이어 받을 이벤트가 이미 밀려났으면 resync 이벤트를 먼저 보낸다.
+    클라이언트는 그 사이의 결과를 /status?since=0으로 다시 받는다.
+    """
+    if task_id not in tasks:
+        return jsonify({'error': 'Task not found'}), 404
+    
+    task = tasks[task_id]
+    try:
+        start = int(request.headers.get('Last-Event-ID', -1)) + 1
+    except ValueError:
+        start = 0
+    
+    def generate():
+        index = start
+        while True:
+            with task.event_cond:
+                if index >= task.event_base + len(task.events):
+                    task.event_cond.wait(timeout=15)
+                events, first = task.events_from(index)
+            
+            if first > index:
+                # 보관 범위를 벗어난 이벤트는 /status로 다시 받도록 안내
+                resync = {'missed': first - index, 'status_url': f"/status/{task_id}?since=0"}
+                yield f"id: {first - 1}\nevent: resync\ndata: {json.dumps(resync, ensure_ascii=False)}\n\n"
+                index = first
+            
+            if not events:
+                # 프록시가 연결을 끊지 않도록 주기적으로 주석 전송
+                yield ': keep-alive\n\n'
+                continue
+            
+            for event, data in events:
+                yield f"id: {index}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+                index += 1
+                if event == 'status':
+                    return
     
-    return jsonify(response)
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus 수집용 지표"""
+    running = sum(1 for task in tasks.values() if task.status == 'running')
+    gauges = (
+        '# TYPE finddomain_jobs_running gauge\n'
+        f'finddomain_jobs_running {running}\n'
+        '# TYPE finddomain_jobs_queued gauge\n'
+        f'finddomain_jobs_queued {scheduler.pending()}\n'
+    )
+    if egress_pool is not None:
+        # 출구 프록시별 건강 점수
+        gauges += '# TYPE finddomain_egress_score gauge\n'
+        for state in egress_pool.snapshot():
+            gauges += f'finddomain_egress_score{{proxy="{state["proxy"]}"}} {state["score"]}\n'
+    return Response(metrics.render_prometheus() + gauges, mimetype='text/plain; version=0.0.4')
 
 @app.route('/cancel/<task_id>')
 def cancel_task(task_id):
     if task_id in tasks:
         task = tasks[task_id]
         task.status = "cancelled"
+        job_store.update_job(task_id, status="cancelled")
         # 드라이버 안전하게 종료
         if task.driver:
             safe_driver_quit(task.driver)
@@ -188,13 +573,16 @@ def cancel_task(task_id):
     return jsonify({'error': 'Task not found'}), 404
 
 def cleanup_tasks():
-    """오래된 작업 정리"""
+    """끝난 지 오래된 작업을 메모리에서 정리 (결과는 작업 저장소에 남음)"""
     current_time = datetime.now()
     for task_id in list(tasks.keys()):
         task = tasks[task_id]
+        if task.status not in FINISHED_STATUSES:
+            continue
         if (current_time - task.last_update).seconds > 300:  # 5분 이상 지난 작업
             if task.driver:
                 safe_driver_quit(task.driver)
+            task.close()
             del tasks[task_id]
 
 if __name__ == '__main__':
@@ -0,0 +1,356 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, parse_qs
+
+try:
+    import resource  # POSIX 전용 (윈도우에는 없음)
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# 대역 서버가 흉내 내는 검색 결과 페이지 주소 (프록시를 거치도록 http 사용)
+STAND_IN_SEARCH_URL = 'http://search.naver.com/search.naver'
+
+LIVE_FILLER = '<p>티스토리 블로그 본문 문장입니다. 정상적으로 작성된 글의 내용이 이어집니다.</p>\n'
+
+SOFT_404_PAGE = '''<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>TISTORY</title></head>
+<body>
+<div class="absent_post">
+<h2 class="tit_error">존재하지 않는 페이지입니다.</h2>
+<p class="desc_error">요청하신 페이지가 삭제되었거나 주소가 변경되었습니다.</p>
+</div>
+</body>
+</html>'''
+
+BLOG_GONE_PAGE = '''<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>TISTORY</title></head>
+<body>
+<div class="absent_post">
+<h2 class="tit_error">삭제된 블로그입니다.</h2>
+</div>
+</body>
+</html>'''
+
+# 일부 정상 블로그의 루트 페이지 글 목록에 넣는 글 제목 (블로그 삭제 안내 문구를 포함)
+GONE_PHRASE_POST = '삭제된 블로그 복구하는 방법'
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """네이버 검색과 티스토리 블로그를 흉내 내는 HTTP 프록시 핸들러
+
+    체커는 이 서버를 HTTP 프록시로 사용하므로 요청 줄에 절대 URL이 들어온다.
+    search.naver.com 요청에는 합성 검색 결과를, *.tistory.com 요청에는
+    설정된 비율에 따라 정상/404/소프트 404 페이지를 돌려준다. 삭제된 블로그로 정해진
+    블로그는 루트 페이지를 포함한 모든 주소가 404이다. 정상 블로그 중 일부는 루트
+    페이지의 글 목록에 블로그 삭제 안내 문구가 들어간 글 제목이 있다.
+    """
+    protocol_version = 'HTTP/1.1'
+    config = {}
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        host = (parts.netloc or self.headers.get('Host', '')).lower()
+        time.sleep(self.config['latency'])
+
+        if host == 'search.naver.com':
+            query = parse_qs(parts.query)
+            self.send_page(200, self.serp_page(query.get('query', [''])[0], int(query.get('start', ['1'])[0])))
+        elif host.endswith('tistory.com'):
+            kind = self.page_kind(self.path)
+            if self.blog_deleted(host):
+                self.send_page(404, BLOG_GONE_PAGE)
+            elif parts.path in ('', '/'):
+                # 블로그 루트 페이지는 블로그가 살아 있으면 항상 정상
+                self.send_page(200, self.root_page(host))
+            elif kind == 'dead':
+                self.send_page(404, '<html><body>Not Found</body></html>')
+            elif kind == 'soft':
+                self.send_page(200, SOFT_404_PAGE)
+            else:
+                self.send_page(200, self.live_page())
+        else:
+            self.send_page(502, '<html><body>Bad Gateway</body></html>')
+
+    def send_page(self, status: int, body: str):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def serp_page(self, keyword: str, start: int) -> str:
+        """검색어와 시작 위치로 항상 같은 결과를 내는 합성 검색 결과 페이지"""
+        rng = random.Random(f"{keyword}:{start}")
+        links = []
+        for _ in range(10):
+            blog = rng.randrange(self.config['blogs'])
+            post = rng.randrange(self.config['posts'])
+            links.append(
+                f'<li class="bx"><div class="total_wrap"><div class="total_area">'
+                f'<a class="link_tit" href="http://blog{blog}.tistory.com/{post}">{keyword} {post}</a>'
+                f'</div></div></li>'
+            )
+        return (
+            '<!DOCTYPE html><html><head><meta charset="utf-8"><title>검색 결과</title></head>'
+            f'<body><div id="main_pack"><ul class="lst_total">{"".join(links)}</ul></div></body></html>'
+        )
+
+    def blog_deleted(self, host: str) -> bool:
+        """블로그별로 고정된 삭제 여부 (삭제된 블로그는 루트와 모든 글이 404)"""
+        bucket = (zlib.crc32(f"blog:{host}".encode('utf-8')) % 1000) / 1000
+        return bucket < self.config.get('dead_blog_ratio', 0)
+
+    def gone_phrase_root(self, host: str) -> bool:
+        """루트 페이지 글 목록에 블로그 삭제 안내 문구가 들어간 글이 있는 정상 블로그인지"""
+        bucket = (zlib.crc32(f"phrase:{host}".encode('utf-8')) % 1000) / 1000
+        return bucket < self.config.get('gone_phrase_ratio', 0)
+
+    def expected_dead(self, url: str) -> bool:
+        """대역 서버가 낙장으로 돌려주는 URL인지 (판정 정확도 확인용)"""
+        if self.blog_deleted(urlsplit(url).netloc.lower()):
+            return True
+        return self.page_kind(url) != 'live'
+
+    def page_kind(self, url: str) -> str:
+        """URL별로 고정된 페이지 종류 (live/dead/soft)"""
+        bucket = (zlib.crc32(url.encode('utf-8')) % 1000) / 1000
+        dead_ratio, soft_ratio = self.config['dead_ratio'], self.config['soft_ratio']
+        if bucket < dead_ratio:
+            return 'dead'
+        if bucket < dead_ratio + soft_ratio:
+            return 'soft'
+        return 'live'
+
+    def live_page(self) -> str:
+        """설정된 크기의 정상 블로그 글 페이지"""
+        repeat = max(1, self.config['payload'] // len(LIVE_FILLER.encode('utf-8')))
+        return (
+            '<!DOCTYPE html><html><head><meta charset="utf-8"><title>블로그 글</title></head>'
+            f'<body><div class="entry-content">{LIVE_FILLER * repeat}</div></body></html>'
+        )
+
+    def root_page(self, host: str) -> str:
+        """정상 블로그의 루트 페이지 (일부는 글 목록에 블로그 삭제 안내 문구 포함)"""
+        page = self.live_page()
+        if self.gone_phrase_root(host):
+            page = page.replace('<body>', f'<body><ul class="list_post"><li><a href="/1">{GONE_PHRASE_POST}</a></li></ul>', 1)
+        return page
+
+    def log_message(self, format, *args):
+        pass
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 동시 연결이 몰려도 SYN 재전송 지연이 측정에 섞이지 않도록 대기열을 넉넉히 둠
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 keep-alive 연결을 끊는 것은 정상 동작이므로 무시
+        pass
+
+def start_stand_in_server(config: Dict) -> ThreadingHTTPServer:
+    """대역 서버를 백그라운드 스레드로 시작"""
+    handler = type('ConfiguredStandInHandler', (StandInHandler,), {'config': config})
+    server = StandInServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def percentile(values: List[float], pct: float) -> float:
+    """정렬된 값 목록의 백분위수"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+def run_scenario(scenario: str, proxy_urls: List[str], keywords: List[str], args, output):
+    """별도 프로세스에서 시나리오 하나를 실행하고 측정값을 output 큐에 넣음"""
+    os.environ['HTTP_PROXY'] = os.environ['http_proxy'] = proxy_urls[0]
+    for name in ('NO_PROXY', 'no_proxy', 'HTTPS_PROXY', 'https_proxy', 'EGRESS_PROXIES'):
+        os.environ.pop(name, None)
+    if args.proxies:
+        # 대역 서버 여러 개를 출구 프록시 풀로 사용
+        os.environ['EGRESS_PROXIES'] = ','.join(proxy_urls)
+        os.environ['EGRESS_PROXY_RATE'] = str(args.proxy_rate)
+    workdir = tempfile.mkdtemp(prefix='finddomain-bench-')
+    os.environ['JOB_STORE_PATH'] = os.path.join(workdir, 'jobs.db')
+    os.environ['VERDICT_CACHE_PATH'] = os.path.join(workdir, 'verdict_cache.db')
+    os.environ['DRIVER_POOL_PREWARM'] = '0'
+    logging.disable(logging.WARNING)
+
+    import main
+    from rate_limiter import HostRateLimiter
+
+    latencies = []
+    verdicts = {}  # URL -> 낙장 여부 (대역 서버의 기대값과 비교)
+
+    class TimedPageChecker(main.PageChecker):
+        """URL별 검사 시간을 기록하는 체커"""
+        search_url = STAND_IN_SEARCH_URL
+
+        def check_urls(self, urls, on_result=None, **kwargs):
+            def timed(url, is_error, elapsed, reason):
+                latencies.append(elapsed)
+                verdicts[url] = is_error
+                if on_result:
+                    on_result(url, is_error, elapsed, reason)
+            return super().check_urls(urls, on_result=timed, **kwargs)
+
+    if args.rate_limit:
+        rate_limiter = HostRateLimiter()
+    else:
+        # 코드 자체의 처리량을 재기 위해 속도 제한을 사실상 해제
+        rate_limiter = HostRateLimiter(initial_rate=10000, max_rate=10000, host_rates={})
+
+    cpu_before = time.process_time()
+    started = time.perf_counter()
+    if scenario == 'cli':
+        checker = TimedPageChecker(rate_limiter=rate_limiter)
+        results = checker.process_keywords(keywords).to_dict()
+        checker.close()
+    else:
+        import app
+        app.PageChecker = TimedPageChecker
+        app.rate_limiter = rate_limiter
+        task_id = 'benchmark'
+        app.tasks[task_id] = app.SearchTask()
+        app.job_store.create_job(task_id, keywords)
+        app.background_task(task_id, keywords)
+        results = app.tasks[task_id].results_dict()
+    wall = time.perf_counter() - started
+    cpu_seconds = time.process_time() - cpu_before
+
+    latencies.sort()
+    truth = StandInHandler.__new__(type('TruthStandInHandler', (StandInHandler,), {'config': stand_in_config(args)}))
+    wrong = sum(1 for url, is_error in verdicts.items() if is_error != truth.expected_dead(url))
+    output.put({
+        'scenario': scenario,
+        'keywords': len(keywords),
+        'urls': len(latencies),
+        'error_pages': results.get('error_pages', 0),
+        'wrong_verdicts': wrong,
+        'wall_seconds': round(wall, 3),
+        'urls_per_second': round(len(latencies) / wall, 2) if wall else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 1) if latencies else 0.0,
+        'cpu_seconds': round(cpu_seconds, 3),
+        'peak_rss_mb': peak_rss_mb()
+    })
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss 단위는 리눅스에서 KB, macOS에서 바이트
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    if os.name == 'nt':
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            get_memory_info = ctypes.WinDLL('psapi').GetProcessMemoryInfo
+            get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+            process = ctypes.WinDLL('kernel32').GetCurrentProcess()
+            if get_memory_info(process, ctypes.byref(counters), counters.cb):
+                return round(counters.PeakWorkingSetSize / (1024 * 1024), 1)
+        except (AttributeError, OSError):
+            pass
+    return None
+
+def stand_in_config(args) -> Dict:
+    """명령행 인자로 대역 서버 설정 생성"""
+    return {
+        'latency': args.latency / 1000,
+        'blogs': args.blogs,
+        'posts': args.posts,
+        'dead_ratio': args.dead_ratio,
+        'soft_ratio': args.soft_ratio,
+        'dead_blog_ratio': args.dead_blog_ratio,
+        'gone_phrase_ratio': args.gone_phrase_ratio,
+        'payload': args.payload * 1024
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 대역 서버를 이용한 낙장페이지 검사 벤치마크')
+    parser.add_argument('--scenario', choices=['cli', 'web', 'all'], default='all',
+                        help='cli: PageChecker.process_keywords, web: app.background_task')
+    parser.add_argument('--keywords', type=int, default=20, help='검색할 키워드 수')
+    parser.add_argument('--blogs', type=int, default=200, help='합성 티스토리 블로그 수')
+    parser.add_argument('--posts', type=int, default=50, help='블로그당 글 번호 범위')
+    parser.add_argument('--dead_ratio', type=float, default=0.2, help='404 페이지 비율')
+    parser.add_argument('--soft_ratio', type=float, default=0.1, help='소프트 404(에러 템플릿) 페이지 비율')
+    parser.add_argument('--dead_blog_ratio', type=float, default=0.05, help='블로그 전체가 삭제된 블로그 비율')
+    parser.add_argument('--gone_phrase_ratio', type=float, default=0.1,
+                        help='루트 페이지 글 목록에 블로그 삭제 안내 문구가 들어간 정상 블로그 비율')
+    parser.add_argument('--latency', type=float, default=50, help='응답마다 추가할 지연 (ms)')
+    parser.add_argument('--payload', type=int, default=300, help='정상 페이지 크기 (KB)')
+    parser.add_argument('--rate_limit', action='store_true', help='기본 호스트별 속도 제한을 그대로 적용')
+    parser.add_argument('--proxies', type=int, default=0,
+                        help='출구 프록시 풀로 사용할 대역 서버 수 (0이면 프록시 풀 없이 대역 서버 하나 사용)')
+    parser.add_argument('--proxy_rate', type=float, default=20.0, help='출구 프록시당 초당 요청 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    config = stand_in_config(args)
+    servers = [start_stand_in_server(config) for _ in range(max(1, args.proxies))]
+    proxy_urls = [f"http://{server.server_address[0]}:{server.server_address[1]}" for server in servers]
+    keywords = [f"벤치마크 키워드 {index}" for index in range(args.keywords)]
+    scenarios = ['cli', 'web'] if args.scenario == 'all' else [args.scenario]
+
+    reports = []
+    for scenario in scenarios:
+        # 시나리오마다 새 프로세스에서 실행하여 CPU/메모리 측정이 섞이지 않게 함
+        output = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=run_scenario,
+            args=(scenario, proxy_urls, keywords, args, output)
+        )
+        process.start()
+        reports.append(output.get())
+        process.join()
+    for server in servers:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+        return
+
+    print("\n=== 벤치마크 결과 ===")
+    print(f"{'시나리오':<8} {'URL':>6} {'URL/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'CPU s':>8} {'RSS MB':>8} {'소요 s':>8} {'오판':>6}")
+    for report in reports:
+        rss = report['peak_rss_mb'] if report['peak_rss_mb'] is not None else '-'
+        print(
+            f"{report['scenario']:<10} {report['urls']:>6} {report['urls_per_second']:>9} "
+            f"{report['p50_ms']:>9} {report['p99_ms']:>9} {report['cpu_seconds']:>8} "
+            f"{rss:>8} {report['wall_seconds']:>8} {report['wrong_verdicts']:>6}"
+        )
+
+if __name__ == "__main__":
+    main()
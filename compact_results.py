@@ -0,0 +1,153 @@
+import os
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from verdict_cache import normalize_url
+
+# 메모리에 보관할 최대 낙장 URL 수 (넘으면 나머지는 임시 파일에 기록)
+DEFAULT_SPILL_THRESHOLD = 10000
+
+class CompactResults:
+    """메모리 사용량이 제한된 검사 결과 저장소
+
+    도메인 이름은 한 번만 저장하고 번호로 참조하며, 도메인별 검사/낙장 수는
+    array에 보관한다. 낙장 URL이 spill_threshold개를 넘으면 이후 URL은 임시
+    파일에 기록한다. 결과가 바뀔 때마다 version이 1씩 증가하므로, 클라이언트는
+    마지막으로 받은 version 이후의 변경분만 받아 갈 수 있다.
+    """
+    def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD, spill_dir: str = None):
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self.total_sites = 0
+        self.error_pages = 0
+        self.version = 0
+        self._lock = threading.Lock()
+        self._domain_ids = {}  # 도메인 -> 번호
+        self._domains = []  # 번호 -> 도메인
+        self._totals = array('I')
+        self._errors = array('I')
+        self._domain_versions = array('Q')  # 도메인 통계가 마지막으로 바뀐 version
+        self._error_urls = []  # 메모리에 보관하는 앞쪽 낙장 URL
+        self._error_versions = array('Q')  # 낙장 URL별 추가된 version
+        self._spill = None  # 임시 파일 (바이너리 추가 모드)
+        self._spill_offsets = array('Q')  # 임시 파일에 기록한 URL별 시작 위치
+
+    def _domain_id(self, domain: str) -> int:
+        domain_id = self._domain_ids.get(domain)
+        if domain_id is None:
+            domain_id = len(self._domains)
+            self._domain_ids[domain] = domain_id
+            self._domains.append(domain)
+            self._totals.append(0)
+            self._errors.append(0)
+            self._domain_versions.append(0)
+        return domain_id
+
+    def _append_error_url(self, url: str):
+        self._error_versions.append(self.version)
+        if len(self._error_urls) < self.spill_threshold:
+            self._error_urls.append(url)
+            return
+        if self._spill is None:
+            self._spill = tempfile.NamedTemporaryFile(
+                prefix='finddomain-results-', suffix='.txt', dir=self.spill_dir, delete=False
+            )
+        self._spill.seek(0, os.SEEK_END)
+        self._spill_offsets.append(self._spill.tell())
+        self._spill.write(url.encode('utf-8') + b'\n')
+
+    def _record(self, domain: str, total: int, errors: int):
+        domain_id = self._domain_id(domain)
+        self._totals[domain_id] += total
+        self._errors[domain_id] += errors
+        self._domain_versions[domain_id] = self.version
+
+    def add(self, url: str, is_error: bool):
+        """URL 판정 하나 추가"""
+        with self._lock:
+            self.version += 1
+            self.total_sites += 1
+            self._record(urlparse(url).netloc, 1, int(is_error))
+            if is_error:
+                self.error_pages += 1
+                self._append_error_url(url)
+
+    def add_verdicts(self, seen: set, verdicts: List[tuple]) -> List[tuple]:
+        """(url, 낙장 여부) 목록을 순서대로 추가하고 새로 추가한 항목 반환 (seen에 있는 URL은 건너뜀)"""
+        added = []
+        for url, is_error in verdicts:
+            key = normalize_url(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            self.add(url, is_error)
+            added.append((url, is_error))
+        return added
+
+    def merge(self, batch: Dict):
+        """check_urls가 반환한 배치 결과 병합"""
+        with self._lock:
+            self.version += 1
+            self.total_sites += batch['total_sites']
+            self.error_pages += batch['error_pages']
+            for domain, stats in batch['domain_stats'].items():
+                self._record(domain, stats['total'], stats['errors'])
+            for url in batch['error_urls']:
+                self.version += 1
+                self._append_error_url(url)
+
+    def _error_urls_slice(self, start: int, stop: int) -> List[str]:
+        urls = self._error_urls[start:stop]
+        spill_start = max(start, len(self._error_urls)) - len(self._error_urls)
+        spill_stop = stop - len(self._error_urls)
+        if self._spill is None or spill_stop <= spill_start:
+            return urls
+        self._spill.flush()
+        with open(self._spill.name, 'rb') as f:
+            f.seek(self._spill_offsets[spill_start])
+            for _ in range(spill_stop - spill_start):
+                urls.append(f.readline().decode('utf-8').rstrip('\n'))
+        return urls
+
+    def changes(self, since: int = 0, limit: Optional[int] = None) -> Tuple[Dict, int, bool]:
+        """since 이후 변경분 (결과, 다음 요청에 쓸 version, 남은 변경분 여부)
+
+        낙장 URL은 since 이후 추가된 것만 최대 limit개, 도메인 통계는 since 이후
+        바뀐 도메인의 현재 값을 보낸다. limit이 1보다 작으면 1로 본다 (URL 없이
+        version만 앞으로 가서 낙장 URL을 건너뛰는 일이 없도록).
+        """
+        with self._lock:
+            start = bisect_right(self._error_versions, since)
+            stop = len(self._error_versions)
+            if limit is not None:
+                stop = min(stop, start + max(1, limit))
+            has_more = stop < len(self._error_versions)
+            next_version = self._error_versions[stop - 1] if has_more else self.version
+            domain_stats = {
+                domain: {'total': self._totals[domain_id], 'errors': self._errors[domain_id]}
+                for domain_id, domain in enumerate(self._domains)
+                if self._domain_versions[domain_id] > since
+            }
+            return {
+                'total_sites': self.total_sites,
+                'error_pages': self.error_pages,
+                'error_urls': self._error_urls_slice(start, stop),
+                'domain_stats': domain_stats
+            }, next_version, has_more
+
+    def to_dict(self) -> Dict:
+        """new_results()와 같은 형태의 전체 결과"""
+        results, _, _ = self.changes()
+        return results
+
+    def close(self):
+        """임시 파일 삭제"""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                os.remove(self._spill.name)
+                self._spill = None
@@ -0,0 +1,157 @@
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 확인한 드라이버 경로를 프로세스 간에 공유하는 파일
+DRIVER_CACHE_PATH = os.environ.get(
+    'CHROMEDRIVER_CACHE',
+    os.path.join(os.path.expanduser('~'), '.finddomain', 'chromedriver.json')
+)
+
+VERSION_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+
+_lock = threading.Lock()
+_resolved_path = None  # 이 프로세스에서 확인한 드라이버 경로
+
+def pinned_version() -> Optional[str]:
+    """CHROMEDRIVER_VERSION 환경 변수로 고정한 드라이버 버전"""
+    return os.environ.get('CHROMEDRIVER_VERSION') or None
+
+def get_chrome_version() -> str:
+    """현재 설치된 Chrome 브라우저 버전 확인"""
+    try:
+        import winreg
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+        version, _ = winreg.QueryValueEx(key, "version")
+        return version
+    except:
+        return "알 수 없음"
+
+def local_driver_paths() -> List[str]:
+    """직접 설치한 chromedriver 후보 경로 (운영체제별)"""
+    if os.name == 'nt':
+        return [
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver.exe"),
+            "chromedriver.exe",
+            os.path.join(os.getcwd(), "chromedriver.exe"),
+            r"C:\chromedriver.exe",
+            os.path.join(os.getenv('LOCALAPPDATA', ''), 'chromedriver.exe'),
+            os.path.join(os.getenv('PROGRAMFILES', ''), 'chromedriver.exe'),
+            os.path.join(os.getenv('PROGRAMFILES(X86)', ''), 'chromedriver.exe'),
+        ]
+    paths = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver"),
+        os.path.join(os.getcwd(), "chromedriver"),
+    ]
+    on_path = shutil.which('chromedriver')
+    if on_path:
+        paths.append(on_path)
+    return paths
+
+def _read_cache() -> Optional[str]:
+    """버전 고정 조건에 맞는 캐시된 드라이버 경로 (없으면 None)"""
+    try:
+        with open(DRIVER_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    path = cached.get('path')
+    if not path or not os.path.exists(path):
+        return None
+    pinned = pinned_version()
+    if pinned and cached.get('version') != pinned:
+        return None
+    return path
+
+def _write_cache(path: str):
+    match = VERSION_RE.search(path)
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_PATH), exist_ok=True)
+        with open(DRIVER_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({
+                'path': path,
+                'version': pinned_version() or (match.group(1) if match else None),
+                'resolved_at': time.time()
+            }, f)
+    except OSError as e:
+        logger.warning(f"드라이버 경로 캐시 저장 실패: {str(e)}")
+
+def _install_driver() -> str:
+    """webdriver_manager로 드라이버를 내려받거나 설치된 드라이버 확인"""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    # 환경 변수 설정
+    os.environ['WDM_SSL_VERIFY'] = '0'
+    os.environ['WDM_LOCAL'] = '1'
+    os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
+    os.environ['WDM_LOG'] = '0'
+
+    # 프록시 설정 임시 제거
+    original_http_proxy = os.environ.pop('HTTP_PROXY', None)
+    original_https_proxy = os.environ.pop('HTTPS_PROXY', None)
+    try:
+        driver_path = ChromeDriverManager(driver_version=pinned_version()).install()
+    finally:
+        # 프록시 설정 복원
+        if original_http_proxy:
+            os.environ['HTTP_PROXY'] = original_http_proxy
+        if original_https_proxy:
+            os.environ['HTTPS_PROXY'] = original_https_proxy
+
+    # 드라이버 경로가 존재하는지 확인
+    if not os.path.exists(driver_path):
+        raise Exception(f"설치된 드라이버를 찾을 수 없습니다: {driver_path}")
+    return driver_path
+
+def resolve_driver_path(refresh: bool = False) -> str:
+    """사용할 chromedriver 경로 (프로세스마다 한 번만 확인)
+
+    CHROMEDRIVER_PATH가 있으면 그대로 쓰고, 없으면 캐시 파일에 기록된 경로,
+    webdriver_manager 설치 경로, 직접 설치한 드라이버 순으로 찾는다.
+    CHROMEDRIVER_VERSION으로 버전을 고정하면 다른 버전의 캐시는 무시한다.
+    refresh가 참이면 기록된 경로를 무시하고 다시 확인한다.
+    """
+    global _resolved_path
+    with _lock:
+        if _resolved_path and not refresh:
+            return _resolved_path
+
+        explicit = os.environ.get('CHROMEDRIVER_PATH')
+        if explicit and os.path.exists(explicit):
+            _resolved_path = explicit
+            return explicit
+
+        if not refresh:
+            cached = _read_cache()
+            if cached:
+                logger.info(f"캐시된 ChromeDriver 사용: {cached}")
+                _resolved_path = cached
+                return cached
+
+        try:
+            driver_path = _install_driver()
+            logger.info(f"ChromeDriver 자동 설치 성공: {driver_path}")
+        except Exception as e:
+            logger.warning(f"자동 설치 실패, 로컬 드라이버 시도: {str(e)}")
+            driver_path = next((path for path in local_driver_paths() if os.path.exists(path)), None)
+            if driver_path is None:
+                # 모든 시도 실패
+                chrome_version = get_chrome_version()
+                raise Exception(
+                    f"크롬 드라이버를 찾을 수 없습니다.\n"
+                    f"현재 Chrome 버전: {chrome_version}\n"
+                    f"1. https://chromedriver.chromium.org/downloads 에서 Chrome {chrome_version}에 맞는 버전 다운로드\n"
+                    f"2. chromedriver 실행 파일을 프로그램 폴더에 복사하거나 CHROMEDRIVER_PATH로 지정해주세요."
+                )
+            logger.info(f"로컬 ChromeDriver 사용: {driver_path}")
+
+        _write_cache(driver_path)
+        _resolved_path = driver_path
+        return driver_path
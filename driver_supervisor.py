@@ -0,0 +1,212 @@
+import os
+import signal
+import subprocess
+import threading
+import logging
+from typing import Dict, List, Optional
+
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# /proc 파일 시스템으로 프로세스를 직접 확인할 수 있는지 여부 (리눅스)
+HAS_PROCFS = os.path.isdir('/proc')
+
+def process_stat(pid: int) -> List[str]:
+    """/proc/<pid>/stat의 세 번째 필드(상태)부터의 값 목록 (없으면 빈 목록)"""
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            stat = f.read()
+    except OSError:
+        return []
+    # 프로세스 이름에 공백이나 괄호가 있을 수 있으므로 마지막 ')' 뒤부터 해석
+    return stat.rsplit(')', 1)[1].split()
+
+def process_state(pid: int) -> str:
+    """프로세스 상태 문자 (R, S, Z 등, 없으면 빈 문자열)"""
+    fields = process_stat(pid)
+    return fields[0] if fields else ''
+
+def process_start_time(pid: int) -> Optional[int]:
+    """프로세스 시작 시각 (부팅 후 클록 틱, stat의 22번째 필드, 없으면 None)
+
+    PID는 재사용되므로 PID와 시작 시각이 모두 같아야 같은 프로세스이다.
+    """
+    fields = process_stat(pid)
+    return int(fields[19]) if len(fields) > 19 else None
+
+def process_alive(pid: int, start_time: int = None) -> bool:
+    """PID가 살아 있는지 확인 (좀비 프로세스는 종료된 것으로 봄)
+
+    start_time을 주면 PID가 다른 프로세스에 재사용된 경우도 종료된 것으로 본다.
+    """
+    fields = process_stat(pid)
+    if not fields or fields[0] in ('Z', 'X'):
+        return False
+    return start_time is None or int(fields[19]) == start_time
+
+def child_pids() -> Dict[int, List[int]]:
+    """부모 PID -> 자식 PID 목록"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+def descendant_pids(pid: int) -> List[int]:
+    """pid의 모든 하위 프로세스 PID (리눅스에서만 확인, 그 외에는 빈 목록)"""
+    if not HAS_PROCFS:
+        return []
+    children = child_pids()
+    result = []
+    stack = [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+def kill_pids(pids: List[int]) -> int:
+    """PID 목록을 강제 종료하고 종료 신호를 보낸 수 반환"""
+    killed = 0
+    for pid in pids:
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/f', '/t', '/pid', str(pid)],
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+            else:
+                os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except OSError:
+            pass
+    return killed
+
+class DriverSupervisor:
+    """ChromeDriver와 Chrome 프로세스를 PID로 추적하는 감시기
+
+    드라이버를 띄울 때 chromedriver와 그 아래 Chrome 프로세스의 PID를 시작 시각과
+    함께 기록해 두고, 세션 요청을 보내지 않고 Chrome 본체(chromedriver의 직계 자식)
+    프로세스로 드라이버 생존 여부를 판단한다. 드라이버를 종료한 뒤에도 남은
+    프로세스는 PID로 강제 종료하며, 그래도 남은 프로세스는 sweep()에서 다시
+    정리한다. 종료 전에는 시작 시각을 다시 비교하여 재사용된 PID의 다른 프로세스는
+    건드리지 않는다. /proc이 없는 환경에서는 세션 요청으로 생존 여부를 확인한다.
+    """
+    def __init__(self):
+        # id(driver) -> (chromedriver PID, Chrome 본체 {PID: 시작 시각}, 하위 프로세스 {PID: 시작 시각})
+        self._drivers = {}
+        self._leaked = {}  # 종료 후에도 남아 있는 PID -> 시작 시각
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def service_process(driver):
+        """드라이버의 chromedriver 프로세스 (알 수 없으면 None)"""
+        try:
+            return driver.service.process
+        except Exception:
+            return None
+
+    @staticmethod
+    def with_start_times(pids: List[int]) -> Dict[int, Optional[int]]:
+        """PID -> 시작 시각 (이미 종료된 PID는 제외, /proc이 없으면 시작 시각 None)"""
+        if not HAS_PROCFS:
+            return {pid: None for pid in pids}
+        started = {pid: process_start_time(pid) for pid in pids}
+        return {pid: start for pid, start in started.items() if start is not None}
+
+    def register(self, driver):
+        """새로 띄운 드라이버의 프로세스 PID와 시작 시각 기록"""
+        process = self.service_process(driver)
+        if process is None:
+            return
+        browsers = child_pids().get(process.pid, []) if HAS_PROCFS else []
+        with self._lock:
+            self._drivers[id(driver)] = (
+                process.pid,
+                self.with_start_times(browsers),
+                self.with_start_times(descendant_pids(process.pid))
+            )
+
+    def pids(self, driver) -> Dict[int, Optional[int]]:
+        """드라이버에 속한 모든 PID와 시작 시각 (기록 이후 생긴 하위 프로세스 포함)"""
+        with self._lock:
+            entry = self._drivers.get(id(driver))
+        if entry is None:
+            return {}
+        driver_pid, _, known = entry
+        pids = self.with_start_times([driver_pid])
+        pids.update(self.with_start_times(descendant_pids(driver_pid)))
+        # 이미 기록한 PID는 기록한 시작 시각을 유지 (그 사이 재사용되었으면 종료 대상에서 빠짐)
+        pids.update(known)
+        return pids
+
+    def alive(self, driver) -> bool:
+        """드라이버가 살아 있는지 확인"""
+        process = self.service_process(driver)
+        if process is not None and process.poll() is not None:
+            return False
+        with self._lock:
+            entry = self._drivers.get(id(driver))
+        if HAS_PROCFS and entry and entry[1]:
+            # Chrome 본체가 죽으면 chromedriver와 crashpad 등 보조 프로세스만 남으므로
+            # chromedriver의 직계 자식인 Chrome 본체가 살아 있는지 확인
+            return any(process_alive(pid, start) for pid, start in entry[1].items())
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def reap(self, driver, pids: Dict[int, Optional[int]] = None):
+        """종료한 드라이버의 남은 프로세스를 강제 종료하고 기록 삭제 (pids는 PID -> 시작 시각)"""
+        if pids is None:
+            pids = self.pids(driver)
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+        process = self.service_process(driver)
+        if HAS_PROCFS:
+            pids = {pid: start for pid, start in pids.items() if process_alive(pid, start)}
+        elif process is not None and process.poll() is not None:
+            pids = {}
+        self._kill(pids)
+        if process is not None:
+            # 종료된 chromedriver가 좀비로 남지 않도록 회수
+            try:
+                process.wait(timeout=1)
+            except Exception:
+                pass
+
+    def sweep(self):
+        """이전에 정리하지 못한 프로세스 다시 종료"""
+        with self._lock:
+            self._leaked = {pid: start for pid, start in self._leaked.items() if process_alive(pid, start)}
+            leaked = dict(self._leaked)
+        if leaked:
+            self._kill(leaked)
+
+    def _kill(self, pids: Dict[int, Optional[int]]):
+        if not pids:
+            return
+        if HAS_PROCFS:
+            # 확인한 뒤 종료하기 직전에 PID가 재사용되지 않았는지 한 번 더 확인
+            pids = {pid: start for pid, start in pids.items() if process_alive(pid, start)}
+        killed = kill_pids(list(pids))
+        if killed:
+            metrics.inc('driver_processes_killed', killed)
+            logger.info(f"남은 드라이버 프로세스 {killed}개 강제 종료")
+        if not HAS_PROCFS:
+            return
+        with self._lock:
+            for pid in pids:
+                self._leaked.pop(pid, None)
+            self._leaked.update((pid, start) for pid, start in pids.items() if process_alive(pid, start))
+
+# 프로세스 전역 감시기
+driver_supervisor = DriverSupervisor()
@@ -0,0 +1,52 @@
+import threading
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class FingerprintCache:
+    """페이지 구조 지문별 판정 기록
+
+    같은 스킨이나 에러 템플릿으로 만든 페이지는 구조 지문이 같으므로, 지문이
+    min_observations번 이상 같은 판정을 받으면 이후에는 파싱 없이 그 판정을
+    사용한다. 판정이 엇갈린 지문은 구조만으로 구분할 수 없는 것으로 보고
+    다시는 사용하지 않는다. 최근에 사용한 max_entries개만 보관한다.
+    """
+    def __init__(self, max_entries: int = 10000, min_observations: int = 2):
+        self.max_entries = max_entries
+        self.min_observations = min_observations
+        self._entries = OrderedDict()  # 지문 -> [판정 (엇갈리면 None), 관측 수]
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str) -> Optional[bool]:
+        """신뢰할 수 있는 판정이 있으면 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            self._entries.move_to_end(fingerprint)
+            verdict, observations = entry
+            if observations < self.min_observations:
+                return None
+            return verdict
+
+    def record(self, fingerprint: str, is_error: bool) -> bool:
+        """분석한 페이지의 판정 기록 (처음 보는 에러 템플릿이면 True)"""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                self._entries[fingerprint] = [is_error, 1]
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                return is_error
+            self._entries.move_to_end(fingerprint)
+            if entry[0] is not None and entry[0] != is_error:
+                logger.info(f"구조 지문의 판정이 엇갈려 지문 사용 중지: {fingerprint}")
+                entry[0] = None
+            entry[1] += 1
+            return False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,150 @@
+import argparse
+import glob
+import logging
+import os
+import random
+import sys
+from typing import Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from fingerprint_cache import FingerprintCache
+from main import PageChecker
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+
+def baseline_is_error_page(html_content: str) -> bool:
+    """정규식 판정으로 바꾸기 전의 PageChecker.is_error_page (비교 기준, 로그만 제거)"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    error_patterns = [
+        {'tag': 'h2', 'class': 'tit_error'},
+        {'tag': 'strong', 'class': 'tit_error'},
+        {'tag': 'p', 'class': 'desc_error'},
+        {'tag': 'h2', 'id': 'kakaoBody'},
+        {'tag': 'div', 'class': 'error-page'},
+        {'tag': 'div', 'class': 'errorPage'},
+        {'tag': 'div', 'class': '404'},
+        {'tag': 'div', 'class': 'error404'}
+    ]
+
+    error_texts = [
+        "존재하지 않는",
+        "찾을 수 없는",
+        "삭제된",
+        "없는 페이지",
+        "Error",
+        "에러",
+        "404",
+        "페이지를 찾을 수 없습니다"
+    ]
+
+    for pattern in error_patterns:
+        element = soup.find(pattern['tag'], class_=pattern.get('class', None))
+        if element:
+            element_text = element.get_text(strip=True).lower()
+            if any(text.lower() in element_text for text in error_texts):
+                return True
+
+    title_tag = soup.find('title')
+    if title_tag:
+        title_text = title_tag.get_text(strip=True).lower()
+        if any(text.lower() in title_text for text in error_texts):
+            return True
+
+    body_tag = soup.find('body')
+    if body_tag:
+        body_text = body_tag.get_text(strip=True).lower()
+        if len(body_text) < 500:
+            if any(text.lower() in body_text for text in error_texts):
+                return True
+
+    if len(html_content) < 1000:
+        if any(text.lower() in html_content.lower() for text in error_texts):
+            return True
+
+    return False
+
+def load_fixtures(directory: str = GOLDEN_DIR) -> Dict[str, str]:
+    """golden 디렉터리의 고정 페이지 (파일 이름 -> HTML)"""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+# 합성 페이지를 만들 때 섞는 조각 (에러 문구가 여러 위치에 들어가도록)
+ERROR_WORDS = ["존재하지 않는", "찾을 수 없는", "삭제된", "없는 페이지", "error", "ERROR", "에러", "404"]
+PLAIN_WORDS = ["정상", "공지", "카테고리", "여행 후기", "최근 글", "댓글"]
+ERROR_ELEMENTS = [
+    ('h2', 'class="tit_error"'), ('strong', 'class="tit_error"'), ('p', 'class="desc_error"'),
+    ('h2', 'id="kakaoBody"'), ('div', 'class="error-page"'), ('div', 'class="errorPage"'),
+    ('div', 'class="404"'), ('div', 'class="error404"'), ('h2', ''), ('div', 'class="article-view"')
+]
+FILLER = '정상적인 블로그 글 내용입니다. '
+
+def generate_page(rng: random.Random) -> str:
+    """에러 요소/제목/본문 길이/스크립트/주석을 무작위로 조합한 페이지"""
+    word = lambda: rng.choice(ERROR_WORDS if rng.random() < 0.25 else PLAIN_WORDS)
+    head = []
+    if rng.random() < 0.8:
+        head.append(f"<title>{rng.choice(['TISTORY', '블로그 글', word()])}</title>")
+    if rng.random() < 0.3:
+        head.append(f'<script>var message = "{word()}";</script>')
+    if rng.random() < 0.2:
+        head.append(f'<style>.{word()} {{ color: red; }}</style>')
+    body = []
+    for _ in range(rng.randint(0, 3)):
+        tag, attrs = rng.choice(ERROR_ELEMENTS)
+        body.append(f"<{tag} {attrs}>{word()} 안내</{tag}>")
+    if rng.random() < 0.2:
+        body.append(f"<!-- {word()} -->")
+    if rng.random() < 0.2:
+        body.append(f'<a title="a>b {word()}" href="/x">링크</a>')
+    body.append('<p>' + FILLER * rng.choice([0, 2, 10, 30, 100]) + '</p>')
+    rng.shuffle(body)
+    page = f"<html><head>{''.join(head)}</head><body>{''.join(body)}</body></html>"
+    if rng.random() < 0.1:
+        page = page.replace('<body>', '').replace('</body>', '')
+    return page
+
+def compare(pages: List[Tuple[str, str]], shared_fingerprints: bool = False) -> List[Tuple[str, bool, str]]:
+    """기준 판정과 현재 판정이 다른 페이지 목록 (이름, 기준 판정, 현재 근거)
+
+    기본으로는 페이지마다 빈 지문 기록으로 검사하여 파싱 판정만 비교한다.
+    shared_fingerprints가 True이면 실제 실행처럼 모든 페이지가 지문 기록 하나를
+    공유하므로, 구조 지문으로 재사용한 판정도 기준과 같은지 확인할 수 있다.
+    """
+    checker = PageChecker(fingerprints=FingerprintCache())
+    mismatches = []
+    for name, html_content in pages:
+        if not shared_fingerprints:
+            checker.fingerprints = FingerprintCache()
+        expected = baseline_is_error_page(html_content)
+        reason = checker.error_page_reason(html_content)
+        if expected != (reason is not None):
+            mismatches.append((name, expected, reason))
+    return mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description='낙장페이지 판정을 기준 is_error_page와 비교')
+    parser.add_argument('--generated', type=int, default=20000, help='고정 페이지에 더해 검사할 합성 페이지 수')
+    parser.add_argument('--seed', type=int, default=0, help='합성 페이지 난수 시드')
+    parser.add_argument('--shared_fingerprints', action='store_true',
+                        help='모든 페이지가 구조 지문 기록 하나를 공유 (지문 재사용 판정까지 비교)')
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    fixtures = load_fixtures()
+    rng = random.Random(args.seed)
+    pages = list(fixtures.items())
+    pages += [(f"generated-{index}", generate_page(rng)) for index in range(args.generated)]
+
+    mismatches = compare(pages, args.shared_fingerprints)
+    for name, expected, reason in mismatches:
+        print(f"불일치: {name} 기준={expected} 현재={reason}")
+    print(f"고정 페이지 {len(fixtures)}개, 합성 페이지 {args.generated}개 중 불일치 {len(mismatches)}개")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import sqlite3
+import threading
+import queue
+import json
+import time
+import logging
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 재시작 시 이어서 실행할 작업 상태
+UNFINISHED_STATUSES = ('queued', 'running')
+
+class JobStore:
+    """검색 작업과 키워드/URL 단위 체크포인트를 저장하는 SQLite 저장소"""
+    def __init__(self, path: str = 'jobs.db'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                task_id TEXT PRIMARY KEY,
+                keywords TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress INTEGER NOT NULL DEFAULT 0,
+                results TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS keyword_checkpoints (
+                task_id TEXT NOT NULL,
+                keyword_idx INTEGER NOT NULL,
+                keyword TEXT NOT NULL,
+                PRIMARY KEY (task_id, keyword_idx)
+            );
+            CREATE TABLE IF NOT EXISTS url_checkpoints (
+                task_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                keyword_idx INTEGER NOT NULL,
+                is_error INTEGER NOT NULL,
+                PRIMARY KEY (task_id, url)
+            );
+        ''')
+        self._conn.commit()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor
+
+    def _query(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def create_job(self, task_id: str, keywords: List[str]):
+        """새 작업 등록"""
+        now = time.time()
+        self._execute(
+            'INSERT INTO jobs (task_id, keywords, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+            (task_id, json.dumps(keywords, ensure_ascii=False), 'queued', now, now)
+        )
+
+    def update_job(self, task_id: str, status: str = None, progress: int = None, results: Dict = None):
+        """작업 상태/진행률/결과 갱신"""
+        fields = ['updated_at = ?']
+        params = [time.time()]
+        if status is not None:
+            fields.append('status = ?')
+            params.append(status)
+        if progress is not None:
+            fields.append('progress = ?')
+            params.append(progress)
+        if results is not None:
+            fields.append('results = ?')
+            params.append(json.dumps(results, ensure_ascii=False))
+        params.append(task_id)
+        self._execute(f"UPDATE jobs SET {', '.join(fields)} WHERE task_id = ?", params)
+
+    def get_job(self, task_id: str) -> Optional[Dict]:
+        """저장된 작업 조회"""
+        rows = self._query(
+            'SELECT keywords, status, progress, results FROM jobs WHERE task_id = ?',
+            (task_id,)
+        )
+        if not rows:
+            return None
+        keywords, status, progress, results = rows[0]
+        return {
+            'task_id': task_id,
+            'keywords': json.loads(keywords),
+            'status': status,
+            'progress': progress,
+            'results': json.loads(results) if results else None
+        }
+
+    def unfinished_jobs(self) -> List[Dict]:
+        """재시작 시 이어서 실행해야 할 작업 목록 (등록 순)"""
+        rows = self._query(
+            f"SELECT task_id FROM jobs WHERE status IN ({', '.join('?' * len(UNFINISHED_STATUSES))}) "
+            'ORDER BY created_at',
+            UNFINISHED_STATUSES
+        )
+        return [self.get_job(task_id) for task_id, in rows]
+
+    def save_verdict(self, task_id: str, keyword_idx: int, url: str, is_error: bool):
+        """URL 판정 체크포인트 저장"""
+        self._execute(
+            'INSERT OR REPLACE INTO url_checkpoints VALUES (?, ?, ?, ?)',
+            (task_id, url, keyword_idx, int(is_error))
+        )
+
+    def complete_keyword(self, task_id: str, keyword_idx: int, keyword: str):
+        """키워드 처리 완료 체크포인트 저장"""
+        self._execute(
+            'INSERT OR REPLACE INTO keyword_checkpoints VALUES (?, ?, ?)',
+            (task_id, keyword_idx, keyword)
+        )
+
+    def completed_keywords(self, task_id: str) -> Set[int]:
+        """처리가 끝난 키워드 인덱스"""
+        rows = self._query(
+            'SELECT keyword_idx FROM keyword_checkpoints WHERE task_id = ?',
+            (task_id,)
+        )
+        return {keyword_idx for keyword_idx, in rows}
+
+    def verdicts(self, task_id: str) -> List[tuple]:
+        """저장된 (url, 낙장 여부) 목록 (키워드 순, 판정 순)"""
+        rows = self._query(
+            'SELECT url, is_error FROM url_checkpoints WHERE task_id = ? ORDER BY keyword_idx, rowid',
+            (task_id,)
+        )
+        return [(url, bool(is_error)) for url, is_error in rows]
+
+class JobScheduler:
+    """정해진 수의 작업 스레드로 대기열의 작업을 순서대로 실행"""
+    def __init__(self, handler, concurrency: int = 2, max_queue: int = 100):
+        self.handler = handler
+        self._queue = queue.Queue(maxsize=max_queue)
+        for index in range(concurrency):
+            thread = threading.Thread(target=self._run, name=f'job-worker-{index}', daemon=True)
+            thread.start()
+
+    def submit(self, *args, block: bool = False) -> bool:
+        """작업 등록 (대기열이 가득 차면 False)"""
+        try:
+            self._queue.put(args, block=block)
+            return True
+        except queue.Full:
+            return False
+
+    def pending(self) -> int:
+        """대기 중인 작업 수"""
+        return self._queue.qsize()
+
+    def _run(self):
+        while True:
+            args = self._queue.get()
+            try:
+                self.handler(*args)
+            except Exception as e:
+                logger.error(f"작업 실행 중 에러 발생: {str(e)}")
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,81 @@
+import re
+import unicodedata
+from urllib.parse import urlparse
+from typing import Dict, List, Optional
+
+from verdict_cache import normalize_url
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_keyword(keyword: str) -> str:
+    """검색 결과가 같은 키워드를 하나로 묶기 위한 정규화 (전각/반각, 대소문자, 공백)"""
+    keyword = unicodedata.normalize('NFKC', keyword)
+    return WHITESPACE_RE.sub(' ', keyword).strip().casefold()
+
+class KeywordIndex:
+    """한 번의 실행에서 모은 키워드-URL 역색인
+
+    정규화한 키워드별 검색 결과를 기억해 두었다가 표기만 다른 키워드는 다시
+    검색하지 않고, URL -> 키워드, 도메인 -> URL 색인으로 여러 키워드에 걸쳐
+    나온 URL과 도메인을 집계한다. aggregate가 False이면 검색 결과 재사용에 필요한
+    키워드 -> URL 목록만 기억하고 URL/도메인 색인은 만들지 않는다 (보고서와 집계가
+    필요 없는 웹 작업의 메모리 절약용).
+    """
+    def __init__(self, aggregate: bool = True):
+        self.aggregate = aggregate
+        self.keyword_urls = {}  # 정규화 키워드 -> 검색 결과 URL 목록 (검색 순서)
+        self.url_keywords = {}  # 정규화 URL -> 그 URL이 나온 키워드 목록
+        self.domain_urls = {}  # 도메인 -> 정규화 URL 목록
+        self.first_keyword = {}  # 정규화 키워드 -> 처음 검색한 원래 키워드
+        self.reused = 0  # 검색 결과를 재사용한 키워드 수
+
+    def lookup(self, keyword: str) -> Optional[List[str]]:
+        """이미 검색한 키워드면 그 검색 결과 URL 목록 반환 (없으면 None)"""
+        urls = self.keyword_urls.get(normalize_keyword(keyword))
+        if urls is not None:
+            self.reused += 1
+        return urls
+
+    def add(self, keyword: str, urls: List[str]):
+        """키워드의 검색 결과 등록"""
+        key = normalize_keyword(keyword)
+        if key in self.keyword_urls:
+            return
+        self.keyword_urls[key] = urls
+        if not self.aggregate:
+            return
+        self.first_keyword[key] = keyword
+        for url in urls:
+            url_key = normalize_url(url)
+            keywords = self.url_keywords.get(url_key)
+            if keywords is None:
+                self.url_keywords[url_key] = [keyword]
+                self.domain_urls.setdefault(urlparse(url).netloc, []).append(url_key)
+            else:
+                keywords.append(keyword)
+
+    def report(self, keyword: str, verdicts: List[tuple]) -> Dict:
+        """키워드별 보고서 (verdicts는 키워드 검색 결과의 (url, 낙장 여부) 목록)"""
+        key = normalize_keyword(keyword)
+        first = self.first_keyword.get(key, keyword)
+        shared = [
+            url for url, _ in verdicts
+            if len(self.url_keywords.get(normalize_url(url), ())) > 1
+        ]
+        return {
+            'keyword': keyword,
+            'same_as': first if first != keyword else None,
+            'urls': len(verdicts),
+            'dead': [url for url, is_error in verdicts if is_error],
+            'shared_urls': len(shared)
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """색인 요약 (고유 키워드/URL/도메인 수, 재사용한 검색 수)"""
+        return {
+            'keywords': len(self.keyword_urls),
+            'reused_searches': self.reused,
+            'urls': len(self.url_keywords),
+            'shared_urls': sum(1 for keywords in self.url_keywords.values() if len(keywords) > 1),
+            'domains': len(self.domain_urls)
+        }
@@ -1,22 +1,36 @@
 import argparse
+import sys
+import json
 import requests
-from bs4 import BeautifulSoup
 import time
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from collections import Counter, OrderedDict, deque
 import logging
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urljoin, urlencode
 import os
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 import random
-from time import sleep
 import urllib3
+from requests.adapters import HTTPAdapter
+import asyncio
+import hashlib
+import aiohttp
+import re
+import html
+from html.parser import HTMLParser
+import threading
+import queue
+import atexit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from verdict_cache import VerdictCache, CacheEntry, DEFAULT_TTLS, normalize_url
+from fingerprint_cache import FingerprintCache
+from driver_resolver import resolve_driver_path, get_chrome_version
+from driver_supervisor import driver_supervisor
+from compact_results import CompactResults
+from keyword_index import KeywordIndex, normalize_keyword
+from rate_limiter import HostRateLimiter
+from proxy_pool import ProxyPool, EgressProxy
+from rules import RuleSet, PlatformRules
+from metrics import metrics
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,8 +39,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def safe_driver_quit(driver):
-    """안전하게 ChromeDriver를 종료하는 함수"""
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# HTTP 1차 검사에서 바로 낙장으로 판정하는 상태 코드
+DEAD_STATUS_CODES = {404, 410}
+
+# 출구 프록시 자체의 실패로 보는 예외 (대상 호스트의 연결 실패/시간 초과는 제외)
+PROXY_ERRORS = (requests.exceptions.ProxyError, aiohttp.ClientProxyConnectionError, aiohttp.ClientHttpProxyError)
+# 체커가 지금까지 검사한 URL이 이만큼 이상 나온 블로그만 루트 페이지를 먼저 확인
+DOMAIN_PROBE_MIN_URLS = int(os.environ.get('DOMAIN_PROBE_MIN_URLS', 2))
+# 블로그별 URL 수와 루트 페이지 확인 결과를 기억할 최대 블로그 수 (오래 쓰지 않은 것부터 삭제)
+DOMAIN_MEMORY = int(os.environ.get('DOMAIN_MEMORY', 10000))
+
+NAVER_SEARCH_URL = 'https://search.naver.com/search.naver'
+
+# 모든 선택자의 링크를 한 번의 WebDriver 호출로 가져오는 스크립트
+# (요소별 get_attribute 호출과 같이 절대 URL(href 속성값)을 우선 사용)
+EXTRACT_LINKS_SCRIPT = """
+return arguments[0].flatMap(function (selector) {
+    return Array.from(document.querySelectorAll(selector), function (element) {
+        return element.href || element.getAttribute('href');
+    });
+});
+"""
+
+# 브라우저 페이지 로드 전략 (eager: DOM 구성까지만 대기, none: 대기 없음, normal: 모든 리소스 로드)
+PAGE_LOAD_STRATEGY = os.getenv('CHROME_PAGE_LOAD_STRATEGY', 'eager')
+PAGE_LOAD_TIMEOUT = 15  # 초
+
+# 낙장 판정에 필요 없는 리소스 (CDP Network.setBlockedURLs 패턴)
+BLOCKED_URL_PATTERNS = [
+    # 이미지/미디어/폰트
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.bmp', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.mp3', '*.m3u8',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # 광고
+    '*googlesyndication.com*', '*doubleclick.net*', '*adservice.google.*',
+    '*display.ad.daum.net*', '*t1.daumcdn.net/adfit*', '*criteo.*', '*taboola.com*',
+    # 분석/추적
+    '*google-analytics.com*', '*googletagmanager.com*', '*tiara.kakao.com*',
+    '*tiara.daum.net*', '*wcs.naver.net*', '*connect.facebook.net*', '*disqus.com*'
+]
+
+# 새 문서가 요청 전 문서(arguments[0]은 이전 performance.timeOrigin)를 대체하고
+# DOM 구성이 끝났는지 확인하는 스크립트
+READY_SCRIPT = """
+return performance.timeOrigin !== arguments[0]
+    && document.readyState !== 'loading'
+    && !!document.body;
+"""
+
+# 현재 문서의 performance.timeOrigin을 반환하고 새 주소로 이동만 시작하는 스크립트
+NAVIGATE_SCRIPT = """
+var origin = performance.timeOrigin;
+window.location.href = arguments[0];
+return origin;
+"""
+
+# 브라우저 검사에 동시에 사용할 탭 수
+BROWSER_TABS = 4
+
+# 닫는 태그가 없는 HTML 요소
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+
+# 검사 대상 플랫폼의 도메인/에러 판정 규칙 (TARGET_PLATFORMS, 기본 tistory)
+# 플랫폼별 에러 요소와 문구는 rules.py에 있다
+target_rules = RuleSet.from_env()
+
+# get_text()에 포함되지 않는 스크립트/스타일/주석
+NON_TEXT_RE = re.compile(r'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+# 태그 (태그 사이 텍스트 조각을 get_text(strip=True)처럼 공백 제거 후 붙임)
+MARKUP_RE = re.compile(r'<[a-zA-Z/!?][^>]*>')
+
+# 구조 지문용 태그 (닫는 태그 여부, 태그 이름, 속성)
+TAG_RE = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9-]*)([^>]*)>')
+# class/id 속성값
+NAME_ATTR_RE = re.compile(r'''\b(?:class|id)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.IGNORECASE)
+# class 속성값 (에러 요소 찾기용)
+CLASS_ATTR_RE = re.compile(r'''(?<![\w-])class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.IGNORECASE)
+DIGITS_RE = re.compile(r'\d+')
+TITLE_RE = re.compile(r'<title\b[^>]*>(.*?)</title', re.IGNORECASE | re.DOTALL)
+FIRST_H2_RE = re.compile(r'<h2\b[^>]*>(.*?)</h2', re.IGNORECASE | re.DOTALL)
+# 에러 템플릿 로그에 남길 class/id
+ERROR_HINT_RE = re.compile(r'err|absent|not_?found|404|empty', re.IGNORECASE)
+
+def new_results() -> Dict:
+    """빈 검사 결과 구조 생성"""
+    return {
+        'total_sites': 0,
+        'error_pages': 0,
+        'error_urls': [],
+        'domain_stats': {}  # 전체 도메인 통계
+    }
+
+def driver_session_alive(driver) -> bool:
+    """WebDriver 세션이 명령에 응답하는지 확인 (Chrome 프로세스는 살아 있어도 탭 충돌이나
+    세션 만료로 명령이 실패하는 경우를 감지)"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+def safe_driver_quit(driver, force_kill: bool = True):
+    """안전하게 ChromeDriver를 종료하는 함수
+
+    종료 후에도 남은 이 드라이버의 chromedriver/Chrome 프로세스는 PID로 강제 종료한다.
+    force_kill이 True이면 Windows에서 남은 chromedriver 프로세스를 모두 강제 종료한다.
+    풀에서 관리하는 다른 드라이버까지 종료되므로 풀에서는 False로 호출한다.
+    """
+    # 종료 전에 PID를 확보해 두어야 quit 이후 남은 프로세스를 찾을 수 있음
+    pids = driver_supervisor.pids(driver) if driver else {}
     try:
         if driver:
             try:
@@ -52,6 +178,10 @@ def safe_driver_quit(driver):
     except Exception as e:
         logger.error(f"드라이버 종료 중 에러 발생: {str(e)}")
     finally:
+        if driver:
+            driver_supervisor.reap(driver, pids)
+        if not force_kill or os.name != 'nt':
+            return
         try:
             # Windows에서 크롬 프로세스 강제 종료
             import subprocess
@@ -61,20 +191,336 @@ def safe_driver_quit(driver):
         except:
             pass
 
+class SerpLinkParser(HTMLParser):
+    """검색 결과 HTML을 한 번 훑으면서 rules.serp_selectors에 해당하는 링크 수집
+
+    선택자별로 링크를 따로 모아 두었다가 선택자 순서대로 이어 붙이므로
+    브라우저에서 선택자를 차례로 실행한 것과 같은 순서가 된다.
+    """
+    def __init__(self, base_url: str, rules: RuleSet = None):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.rules = rules or target_rules
+        self.has_main_pack = False
+        self._selectors = self.rules.serp_selector_specs
+        self._links = [[] for _ in self._selectors]
+        self._stack = []  # 열린 태그와 그 태그가 연 컨테이너 클래스 목록
+        self._open = {name: 0 for name in self.rules.serp_containers}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        href = attrs.get('href')
+        if attrs.get('id') == 'main_pack':
+            self.has_main_pack = True
+        
+        if href:
+            for position, selector in enumerate(self._selectors):
+                if selector.matches(tag, classes, href, self._open):
+                    self._links[position].append(href)
+        
+        if tag in VOID_ELEMENTS:
+            return
+        opened = [name for name in self._open if name in classes]
+        for name in opened:
+            self._open[name] += 1
+        self._stack.append((tag, opened))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # 가장 가까운 같은 이름의 태그까지 닫음 (생략된 닫는 태그 포함)
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                for _, opened in self._stack[index:]:
+                    for name in opened:
+                        self._open[name] -= 1
+                del self._stack[index:]
+                break
+
+    def links(self) -> List[str]:
+        """선택자 순서대로 절대 URL 목록 반환"""
+        return [urljoin(self.base_url, href) for links in self._links for href in links]
+
+class DriverPool:
+    """프로세스 전역에서 공유하는 ChromeDriver 풀
+
+    최대 size개의 드라이버만 생성하고, 미리 띄워 둔 드라이버를 작업에 빌려준다.
+    max_pages 페이지를 로드했거나 응답이 없는 드라이버는 폐기하고 새로 띄운다.
+    start_supervisor()로 감시 스레드를 띄우면 대기 중인 드라이버의 프로세스를
+    주기적으로 확인하여 죽은 드라이버를 대여 전에 교체한다.
+    proxy_pool을 주지 않으면 드라이버는 프로세스 전역 프록시 풀(EGRESS_PROXIES)을 사용한다.
+    """
+    def __init__(self, size: int = 2, max_pages: int = 200, proxy_pool: ProxyPool = None):
+        self.size = size
+        self.max_pages = max_pages
+        self.proxy_pool = proxy_pool
+        self._idle = queue.LifoQueue()  # 최근에 사용한 드라이버부터 대여
+        self._pages = {}  # id(driver) -> 로드한 페이지 수
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._supervisor = None
+
+    def prewarm(self, count: int = None):
+        """드라이버를 미리 생성하여 대기열에 추가"""
+        count = self.size if count is None else min(count, self.size)
+        while self._idle.qsize() < count:
+            if not self._reserve_slot():
+                break
+            try:
+                self._idle.put(self._create())
+            except Exception as e:
+                self._release_slot()
+                logger.error(f"드라이버 사전 생성 실패: {str(e)}")
+                break
+
+    def _reserve_slot(self) -> bool:
+        with self._lock:
+            if self._closed or self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _release_slot(self):
+        with self._lock:
+            self._created -= 1
+
+    def _create(self):
+        with metrics.span('driver_startup'):
+            driver = PageChecker.create_driver(self.proxy_pool)
+        self._pages[id(driver)] = 0
+        return driver
+
+    def _is_healthy(self, driver) -> bool:
+        # 프로세스 확인이 먼저이고, 프로세스가 살아 있으면 세션도 응답하는지 확인
+        return driver_supervisor.alive(driver) and driver_session_alive(driver)
+
+    def start_supervisor(self, interval: float = 5.0):
+        """대기 중인 드라이버를 주기적으로 확인하는 감시 스레드 시작"""
+        if self._supervisor is None:
+            self._supervisor = threading.Thread(target=self._supervise, args=(interval,), daemon=True)
+            self._supervisor.start()
+
+    def _supervise(self, interval: float):
+        while not self._closed:
+            time.sleep(interval)
+            try:
+                self.supervise_once()
+            except Exception as e:
+                logger.error(f"드라이버 감시 중 에러 발생: {str(e)}")
+
+    def supervise_once(self) -> int:
+        """대기 중인 드라이버 중 죽은 것을 교체하고 교체한 수 반환"""
+        idle = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        dead = 0
+        # 꺼낸 순서의 역순으로 되돌려 최근 사용 순서 유지
+        for driver in reversed(idle):
+            if self._is_healthy(driver):
+                self._idle.put(driver)
+            else:
+                dead += 1
+                self._discard(driver)
+        driver_supervisor.sweep()
+        if dead:
+            metrics.inc('driver_restarts', dead)
+            logger.warning(f"대기 중 죽은 드라이버 {dead}개 교체")
+            self.prewarm(self._idle.qsize() + dead)
+        return dead
+
+    def acquire(self, timeout: float = None):
+        """풀에서 정상 동작하는 드라이버 대여"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve_slot():
+                    try:
+                        return self._create()
+                    except Exception:
+                        self._release_slot()
+                        raise
+                if self._closed:
+                    raise RuntimeError("드라이버 풀이 종료되었습니다.")
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError("사용 가능한 드라이버가 없습니다.")
+                try:
+                    # 반납되거나 폐기되어 자리가 날 때까지 주기적으로 재확인
+                    driver = self._idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+            
+            if self._is_healthy(driver):
+                return driver
+            logger.warning("응답 없는 드라이버 폐기")
+            self._discard(driver)
+
+    def release(self, driver, broken: bool = False):
+        """드라이버 반납 (고장났거나 수명이 다한 드라이버는 폐기)"""
+        if driver is None:
+            return
+        if broken or self._closed or self._pages.get(id(driver), 0) >= self.max_pages:
+            self._discard(driver)
+            if not self._closed:
+                # 다음 대여가 지연되지 않도록 교체 드라이버를 미리 생성
+                threading.Thread(target=self.prewarm, args=(1,), daemon=True).start()
+            return
+        self._idle.put(driver)
+
+    def record_page(self, driver):
+        """드라이버가 로드한 페이지 수 기록"""
+        self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+
+    def _discard(self, driver):
+        self._pages.pop(id(driver), None)
+        safe_driver_quit(driver, force_kill=False)
+        self._release_slot()
+
+    def close(self):
+        """풀의 모든 드라이버 종료"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+# 프로세스 안의 체커들이 공유하는 구조 지문 기록
+shared_fingerprints = FingerprintCache()
+# 프로세스 안의 체커와 브라우저가 공유하는 출구 프록시 풀 (EGRESS_PROXIES가 없으면 None)
+egress_pool = ProxyPool.from_env()
+
 class PageChecker:
-    def __init__(self, search_delay: float = 2.0):
-        """낙장페이지 체커 초기화"""
+    # 검색 결과 페이지 주소 (벤치마크에서는 로컬 대역 서버 주소로 교체)
+    search_url = NAVER_SEARCH_URL
+
+    def __init__(self, search_delay: float = 2.0, driver_pool: DriverPool = None,
+                 cache: VerdictCache = None, rate_limiter: HostRateLimiter = None,
+                 browser_tabs: int = BROWSER_TABS, fingerprints: FingerprintCache = None,
+                 proxy_pool: ProxyPool = None, rules: RuleSet = None):
+        """낙장페이지 체커 초기화
+
+        드라이버는 브라우저 검사가 처음 필요할 때 띄운다.
+        driver_pool이 주어지면 드라이버를 새로 띄우지 않고 풀에서 빌려 쓴다.
+        cache가 주어지면 유효 기간 내의 URL은 다시 검사하지 않는다.
+        rate_limiter로 여러 체커가 호스트별 요청 예산을 공유할 수 있다.
+        browser_tabs는 여러 URL을 브라우저로 확인할 때 한 드라이버에서 동시에 여는 탭 수이다.
+        fingerprints를 주지 않으면 프로세스 안의 체커들이 구조 지문 기록을 공유한다.
+        proxy_pool을 주지 않으면 EGRESS_PROXIES로 만든 프로세스 전역 프록시 풀을 사용한다.
+        rules를 주지 않으면 TARGET_PLATFORMS로 만든 대상 플랫폼 규칙을 사용한다.
+        """
         self.search_delay = search_delay
-        self.session = requests.Session()
+        self.browser_tabs = browser_tabs
+        self.session = self.create_session()
         self.driver = None
-        self.setup_driver()
-        
+        self.driver_pool = driver_pool
+        self.cache = cache
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.fingerprints = fingerprints if fingerprints is not None else shared_fingerprints
+        self.proxy_pool = proxy_pool if proxy_pool is not None else egress_pool
+        self.rules = rules or target_rules
+        self.reasons = {}  # URL -> 판정 근거 (pop_reason으로 꺼내면 지워짐)
+        self.blog_urls = OrderedDict()  # 블로그 루트 -> 지금까지 검사한 URL 수 (최근 DOMAIN_MEMORY개)
+        self.dead_domains = OrderedDict()  # 루트 페이지를 확인한 블로그 -> 블로그 전체 낙장 여부 (최근 DOMAIN_MEMORY개)
+
+    def create_session(self, pool_size: int = 10) -> requests.Session:
+        """연결을 재사용하는 HTTP 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Language': 'ko-KR,ko;q=0.9'
+        })
+        return session
+
+    def egress_for(self, url: str) -> Optional[EgressProxy]:
+        """URL 요청에 사용할 출구 프록시 (프록시 풀이 없으면 None)"""
+        if self.proxy_pool is None:
+            return None
+        return self.proxy_pool.choose(urlparse(url).netloc)
+
+    @staticmethod
+    def request_proxies(proxy: Optional[EgressProxy]) -> Optional[Dict[str, str]]:
+        """requests에 넘길 프록시 설정 (프록시별 연결 풀은 세션 어댑터가 따로 유지)"""
+        if proxy is None:
+            return None
+        return {'http': proxy.url, 'https': proxy.url}
+
+    def wait_turn(self, url: str, proxy: Optional[EgressProxy]):
+        """프록시 예산과 (프록시별) 호스트 예산이 허용할 때까지 대기"""
+        if proxy is not None:
+            self.proxy_pool.acquire(proxy)
+        self.rate_limiter.acquire(url, egress=proxy.label if proxy else None)
+
+    async def wait_turn_async(self, url: str, proxy: Optional[EgressProxy]):
+        """wait_turn의 비동기 버전"""
+        if proxy is not None:
+            await self.proxy_pool.acquire_async(proxy)
+        await self.rate_limiter.acquire_async(url, egress=proxy.label if proxy else None)
+
+    def report_response(self, url: str, proxy: Optional[EgressProxy], status_code: int = None,
+                        throttled: bool = False, error: Exception = None):
+        """응답 결과로 호스트 요청 속도와 프록시 건강 점수 갱신 (error는 요청 실패 원인)
+
+        대상 블로그 하나의 429/503이나 시간 초과는 그 호스트의 문제이므로 호스트 요청
+        속도(HostRateLimiter)에만 반영한다. 프록시 점수는 프록시 자체의 실패(프록시 연결/
+        인증 실패)와 검색 결과 호스트의 요청 제한(429/503, 캡차)일 때만 깎는다.
+        """
+        if error is None:
+            self.rate_limiter.feedback(url, status_code, throttled=throttled,
+                                       egress=proxy.label if proxy else None)
+        if proxy is None:
+            return
+        proxy_failed = status_code == 407 or isinstance(error, PROXY_ERRORS)
+        serp_throttled = (urlparse(url).netloc == urlparse(self.search_url).netloc
+                          and (throttled or status_code in (429, 503)))
+        if proxy_failed or serp_throttled:
+            self.proxy_pool.report(proxy, failed=proxy_failed, throttled=serp_throttled)
+        elif error is None:
+            self.proxy_pool.report(proxy)
+
+    def attach_driver(self, driver):
+        """사용할 드라이버 지정"""
+        # selenium은 브라우저 검사가 필요할 때만 불러옴 (HTTP 검사만 하는 실행의 기동 시간 단축)
+        from selenium.webdriver.support.ui import WebDriverWait
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, 10)
+
     def setup_driver(self):
         """Selenium WebDriver 설정"""
+        with metrics.span('driver_startup'):
+            driver = self.create_driver(self.proxy_pool)
+        self.attach_driver(driver)
+
+    @staticmethod
+    def create_driver(proxy_pool: ProxyPool = None):
+        """새 ChromeDriver 생성 (출구 프록시 풀이 있으면 드라이버마다 프록시 하나를 배정)
+
+        proxy_pool을 주지 않으면 프로세스 전역 프록시 풀을 사용한다. Chrome은 프록시 URL의
+        인증 정보를 사용하지 못하므로 인증이 필요 없는 프록시만 배정하고, 그런 프록시가
+        없으면 프록시 없이 직접 연결한다 (인증 실패로 페이지가 열리지 않아 정상으로
+        잘못 판정되는 것을 막기 위함).
+        """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+
         try:
             # SSL 경고 무시 설정
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
+
             chrome_options = Options()
             chrome_options.add_argument('--headless')
             chrome_options.add_argument('--no-sandbox')
@@ -86,149 +532,205 @@ class PageChecker:
             chrome_options.add_argument('--silent')
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
             chrome_options.add_experimental_option('detach', False)  # 브라우저 분리 방지
-            
+
+            # 가벼운 렌더링 설정: DOM 구성까지만 기다리고 이미지/알림/자동 재생 비활성화
+            chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_argument('--autoplay-policy=user-gesture-required')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--mute-audio')
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2,
+                'profile.default_content_setting_values.geolocation': 2
+            })
+
             # User-Agent 설정
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            # 환경 변수 설정
-            os.environ['WDM_SSL_VERIFY'] = '0'
-            os.environ['WDM_LOCAL'] = '1'
-            os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
-            os.environ['WDM_LOG'] = '0'
-            
-            # 프록시 설정 임시 제거
-            original_http_proxy = os.environ.pop('HTTP_PROXY', None)
-            original_https_proxy = os.environ.pop('HTTPS_PROXY', None)
-            
+            chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+
+            proxy_pool = proxy_pool if proxy_pool is not None else egress_pool
+            if proxy_pool is not None:
+                proxy = proxy_pool.next(browser=True)
+                if proxy is None:
+                    logger.warning("인증이 필요 없는 출구 프록시가 없어 드라이버는 프록시 없이 직접 연결")
+                else:
+                    parts = urlparse(proxy.url)
+                    chrome_options.add_argument(f'--proxy-server={parts.scheme}://{proxy.label}')
+                    logger.info(f"드라이버 출구 프록시: {proxy.label}")
+
+            # 드라이버 경로는 프로세스마다 한 번만 확인 (캐시 파일 공유)
+            driver_path = resolve_driver_path()
             try:
-                # ChromeDriverManager 사용 (log_level 파라미터 제거)
-                driver_manager = ChromeDriverManager()
-                driver_path = driver_manager.install()
-                
-                # 드라이버 경로가 존재하는지 확인
-                if not os.path.exists(driver_path):
-                    raise Exception(f"설치된 드라이버를 찾을 수 없습니다: {driver_path}")
-                
-                service = Service(executable_path=driver_path)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                self.wait = WebDriverWait(self.driver, 10)
-                logger.info(f"ChromeDriver 자동 설치 성공: {driver_path}")
-                
+                driver = webdriver.Chrome(service=Service(executable_path=driver_path), options=chrome_options)
             except Exception as e:
-                logger.warning(f"자동 설치 실패, 로컬 드라이버 시도: {str(e)}")
-                
-                # 로컬 크롬 드라이버 찾기
-                driver_paths = [
-                    os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver.exe"),
-                    "chromedriver.exe",
-                    os.path.join(os.getcwd(), "chromedriver.exe"),
-                    r"C:\chromedriver.exe",
-                    os.path.join(os.getenv('LOCALAPPDATA', ''), 'chromedriver.exe'),
-                    os.path.join(os.getenv('PROGRAMFILES', ''), 'chromedriver.exe'),
-                    os.path.join(os.getenv('PROGRAMFILES(X86)', ''), 'chromedriver.exe'),
-                ]
-                
-                for path in driver_paths:
-                    if os.path.exists(path):
-                        try:
-                            service = Service(executable_path=path)
-                            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                            self.wait = WebDriverWait(self.driver, 10)
-                            logger.info(f"로컬 ChromeDriver 사용 성공: {path}")
-                            return
-                        except Exception as driver_error:
-                            logger.warning(f"드라이버 {path} 사용 실패: {str(driver_error)}")
-                            continue
-                
-                # 모든 시도 실패
-                chrome_version = self.get_chrome_version()
-                raise Exception(
-                    f"크롬 드라이버를 찾을 수 없습니다.\n"
-                    f"현재 Chrome 버전: {chrome_version}\n"
-                    f"1. https://chromedriver.chromium.org/downloads 에서 Chrome {chrome_version}에 맞는 버전 다운로드\n"
-                    f"2. chromedriver.exe를 프로그램 폴더에 복사해주세요."
-                )
-            
-            finally:
-                # 프록시 설정 복원
-                if original_http_proxy:
-                    os.environ['HTTP_PROXY'] = original_http_proxy
-                if original_https_proxy:
-                    os.environ['HTTPS_PROXY'] = original_https_proxy
-                
+                # 크롬 업데이트 등으로 기록된 드라이버가 맞지 않으면 한 번 다시 확인
+                logger.warning(f"드라이버 {driver_path} 사용 실패, 드라이버 다시 확인: {str(e)}")
+                driver_path = resolve_driver_path(refresh=True)
+                driver = webdriver.Chrome(service=Service(executable_path=driver_path), options=chrome_options)
+            driver_supervisor.register(driver)
+            return PageChecker.configure_driver(driver)
+
         except Exception as e:
             logger.error(f"드라이버 설정 실패: {str(e)}")
             raise
-        
-    def get_chrome_version(self):
-        """현재 설치된 Chrome 브라우저 버전 확인"""
+
+    @staticmethod
+    def configure_driver(driver):
+        """새 드라이버에 페이지 로드 제한 시간과 리소스 차단 적용"""
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        PageChecker.block_resources(driver)
+        return driver
+
+    @staticmethod
+    def block_resources(driver):
+        """현재 탭에서 불필요한 리소스 요청 차단 (CDP 설정은 탭마다 따로 적용됨)"""
         try:
-            import winreg
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
-            version, _ = winreg.QueryValueEx(key, "version")
-            return version
-        except:
-            return "알 수 없음"
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"리소스 차단 설정 실패: {str(e)}")
+
+    @staticmethod
+    def wait_until_ready(driver, previous_origin, timeout: float = 10):
+        """이전 문서가 새 문서로 바뀌고 DOM 구성이 끝날 때까지 대기"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda driver: driver.execute_script(READY_SCRIPT, previous_origin)
+        )
+
+    @staticmethod
+    def get_chrome_version():
+        """현재 설치된 Chrome 브라우저 버전 확인"""
+        return get_chrome_version()
         
-    def check_driver(self):
-        """드라이버 상태 확인 및 재시작"""
-        try:
-            # 드라이버 상태 확인
-            self.driver.current_url
-        except:
+    def check_driver(self, verify_session: bool = False):
+        """드라이버 상태 확인 및 재시작 (아직 없으면 새로 준비)
+
+        평소에는 세션 요청 없이 프로세스 상태로 판단하고, verify_session이 True이면
+        (드라이버 명령이 실패한 뒤) 세션이 응답하는지도 확인한다.
+        """
+        if self.driver is None:
+            if self.driver_pool:
+                self.attach_driver(self.driver_pool.acquire())
+            else:
+                self.setup_driver()
+            return
+        if not driver_supervisor.alive(self.driver) or (verify_session and not driver_session_alive(self.driver)):
             # 드라이버 재시작
-            safe_driver_quit(self.driver)
-            self.setup_driver()
+            metrics.inc('driver_restarts')
+            if self.driver_pool:
+                self.driver_pool.release(self.driver, broken=True)
+                self.attach_driver(self.driver_pool.acquire())
+            else:
+                safe_driver_quit(self.driver)
+                self.setup_driver()
+
+    def record_page(self):
+        """풀 드라이버의 페이지 로드 수 기록 (일정 수 이상이면 반납 시 교체)"""
+        if self.driver_pool and self.driver:
+            self.driver_pool.record_page(self.driver)
         
-    def search_naver(self, keyword: str, max_pages: int = 3) -> dict:
-        """네이버 검색 결과에서 URL 추출"""
-        self.check_driver()  # 드라이버 상태 확인
-        urls = []
-        domain_stats = {}  # 도메인별 통계
+    def serp_url(self, keyword: str, page: int) -> str:
+        """검색 결과 페이지 URL"""
+        start = (page - 1) * 10 + 1
+        return f"{self.search_url}?{urlencode({'where': 'web', 'query': keyword, 'start': start})}"
+
+    def fetch_serp_links(self, keyword: str, page: int) -> Optional[List[str]]:
+        """HTTP 요청으로 검색 결과 페이지의 링크 추출 (실패 시 None)"""
+        search_url = self.serp_url(keyword, page)
+        proxy = self.egress_for(search_url)
+        self.wait_turn(search_url, proxy)
+        try:
+            with metrics.span('serp_fetch'):
+                response = self.session.get(search_url, timeout=10, proxies=self.request_proxies(proxy))
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout):
+                metrics.inc('timeouts', domain=urlparse(search_url).netloc)
+            self.report_response(search_url, proxy, error=e)
+            logger.info(f"검색 페이지 {page} HTTP 요청 실패, 브라우저로 재시도: {str(e)}")
+            return None
+        if response.status_code != 200:
+            self.report_response(search_url, proxy, response.status_code)
+            logger.info(f"검색 페이지 {page} 응답 코드 {response.status_code}, 브라우저로 재시도")
+            return None
         
-        for page in range(1, max_pages + 1):
-            try:
-                start = (page - 1) * 10 + 1
-                search_url = f"https://search.naver.com/search.naver?where=web&query={keyword}&start={start}"
-                
+        parser = SerpLinkParser(response.url, self.rules)
+        parser.feed(response.text)
+        parser.close()
+        if not parser.has_main_pack:
+            # 캡차 또는 스크립트 렌더링 페이지
+            self.report_response(search_url, proxy, throttled='captcha' in response.text.lower())
+            logger.info(f"검색 페이지 {page}에 검색 결과 영역이 없어 브라우저로 재시도")
+            return None
+        self.report_response(search_url, proxy, response.status_code)
+        return parser.links()
+
+    def search_naver_browser(self, keyword: str, page: int) -> Optional[List[str]]:
+        """브라우저로 검색 결과 페이지의 링크 추출 (실패 시 None)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        self.check_driver()  # 드라이버 상태 확인
+        search_url = self.serp_url(keyword, page)
+        try:
+            self.rate_limiter.acquire(search_url)
+            with metrics.span('serp_render'):
                 self.driver.get(search_url)
+                self.record_page()
                 # 페이지 로딩 대기
                 self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '#main_pack')))
-                
-                # 랜덤 스크롤 (봇 감지 회피)
-                self.random_scroll()
-                
-                # 여러 선택자로 링크 추출 시도
-                selectors = [
-                    'a.link_tit',
-                    '.total_area a[href*="tistory.com"]',
-                    '.sh_blog_title',
-                    '.total_wrap a[href*="tistory.com"]'
-                ]
-                
-                for selector in selectors:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        url = element.get_attribute('href')
-                        if url and self.is_tistory_domain(url) and url not in urls:
-                            urls.append(url)
-                            # 도메인 통계 업데이트
-                            domain = urlparse(url).netloc
-                            domain_stats[domain] = domain_stats.get(domain, 0) + 1
-                
-                logger.info(f"페이지 {page}: {len(urls)}개의 티스토리 URL 발견")
-                sleep(random.uniform(2, 4))  # 랜덤 대기
-                
-            except TimeoutException:
-                logger.warning(f"페이지 {page} 로딩 시간 초과")
-                break
-            except Exception as e:
-                logger.error(f"검색 중 에러 발생: {str(e)}")
-                break
+            self.rate_limiter.feedback(search_url)
+            
+            # 랜덤 스크롤 (봇 감지 회피)
+            self.random_scroll()
+            
+            # 여러 선택자로 링크 추출 시도
+            links = self.driver.execute_script(EXTRACT_LINKS_SCRIPT, self.rules.serp_selectors) or []
+            return links
+            
+        except TimeoutException:
+            metrics.inc('timeouts', domain=urlparse(search_url).netloc)
+            # 검색 결과 영역이 나타나지 않으면 캡차/차단으로 보고 속도를 줄임
+            self.rate_limiter.feedback(search_url, throttled=True)
+            logger.warning(f"페이지 {page} 로딩 시간 초과")
+            return None
+        except Exception as e:
+            logger.error(f"검색 중 에러 발생: {str(e)}")
+            return None
+
+    def search_naver(self, keyword: str, max_pages: int = 3) -> dict:
+        """네이버 검색 결과에서 URL 추출
+
+        검색 결과 페이지들을 HTTP로 동시에 가져오고, 가져오지 못한 페이지만
+        브라우저로 렌더링한다.
+        """
+        urls = {}  # 발견 순서를 유지하는 URL 집합
+        domain_stats = Counter()  # 도메인별 통계
+        
+        with ThreadPoolExecutor(max_workers=max_pages) as executor:
+            pages = list(executor.map(
+                lambda page: self.fetch_serp_links(keyword, page),
+                range(1, max_pages + 1)
+            ))
+        
+        for page, links in enumerate(pages, start=1):
+            if links is None:
+                links = self.search_naver_browser(keyword, page)
+                if links is None:
+                    break
+            
+            for url in links:
+                if not url or url in urls or not self.is_target_url(url):
+                    continue
+                urls[url] = None
+                # 도메인 통계 업데이트
+                domain_stats[urlparse(url).netloc] += 1
+            
+            logger.info(f"페이지 {page}: {len(urls)}개의 대상 URL 발견")
         
         return {
-            'urls': urls,
-            'domain_stats': domain_stats
+            'urls': list(urls),
+            'domain_stats': dict(domain_stats)
         }
     
     def random_scroll(self):
@@ -238,149 +740,711 @@ class PageChecker:
             for i in range(3):  # 3번 정도 스크롤
                 scroll_height = random.randint(100, total_height)
                 self.driver.execute_script(f"window.scrollTo(0, {scroll_height});")
-                sleep(random.uniform(0.5, 1.5))
         except Exception as e:
             logger.warning(f"스크롤 중 에러 발생: {str(e)}")
     
+    def classify_response(self, status_code: int, content_type: str, html_content: str,
+                          url: str = None) -> Tuple[Optional[bool], Optional[str]]:
+        """HTTP 응답으로 (낙장 여부, 판정 근거) 판정 (판정 불가 시 낙장 여부는 None)"""
+        if status_code in DEAD_STATUS_CODES:
+            return True, f'http_{status_code}'
+        if status_code != 200 or 'html' not in content_type.lower():
+            # 403/429/5xx, 리다이렉트 루프, 비 HTML 응답은 브라우저로 재확인
+            return None, None
+        reason = self.error_page_reason(html_content, url)
+        return reason is not None, reason
+
+    def conditional_headers(self, cached: Optional[CacheEntry]) -> Dict[str, str]:
+        """만료된 캐시 항목 재검증용 조건부 요청 헤더"""
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        return headers
+
+    def store_verdict(self, url: str, verdict: Optional[bool], status_code: int = None, headers=None,
+                      reason: str = None):
+        """판정 근거를 기록하고 판정 결과를 캐시에 저장 (판정 불가는 저장하지 않음)"""
+        if verdict is None:
+            return
+        self.reasons[url] = reason
+        if self.cache is None:
+            return
+        headers = headers or {}
+        self.cache.put(
+            url,
+            verdict,
+            status_code=status_code,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified')
+        )
+
+    def probe_http(self, url: str, timeout: float = 10.0,
+                   cached: Optional[CacheEntry] = None) -> Optional[bool]:
+        """HTTP 요청으로 낙장 여부 1차 판정 (판정 불가 시 None)"""
+        proxy = self.egress_for(url)
+        self.wait_turn(url, proxy)
+        try:
+            with metrics.span('http_fetch'):
+                response = self.session.get(
+                    url,
+                    timeout=timeout,
+                    allow_redirects=True,
+                    headers=self.conditional_headers(cached),
+                    proxies=self.request_proxies(proxy)
+                )
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout):
+                metrics.inc('timeouts', domain=urlparse(url).netloc)
+            self.report_response(url, proxy, error=e)
+            logger.info(f"HTTP 검사 실패, 브라우저로 재확인: {url} - {str(e)}")
+            return None
+        self.report_response(url, proxy, response.status_code)
+        if response.status_code == 304 and cached:
+            # 변경되지 않은 페이지는 이전 판정 유지
+            self.cache.touch(url)
+            self.reasons[url] = 'cache'
+            return cached.is_error
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset' not in content_type.lower():
+            # charset 누락 시 requests 기본값(ISO-8859-1) 대신 UTF-8로 디코딩
+            response.encoding = 'utf-8'
+        verdict, reason = self.classify_response(
+            response.status_code,
+            content_type,
+            response.text,
+            url
+        )
+        self.store_verdict(url, verdict, response.status_code, response.headers, reason)
+        return verdict
+
+    def lookup_cache(self, url: str) -> Optional[CacheEntry]:
+        """캐시 항목 조회 (캐시 미사용 시 None)"""
+        return self.cache.get(url) if self.cache else None
+
     def check_url(self, url: str) -> bool:
         """URL을 방문하여 낙장페이지 여부 확인"""
-        self.check_driver()  # 드라이버 상태 확인
+        # 0. 유효 기간 내의 캐시된 판정 사용
+        cached = self.lookup_cache(url)
+        if cached and cached.fresh:
+            metrics.inc('cache_hits')
+            self.reasons[url] = 'cache'
+            verdict = cached.is_error
+        else:
+            # 1. HTTP 요청으로 먼저 판정 (만료된 캐시는 조건부 요청으로 재검증)
+            verdict = self.probe_http(url, cached=cached)
+            if verdict is None:
+                # 2. 판정이 불가능한 경우에만 브라우저로 확인
+                verdict = self.check_url_browser(url)
+        self.count_verdict(url, verdict)
+        self.reasons.pop(url, None)
+        return verdict
+
+    def pop_reason(self, url: str) -> Optional[str]:
+        """URL의 판정 근거를 꺼냄 (한 번 꺼내면 지워짐)"""
+        return self.reasons.pop(url, None)
+
+    def count_verdict(self, url: str, is_error: bool):
+        """도메인별 검사/낙장 수 기록"""
+        domain = urlparse(url).netloc
+        metrics.inc('urls_checked', domain=domain)
+        if is_error:
+            metrics.inc('urls_dead', domain=domain)
+
+    async def probe_http_async(self, session: aiohttp.ClientSession, url: str,
+                               cached: Optional[CacheEntry] = None) -> Optional[bool]:
+        """비동기 HTTP 요청으로 낙장 여부 1차 판정 (판정 불가 시 None)"""
+        proxy = self.egress_for(url)
+        await self.wait_turn_async(url, proxy)
+        started = time.perf_counter()
         try:
-            self.driver.get(url)
-            # 페이지 로딩 대기
-            sleep(random.uniform(1, 2))
-            
-            # JavaScript 실행 후 HTML 가져오기
-            html_content = self.driver.page_source
-            
-            # HTTP 상태 확인 (JavaScript 변수나 메타 태그 확인)
-            if "404" in self.driver.title or "찾을 수 없는" in self.driver.title:
-                return True
-                
-            return self.is_error_page(html_content)
-            
-        except Exception as e:
-            logger.warning(f"URL 체크 중 에러 발생: {url} - {str(e)}")
+            async with session.get(url, allow_redirects=True,
+                                   headers=self.conditional_headers(cached),
+                                   proxy=proxy.url if proxy else None) as response:
+                self.report_response(url, proxy, response.status)
+                if response.status == 304 and cached:
+                    # 변경되지 않은 페이지는 이전 판정 유지
+                    self.cache.touch(url)
+                    self.reasons[url] = 'cache'
+                    return cached.is_error
+                content_type = response.headers.get('Content-Type', '')
+                html_content = ''
+                if response.status == 200:
+                    encoding = None if 'charset' in content_type.lower() else 'utf-8'
+                    html_content = await response.text(encoding=encoding, errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if isinstance(e, asyncio.TimeoutError):
+                metrics.inc('timeouts', domain=urlparse(url).netloc)
+            self.report_response(url, proxy, error=e)
+            logger.info(f"HTTP 검사 실패, 브라우저로 재확인: {url} - {str(e)}")
+            return None
+        finally:
+            metrics.observe('http_fetch', time.perf_counter() - started)
+        verdict, reason = self.classify_response(response.status, content_type, html_content, url)
+        self.store_verdict(url, verdict, response.status, response.headers, reason)
+        return verdict
+
+    async def probe_domain_async(self, session: aiohttp.ClientSession, url: str) -> bool:
+        """블로그 루트 페이지로 블로그 전체가 삭제/이용 제한되었는지 확인
+
+        루트 페이지가 404/410이거나 블로그 삭제 안내 페이지(blog_gone_page)일 때만 True이며,
+        확인하지 못한 경우는 글마다 검사하도록 False를 반환한다.
+        """
+        rules = self.rules.for_url(url)
+        root = rules.blog_root(url)
+        metrics.inc('domain_probes')
+        proxy = self.egress_for(root)
+        await self.wait_turn_async(root, proxy)
+        started = time.perf_counter()
+        try:
+            async with session.get(root, allow_redirects=True,
+                                   proxy=proxy.url if proxy else None) as response:
+                self.report_response(root, proxy, response.status)
+                if response.status in DEAD_STATUS_CODES:
+                    return True
+                if response.status != 200:
+                    return False
+                html_content = await response.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.report_response(root, proxy, error=e)
+            logger.info(f"블로그 루트 확인 실패, 글마다 검사: {root} - {str(e)}")
             return False
+        finally:
+            metrics.observe('domain_probe', time.perf_counter() - started)
+        return self.blog_gone_page(html_content, rules)
+
+    def blog_gone_page(self, html_content: str, rules: PlatformRules) -> bool:
+        """정상 응답(200)한 블로그 루트 페이지가 블로그 삭제/이용 제한 안내 페이지인지 확인
+
+        글 제목이나 본문에 안내 문구가 들어 있는 정상 블로그를 낙장으로 보지 않도록,
+        문구가 제목, 플랫폼의 에러 요소, 짧은 본문(500자 미만) 중 한 곳에 있을 때만
+        True이다. 문구가 아예 없으면 파싱 없이 바로 False를 반환한다.
+        """
+        if rules.gone_re.search(html_content) is None:
+            return False
+        title = TITLE_RE.search(html_content)
+        if title and rules.gone_re.search(self.visible_text(title.group(1))):
+            return True
+        text = self.visible_text(html_content)
+        if len(text) < 500:
+            return rules.gone_re.search(text) is not None
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, 'html.parser')
+        for pattern in rules.error_patterns:
+            attrs = {key: pattern[key] for key in ('class', 'id') if key in pattern}
+            for element in soup.find_all(pattern['tag'], attrs=attrs):
+                if rules.gone_re.search(element.get_text(strip=True)):
+                    return True
+        return False
+
+    async def check_urls_async(self, urls: List[str], max_concurrency: int = 50,
+                               per_host: int = 2, timeout: float = 10.0,
+                               on_result=None, should_stop=None) -> Dict:
+        """여러 URL을 비동기로 동시에 검사하여 결과 반환
+
+        전체 동시 요청 수는 max_concurrency, 도메인(netloc)별 동시 요청 수는
+        per_host로 제한한다. HTTP로 판정할 수 없는 URL만 브라우저로 순차 확인한다.
+        이 체커로 검사한 URL이 여러 개 나온 블로그는 (이전 키워드의 검사 포함)
+        루트 페이지를 먼저 한 번 확인하여, 블로그 전체가 삭제된 경우 글을 하나씩
+        열지 않고 모두 낙장으로 판정한다.
+        on_result(url, is_error, elapsed, reason)는 URL 판정이 끝날 때마다 호출되며
+        elapsed는 해당 URL 검사에 걸린 시간(초), reason은 판정 근거이다
+        (error_page_reason의 근거, http_<상태 코드>, cache, domain, browser_title, timeout).
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        verdicts = {}
+        # 도메인별 동시 요청 제한 (프록시를 거치면 커넥터의 limit_per_host는
+        # 프록시 한 곳에 적용되므로 URL의 netloc 기준으로 따로 제한)
+        host_limits = {}
+        # 루트 페이지 확인 대상 블로그와 진행 중인 확인 작업 (블로그당 한 번만 요청)
+        # 네이버 블로그처럼 호스트 하나에 여러 블로그가 있으면 경로까지 블로그로 구분
+        blog_roots = {url: self.rules.blog_root(url) for url in unique_urls}
+        for root, count in Counter(blog_roots.values()).items():
+            self.blog_urls[root] = self.blog_urls.pop(root, 0) + count
+        while len(self.blog_urls) > DOMAIN_MEMORY:
+            self.blog_urls.popitem(last=False)
+        domain_probes = {}
+
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        # requests 세션과 마찬가지로 HTTP_PROXY 등 환경 변수의 프록시 설정을 따름
+        async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                         headers=dict(self.session.headers),
+                                         trust_env=True) as session:
+            async def domain_dead(url, netloc):
+                root = blog_roots[url]
+                if root in self.dead_domains:
+                    self.dead_domains.move_to_end(root)
+                    return self.dead_domains[root]
+                if self.blog_urls.get(root, 0) < DOMAIN_PROBE_MIN_URLS:
+                    return False
+                if root not in domain_probes:
+                    async def probe_root():
+                        async with host_limits[netloc]:
+                            dead = await self.probe_domain_async(session, url)
+                        self.dead_domains[root] = dead
+                        if len(self.dead_domains) > DOMAIN_MEMORY:
+                            self.dead_domains.popitem(last=False)
+                        if dead:
+                            metrics.inc('dead_domains')
+                            logger.info(f"블로그 전체 낙장, 글 검사 생략: {root}")
+                        return dead
+                    domain_probes[root] = asyncio.ensure_future(probe_root())
+                return await domain_probes[root]
+
+            async def probe(url):
+                if should_stop and should_stop():
+                    return
+                started = time.perf_counter()
+                cached = self.lookup_cache(url)
+                if cached and cached.fresh:
+                    metrics.inc('cache_hits')
+                    self.reasons[url] = 'cache'
+                    verdict = cached.is_error
+                else:
+                    netloc = urlparse(url).netloc
+                    if netloc not in host_limits:
+                        host_limits[netloc] = asyncio.Semaphore(per_host)
+                    if await domain_dead(url, netloc):
+                        self.store_verdict(url, True, reason='domain')
+                        verdict = True
+                    else:
+                        async with host_limits[netloc]:
+                            verdict = await self.probe_http_async(session, url, cached=cached)
+                verdicts[url] = verdict
+                reason = self.pop_reason(url)
+                if verdict is not None and on_result:
+                    on_result(url, verdict, time.perf_counter() - started, reason)
+
+            await asyncio.gather(*(probe(url) for url in unique_urls))
+
+        # HTTP로 판정하지 못한 URL은 브라우저로 확인
+        undecided = [url for url in unique_urls if url in verdicts and verdicts[url] is None]
+        verdicts.update(self.check_urls_browser(undecided, on_result=on_result, should_stop=should_stop))
+
+        results = new_results()
+        for url in unique_urls:
+            if verdicts.get(url) is None:
+                continue
+            domain = urlparse(url).netloc
+            if domain not in results['domain_stats']:
+                results['domain_stats'][domain] = {
+                    'total': 0,
+                    'errors': 0
+                }
+            results['total_sites'] += 1
+            results['domain_stats'][domain]['total'] += 1
+            self.count_verdict(url, verdicts[url])
+            if verdicts[url]:
+                results['error_pages'] += 1
+                results['error_urls'].append(url)
+                results['domain_stats'][domain]['errors'] += 1
+        return results
+
+    def check_urls(self, urls: List[str], **kwargs) -> Dict:
+        """check_urls_async의 동기 래퍼"""
+        return asyncio.run(self.check_urls_async(urls, **kwargs))
+
+    def check_url_browser(self, url: str) -> bool:
+        """브라우저로 URL을 렌더링하여 낙장페이지 여부 확인
+
+        드라이버 명령이 실패했는데 세션도 응답하지 않으면 (탭 충돌, 세션 만료)
+        드라이버를 교체하고 한 번 더 확인한다.
+        """
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        for attempt in range(2):
+            self.check_driver(verify_session=attempt > 0)  # 드라이버 상태 확인
+            try:
+                self.rate_limiter.acquire(url)
+                with metrics.span('page_load'):
+                    previous_origin = self.driver.execute_script('return performance.timeOrigin')
+                    self.driver.get(url)
+                    self.record_page()
+                    # 전체 리소스 로드(complete) 대신 DOM 구성이 끝나는 시점까지만 대기
+                    self.wait_until_ready(self.driver, previous_origin)
+
+                # JavaScript 실행 후 제목과 HTML로 판정
+                verdict, reason = self.browser_verdict(self.driver.title, self.driver.page_source, url)
+                self.store_verdict(url, verdict, reason=reason)
+                return verdict
+
+            except TimeoutException:
+                metrics.inc('timeouts', domain=urlparse(url).netloc)
+                logger.warning(f"URL 로딩 시간 초과: {url}")
+                self.reasons[url] = 'timeout'
+                return False
+            except WebDriverException as e:
+                if attempt == 0 and not driver_session_alive(self.driver):
+                    logger.warning(f"드라이버 세션 응답 없음, 새 드라이버로 다시 확인: {url} - {str(e)}")
+                    continue
+                logger.warning(f"URL 체크 중 에러 발생: {url} - {str(e)}")
+                return False
+            except Exception as e:
+                logger.warning(f"URL 체크 중 에러 발생: {url} - {str(e)}")
+                return False
+        return False
     
-    def is_tistory_domain(self, url: str) -> bool:
-        """URL이 tistory.com 도메인인지 확인"""
-        return 'tistory.com' in urlparse(url).netloc
+    def browser_verdict(self, title: str, html_content: str,
+                        url: str = None) -> Tuple[bool, Optional[str]]:
+        """렌더링된 페이지의 제목과 HTML로 (낙장 여부, 판정 근거) 판정"""
+        # HTTP 상태 확인 (JavaScript 변수나 메타 태그 확인)
+        if "404" in title or "찾을 수 없는" in title:
+            return True, 'browser_title'
+        reason = self.error_page_reason(html_content, url)
+        return reason is not None, reason
+
+    def check_urls_browser(self, urls: List[str], on_result=None, should_stop=None) -> Dict[str, bool]:
+        """여러 URL을 한 드라이버의 탭 여러 개로 동시에 렌더링하여 낙장 여부 확인
+
+        탭마다 window.location으로 이동을 시작만 해 두고, 로드가 먼저 끝난 탭부터
+        제목과 HTML을 가져와 판정한 뒤 다음 URL을 맡긴다. 여러 URL의 네트워크
+        대기가 겹치므로 Chrome 프로세스를 늘리지 않고도 처리량이 늘어난다.
+        드라이버에 문제가 생기면 남은 URL은 check_url_browser로 하나씩 확인한다.
+        """
+        verdicts = {}
+        pending = deque(urls)
+        tab_count = min(self.browser_tabs, len(pending))
+        if tab_count > 1:
+            self.check_driver()
+            loading = {}  # 탭 핸들 -> (URL, 이전 문서의 timeOrigin, 시작 시각)
+            try:
+                self.pipeline_tabs(pending, loading, tab_count, verdicts, on_result, should_stop)
+            except Exception as e:
+                logger.warning(f"탭 동시 검사 중 에러 발생, 남은 URL은 하나씩 확인: {str(e)}")
+                pending.extendleft(url for url, _, _ in loading.values())
+                # 세션이 응답하지 않으면 남은 URL을 확인하기 전에 드라이버 교체
+                self.check_driver(verify_session=True)
+
+        while pending:
+            if should_stop and should_stop():
+                break
+            url = pending.popleft()
+            started = time.perf_counter()
+            verdicts[url] = self.check_url_browser(url)
+            reason = self.pop_reason(url)
+            if on_result:
+                on_result(url, verdicts[url], time.perf_counter() - started, reason)
+        return verdicts
+
+    def pipeline_tabs(self, pending: deque, loading: Dict, tab_count: int,
+                      verdicts: Dict[str, bool], on_result=None, should_stop=None):
+        """탭 tab_count개를 열어 pending의 URL을 모두 판정할 때까지 순환 (끝나면 탭 정리)"""
+        main_handle = self.driver.current_window_handle
+        idle = [main_handle]
+        try:
+            for _ in range(tab_count - 1):
+                self.driver.switch_to.new_window('tab')
+                self.block_resources(self.driver)
+                idle.append(self.driver.current_window_handle)
+
+            while pending or loading:
+                if should_stop and should_stop():
+                    pending.clear()
+                # 쉬고 있는 탭마다 다음 URL로 이동 시작
+                while idle and pending:
+                    handle, url = idle.pop(), pending.popleft()
+                    self.driver.switch_to.window(handle)
+                    self.rate_limiter.acquire(url)
+                    previous_origin = self.driver.execute_script(NAVIGATE_SCRIPT, url)
+                    self.record_page()
+                    loading[handle] = (url, previous_origin, time.perf_counter())
+
+                # 로드가 끝난 탭부터 판정
+                harvested = False
+                for handle, (url, previous_origin, started) in list(loading.items()):
+                    self.driver.switch_to.window(handle)
+                    elapsed = time.perf_counter() - started
+                    if self.driver.execute_script(READY_SCRIPT, previous_origin):
+                        metrics.observe('page_load', elapsed)
+                        verdict, reason = self.browser_verdict(self.driver.title, self.driver.page_source, url)
+                        self.store_verdict(url, verdict, reason=reason)
+                    elif elapsed > PAGE_LOAD_TIMEOUT:
+                        metrics.inc('timeouts', domain=urlparse(url).netloc)
+                        logger.warning(f"URL 로딩 시간 초과: {url}")
+                        self.driver.execute_script('window.stop();')
+                        self.reasons[url] = 'timeout'
+                        verdict = False
+                    else:
+                        continue
+                    del loading[handle]
+                    idle.append(handle)
+                    harvested = True
+                    verdicts[url] = verdict
+                    reason = self.pop_reason(url)
+                    if on_result:
+                        on_result(url, verdict, time.perf_counter() - started, reason)
+                if loading and not harvested:
+                    time.sleep(0.05)
+        finally:
+            # 드라이버를 다른 검사에 다시 쓸 수 있도록 추가 탭을 닫고 첫 탭으로 복귀
+            try:
+                for handle in self.driver.window_handles:
+                    if handle != main_handle:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                self.driver.switch_to.window(main_handle)
+            except Exception as e:
+                logger.warning(f"탭 정리 실패: {str(e)}")
+
+    def is_target_url(self, url: str) -> bool:
+        """URL이 검사 대상 플랫폼(tistory.com 등)의 도메인인지 확인"""
+        return self.rules.match(url) is not None
         
-    def is_error_page(self, html_content: str) -> bool:
-        """HTML 내용을 파싱하여 낙장페이지 여부 확인"""
+    def visible_text(self, html_content: str) -> str:
+        """태그를 제거한 페이지 텍스트 (BeautifulSoup get_text(strip=True) 근사)"""
+        text = ''.join(part.strip() for part in MARKUP_RE.split(NON_TEXT_RE.sub('', html_content)))
+        if '&' in text:
+            text = html.unescape(text)
+        return text
+
+    def is_error_page(self, html_content: str, url: str = None) -> bool:
+        """HTML 내용을 분석하여 낙장페이지 여부 확인 (url이 있으면 그 플랫폼의 규칙 사용)"""
+        return self.error_page_reason(html_content, url) is not None
+
+    def error_page_reason(self, html_content: str, url: str = None) -> Optional[str]:
+        """낙장페이지로 판정한 근거 (정상 페이지면 None)
+
+        근거는 pattern(에러 요소), title(제목), body(짧은 본문), fingerprint(같은 구조의
+        에러 페이지), short_page(짧은 응답) 중 하나이다.
+        에러 요소와 문구는 url이 속한 플랫폼의 규칙을 사용한다 (url이 없으면 기본 규칙).
+        구조/제목/본문 검사는 모두 페이지 텍스트에 에러 문구가 있어야 성립하므로,
+        먼저 정규식 한 번으로 텍스트 전체를 훑어 에러 문구가 없으면 파싱 없이 판정한다.
+        에러 문구가 있는 페이지만 BeautifulSoup으로 자세히 분석한다.
+        """
+        rules = self.rules.for_url(url)
+        with metrics.span('lexical_scan'):
+            text = self.visible_text(html_content)
+            suspicious = rules.error_text_re.search(text)
+        if suspicious:
+            # 같은 구조의 페이지를 이미 여러 번 분석했으면 그 판정 사용
+            with metrics.span('fingerprint'):
+                fingerprint = self.page_fingerprint(html_content, text, rules)
+            known_error = self.fingerprints.get(fingerprint)
+            if known_error is None:
+                metrics.inc('fingerprint_misses')
+                with metrics.span('parse'):
+                    reason = self.parsed_error_reason(html_content, rules)
+                if self.fingerprints.record(fingerprint, reason is not None):
+                    logger.info(f"새 에러 페이지 템플릿 발견 ({fingerprint}): {self.template_hint(html_content)}")
+                if reason:
+                    return reason
+            else:
+                metrics.inc('fingerprint_hits')
+                if known_error:
+                    return 'fingerprint'
+
+        # 4. HTTP 응답 길이 확인 (비정상적으로 짧은 응답)
+        if len(html_content) < 1000:  # 일반적인 블로그 페이지보다 훨씬 짧은 길이
+            logger.info("의심스러운 짧은 페이지 감지")
+            if rules.error_text_re.search(html_content):
+                return 'short_page'
+
+        return None
+
+    def page_fingerprint(self, html_content: str, text: str, rules: PlatformRules = None) -> str:
+        """본문 영역을 뺀 태그 구조로 만든 페이지 구조 지문
+
+        같은 스킨으로 만든 글은 본문을 빼면 구조가 같으므로 지문도 같다. 본문 안의
+        에러 요소, 에러 패턴마다 처음 찾은 요소와 제목, 첫 h2의 에러 문구 여부,
+        텍스트 길이 구간도 지문에 넣어 파싱 결과가 달라질 수 있는 페이지끼리는
+        지문이 겹치지 않게 한다. 플랫폼마다 에러 규칙이 다르므로 플랫폼 이름도 지문에 넣는다.
+        """
+        rules = rules or self.rules.default
+        markup = NON_TEXT_RE.sub('', html_content)
+        tokens = [rules.name]
+        skip_depth = 0  # 본문 영역 안의 깊이
+        # parsed_error_reason의 soup.find처럼 에러 패턴마다 처음 나온 요소의 텍스트를 확인
+        open_elements = {}  # 패턴 번호 -> [텍스트 시작 위치, 같은 태그 깊이]
+        element_errors = {}  # 패턴 번호 -> 요소 텍스트의 에러 문구 여부
+        for match in TAG_RE.finditer(markup):
+            closing, tag, attrs = match.groups()
+            tag = tag.lower()
+            for index, pattern in enumerate(rules.error_patterns):
+                if tag != pattern['tag'] or index in element_errors:
+                    continue
+                state = open_elements.get(index)
+                if state is None:
+                    if not closing and ('class' not in pattern or pattern['class'] in [
+                        name for groups in CLASS_ATTR_RE.findall(attrs) for name in ''.join(groups).split()
+                    ]):
+                        open_elements[index] = [match.end(), 1]
+                    continue
+                state[1] += -1 if closing else 1
+                if not state[1]:
+                    element_text = self.visible_text(markup[state[0]:match.start()])
+                    element_errors[index] = bool(rules.error_text_re.search(element_text))
+                    del open_elements[index]
+            names = [name for groups in NAME_ATTR_RE.findall(attrs) for name in ''.join(groups).split()]
+            if skip_depth:
+                if closing:
+                    skip_depth -= 1
+                    if not skip_depth:
+                        tokens.append('/' + tag)
+                elif tag not in VOID_ELEMENTS:
+                    skip_depth += 1
+                if rules.error_element_names.intersection(names):
+                    tokens.append(f"{tag}.{'.'.join(sorted(names))}")
+                continue
+            if closing:
+                tokens.append('/' + tag)
+                continue
+            tokens.append(f"{tag}.{'.'.join(sorted(DIGITS_RE.sub('0', name) for name in names))}")
+            if tag not in VOID_ELEMENTS and rules.article_body_classes.intersection(names):
+                skip_depth = 1
+
+        # 닫히지 않은 요소는 문서 끝까지를 텍스트로 봄
+        for index, (start, _) in open_elements.items():
+            element_errors[index] = bool(rules.error_text_re.search(self.visible_text(markup[start:])))
+        tokens.append('elements:' + ''.join(
+            '-' if index not in element_errors else str(int(element_errors[index]))
+            for index in range(len(rules.error_patterns))
+        ))
+        title = TITLE_RE.search(html_content)
+        first_h2 = FIRST_H2_RE.search(html_content)
+        tokens.append(f"title:{bool(title and rules.error_text_re.search(self.visible_text(title.group(1))))}")
+        tokens.append(f"h2:{bool(first_h2 and rules.error_text_re.search(self.visible_text(first_h2.group(1))))}")
+        tokens.append(f"short:{len(text) < 500}")
+        return hashlib.blake2b('\n'.join(tokens).encode('utf-8'), digest_size=8).hexdigest()
+
+    def template_hint(self, html_content: str) -> str:
+        """에러 패턴 목록에 추가할 만한 제목과 class/id"""
+        title = TITLE_RE.search(html_content)
+        names = sorted({
+            name for _, _, attrs in TAG_RE.findall(html_content)
+            for groups in NAME_ATTR_RE.findall(attrs) for name in ''.join(groups).split()
+            if ERROR_HINT_RE.search(name)
+        })
+        title_text = html.unescape(title.group(1).strip()) if title else ''
+        return f"제목 '{title_text}', class/id {names}"
+
+    def parsed_error_reason(self, html_content: str, rules: PlatformRules = None) -> Optional[str]:
+        """HTML 내용을 파싱하여 에러 요소/제목/본문 검사 (낙장 근거 반환, 정상이면 None)"""
+        from bs4 import BeautifulSoup
+        rules = rules or self.rules.default
         soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 1. 티스토리 기본 에러 페이지 패턴
-        error_patterns = [
-            # 패턴 1: 기본 에러 메시지
-            {'tag': 'h2', 'class': 'tit_error'},
-            {'tag': 'strong', 'class': 'tit_error'},
-            {'tag': 'p', 'class': 'desc_error'},
-            
-            # 패턴 2: 스킨별 에러 메시지
-            {'tag': 'h2', 'id': 'kakaoBody'},
-            {'tag': 'div', 'class': 'error-page'},
-            {'tag': 'div', 'class': 'errorPage'},
-            
-            # 패턴 3: 커스텀 에러 페이지
-            {'tag': 'div', 'class': '404'},
-            {'tag': 'div', 'class': 'error404'}
-        ]
-        
-        error_texts = [
-            "존재하지 않는",
-            "찾을 수 없는",
-            "삭제된",
-            "없는 페이지",
-            "Error",
-            "에러",
-            "404",
-            "페이지를 찾을 수 없습니다"
-        ]
-        
+
         # 1. HTML 구조 기반 체크
-        for pattern in error_patterns:
+        for pattern in rules.error_patterns:
             element = soup.find(pattern['tag'], class_=pattern.get('class', None))
             if element:
                 # 발견된 요소의 텍스트에서 에러 문구 확인
-                element_text = element.get_text(strip=True).lower()
-                if any(text.lower() in element_text for text in error_texts):
-                    logger.info(f"에러 페이지 감지 (패턴 매칭): {element_text}")
-                    return True
+                element_text = element.get_text(strip=True)
+                if rules.error_text_re.search(element_text):
+                    logger.info(f"에러 페이지 감지 (패턴 매칭): {element_text.lower()}")
+                    return 'pattern'
         
         # 2. 페이지 제목 확인
         title_tag = soup.find('title')
         if title_tag:
-            title_text = title_tag.get_text(strip=True).lower()
-            if any(text.lower() in title_text for text in error_texts):
-                logger.info(f"에러 페이지 감지 (제목): {title_text}")
-                return True
+            title_text = title_tag.get_text(strip=True)
+            if rules.error_text_re.search(title_text):
+                logger.info(f"에러 페이지 감지 (제목): {title_text.lower()}")
+                return 'title'
         
         # 3. 전체 페이지 내용 검사
         body_tag = soup.find('body')
         if body_tag:
-            body_text = body_tag.get_text(strip=True).lower()
+            body_text = body_tag.get_text(strip=True)
             # 페이지 내용이 매우 짧고 에러 문구가 포함된 경우
             if len(body_text) < 500:  # 일반적인 블로그 글보다 훨씬 짧은 길이
-                if any(text.lower() in body_text for text in error_texts):
+                if rules.error_text_re.search(body_text):
                     logger.info("에러 페이지 감지 (컨텐츠 분석)")
-                    return True
-        
-        # 4. HTTP 응답 길이 확인 (비정상적으로 짧은 응답)
-        if len(html_content) < 1000:  # 일반적인 티스토리 페이지보다 훨씬 짧은 길이
-            logger.info("의심스러운 짧은 페이지 감지")
-            if any(text.lower() in html_content.lower() for text in error_texts):
-                return True
-        
-        return False
+                    return 'body'
+
+        return None
+
+    def search_keyword(self, keyword: str, index: KeywordIndex = None) -> List[str]:
+        """키워드 검색 결과 URL 목록 (index에 표기만 다른 키워드가 있으면 검색 생략)"""
+        if index is not None:
+            urls = index.lookup(keyword)
+            if urls is not None:
+                metrics.inc('serp_reused')
+                logger.info(f"검색 결과 재사용: {keyword}")
+                return urls
+        urls = self.search_naver(keyword)['urls']
+        if index is not None:
+            index.add(keyword, urls)
+        return urls
+
+    def check_keyword(self, keyword: str, verdicts: Dict[str, bool],
+                      details: Dict[str, tuple] = None, index: KeywordIndex = None) -> List[tuple]:
+        """키워드 검색 결과의 URL별 (url, 낙장 여부) 목록을 검색 순서대로 반환
+
+        verdicts는 정규화된 URL별 판정 기록으로, 이미 판정한 URL은 다시 검사하지 않는다.
+        details가 주어지면 이번에 검사한 URL별 (판정 근거, 소요 시간)을 기록한다.
+        index가 주어지면 검색 결과를 색인에 등록하고 중복 키워드의 검색을 생략한다.
+        """
+        logger.info(f"키워드 처리 중: {keyword}")
+        urls = self.search_keyword(keyword, index)
+
+        pending = [url for url in urls if normalize_url(url) not in verdicts]
+        if pending:  # URL이 존재할 경우에만 처리
+            # URL 동시 검사 (도메인별 동시 요청 수 제한)
+            def on_result(url, is_error, elapsed, reason):
+                verdicts[normalize_url(url)] = is_error
+                if details is not None:
+                    details[url] = (reason, elapsed)
+            self.check_urls(pending, on_result=on_result)
+
+        return [
+            (url, verdicts[normalize_url(url)])
+            for url in urls
+            if normalize_url(url) in verdicts
+        ]
+
+    def process_keywords(self, keywords: Iterable[str], writer: 'ResultWriter' = None,
+                         index: KeywordIndex = None) -> CompactResults:
+        """키워드를 순서대로 처리하고 결과 반환
+
+        keywords는 한 번에 하나씩 읽으므로 제너레이터도 사용할 수 있다.
+        writer가 주어지면 키워드마다 새로 판정한 URL과 키워드별 보고서를 바로 기록한다.
+        """
+        results = CompactResults()
+        seen = set()  # 이미 검사한 URL (키워드 간 중복 제거)
+        verdicts = {}
+        if index is None:
+            index = KeywordIndex()
 
-    def process_keywords(self, keywords: List[str]) -> Dict:
-        """키워드 리스트 처리 및 결과 반환"""
-        results = {
-            'total_sites': 0,
-            'error_pages': 0,
-            'error_urls': [],
-            'domain_stats': {}  # 전체 도메인 통계
-        }
-        
         for keyword in keywords:
-            logger.info(f"키워드 처리 중: {keyword}")
-            search_results = self.search_naver(keyword)
-            urls = search_results['urls']
-            
-            if urls:  # URL이 존재할 경우에만 처리
-                results['total_sites'] += len(urls)
-                
-                # 도메인 통계 업데이트
-                for domain, count in search_results['domain_stats'].items():
-                    if domain not in results['domain_stats']:
-                        results['domain_stats'][domain] = {
-                            'total': 0,
-                            'errors': 0
-                        }
-                    results['domain_stats'][domain]['total'] += count
-                
-                for url in urls:
-                    # URL 체크 전 추가 대기
-                    sleep(random.uniform(1, 3))
-                    if self.check_url(url):
-                        results['error_pages'] += 1
-                        results['error_urls'].append(url)
-                        # 에러 URL의 도메인 통계 업데이트
-                        domain = urlparse(url).netloc
-                        results['domain_stats'][domain]['errors'] += 1
-            
-            # 키워드 처리 후 추가 대기
-            sleep(random.uniform(3, 6))
-                    
+            details = {}
+            keyword_verdicts = self.check_keyword(keyword, verdicts, details, index)
+            added = results.add_verdicts(seen, keyword_verdicts)
+            if writer:
+                writer.write_all(keyword, added, details)
+                writer.write_report(index.report(keyword, keyword_verdicts))
+
         return results
 
-    def read_keywords(self, file_path: str) -> List[str]:
+    def new_urls(self, urls: List[str], seen: set) -> List[str]:
+        """이번 실행에서 아직 검사하지 않은 URL만 반환하고 seen에 추가"""
+        fresh_urls = []
+        for url in urls:
+            key = normalize_url(url)
+            if key not in seen:
+                seen.add(key)
+                fresh_urls.append(url)
+        return fresh_urls
+
+    @staticmethod
+    def read_keywords(file_path: str) -> List[str]:
         """키워드 파일을 읽어서 리스트로 반환"""
+        return list(PageChecker.iter_keywords(file_path))
+
+    @staticmethod
+    def iter_keywords(file_path: str) -> Iterator[str]:
+        """키워드 파일을 한 줄씩 읽어서 반환 ('-'이면 표준 입력)"""
+        if file_path == '-':
+            for line in sys.stdin:
+                if line.strip():
+                    yield line.strip()
+            return
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                return [line.strip() for line in f if line.strip()]
+                for line in f:
+                    if line.strip():
+                        yield line.strip()
         except FileNotFoundError:
             logger.error(f"키워드 파일을 찾을 수 없습니다: {file_path}")
             raise
@@ -388,35 +1452,204 @@ class PageChecker:
             logger.error(f"키워드 파일 읽기 중 에러 발생: {str(e)}")
             raise
 
+    def close(self):
+        """드라이버 정리 (풀 드라이버는 풀에 반납, 세션이 응답하지 않으면 폐기)"""
+        if self.driver_pool:
+            if self.driver is not None:
+                self.driver_pool.release(self.driver, broken=not driver_session_alive(self.driver))
+        elif self.driver:
+            safe_driver_quit(self.driver)
+        self.driver = None
+
     def __del__(self):
         """소멸자에서 드라이버 정리"""
         if hasattr(self, 'driver') and self.driver:
-            safe_driver_quit(self.driver)
+            self.close()
+
+class ResultWriter:
+    """판정 결과를 나오는 대로 파일에 추가하는 기록기
+
+    낙장 URL은 out_path에 한 줄씩, 모든 URL의 판정은 jsonl_path에 JSON 한 줄씩,
+    키워드별 보고서는 report_path에 JSON 한 줄씩 기록하고 줄마다 바로 디스크로
+    내보내므로 실행이 중간에 끊겨도 그때까지의 결과가 남는다.
+    """
+    def __init__(self, out_path: str = 'outdomain.txt', jsonl_path: Optional[str] = 'outdomain.jsonl',
+                 echo: bool = True, report_path: Optional[str] = None):
+        self.echo = echo
+        # 줄 단위 버퍼링: 한 줄 쓸 때마다 flush
+        self._out = open(out_path, 'w', encoding='utf-8', buffering=1)
+        self._jsonl = open(jsonl_path, 'w', encoding='utf-8', buffering=1) if jsonl_path else None
+        self._report = open(report_path, 'w', encoding='utf-8', buffering=1) if report_path else None
+
+    def write(self, keyword: str, url: str, is_error: bool, reason: Optional[str], elapsed: Optional[float]):
+        """URL 판정 하나 기록"""
+        if is_error:
+            self._out.write(f"{url}\n")
+            if self.echo:
+                print(f"- {url}")
+        if self._jsonl:
+            self._jsonl.write(json.dumps({
+                'keyword': keyword,
+                'url': url,
+                'dead': is_error,
+                'reason': reason,
+                'elapsed_ms': round(elapsed * 1000, 1) if elapsed is not None else None,
+                'checked_at': round(time.time(), 3)
+            }, ensure_ascii=False) + '\n')
+
+    def write_all(self, keyword: str, verdicts: List[tuple], details: Dict[str, tuple]):
+        """키워드의 (url, 낙장 여부) 목록 기록 (details는 URL별 (판정 근거, 소요 시간))"""
+        for url, is_error in verdicts:
+            reason, elapsed = details.get(url, (None, None))
+            self.write(keyword, url, is_error, reason, elapsed)
+
+    def write_report(self, report: Dict):
+        """키워드별 보고서 한 줄 기록"""
+        if self._report:
+            self._report.write(json.dumps(report, ensure_ascii=False) + '\n')
+
+    def close(self):
+        self._out.close()
+        if self._jsonl:
+            self._jsonl.close()
+        if self._report:
+            self._report.close()
+
+# 워커 프로세스별 체커와 판정 기록 (--workers 모드)
+_worker_checker = None
+_worker_verdicts = {}
+
+def _init_worker(cache_path: Optional[str], ttls: Dict[str, float], workers: int):
+    """워커 프로세스마다 체커 하나를 생성 (호스트별 요청 예산은 워커 수로 나눔)"""
+    global _worker_checker
+    cache = VerdictCache(cache_path, ttls=ttls) if cache_path else None
+    _worker_checker = PageChecker(cache=cache, rate_limiter=HostRateLimiter(share=workers))
+    metrics.track_domains = True  # CLI 요약표용 도메인별 카운터 (부모 프로세스로 전달)
+    atexit.register(_worker_checker.close)
+
+def _check_keyword_worker(keyword: str) -> tuple:
+    """워커 프로세스에서 키워드 하나 처리 (판정 목록, URL별 상세, 그동안 모은 지표 반환)"""
+    details = {}
+    verdicts = _worker_checker.check_keyword(keyword, _worker_verdicts, details)
+    return verdicts, details, metrics.drain()
+
+def process_keywords_parallel(keywords: Iterable[str], workers: int,
+                              cache_path: Optional[str], ttls: Dict[str, float],
+                              writer: ResultWriter = None, index: KeywordIndex = None) -> CompactResults:
+    """키워드를 여러 워커 프로세스에 나누어 처리
+
+    결과는 키워드 순서대로 병합하고 URL 중복은 전체 기준으로 제거하므로
+    단일 프로세스로 처리한 결과와 같은 순서가 된다. 키워드는 워커 수의 두 배까지만
+    미리 제출하므로 입력이 아무리 길어도 대기 중인 작업이 쌓이지 않는다.
+    표기만 다른 중복 키워드는 워커에 보내지 않고 앞선 키워드의 결과를 재사용한다.
+    워커마다 속도 제한기를 따로 두므로 호스트별 초당 요청 수를 워커 수로 나누어
+    워커 전체가 단일 프로세스의 호스트 예산을 넘지 않게 한다.
+    """
+    results = CompactResults()
+    seen = set()
+    verdicts_by_url = {}  # 정규화 URL -> 낙장 여부 (중복 키워드 결과 재구성용)
+    submitted = set()  # 워커에 보낸 정규화 키워드
+    window = deque()  # 제출 순서대로 (키워드, Future 또는 중복이면 None)
+    if index is None:
+        index = KeywordIndex()
+
+    def collect():
+        keyword, future = window.popleft()
+        if future is None:
+            # 앞선 키워드가 먼저 수집되므로 색인에 검색 결과가 있음
+            metrics.inc('serp_reused')
+            urls = index.lookup(keyword) or []
+            verdicts = [
+                (url, verdicts_by_url[normalize_url(url)])
+                for url in urls
+                if normalize_url(url) in verdicts_by_url
+            ]
+            details = {}
+        else:
+            verdicts, details, snapshot = future.result()
+            metrics.merge(snapshot)
+            index.add(keyword, [url for url, _ in verdicts])
+            for url, is_error in verdicts:
+                verdicts_by_url[normalize_url(url)] = is_error
+        added = results.add_verdicts(seen, verdicts)
+        if writer:
+            writer.write_all(keyword, added, details)
+            writer.write_report(index.report(keyword, verdicts))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_path, ttls, workers)) as executor:
+        for keyword in keywords:
+            key = normalize_keyword(keyword)
+            if key in submitted:
+                window.append((keyword, None))
+            else:
+                submitted.add(key)
+                window.append((keyword, executor.submit(_check_keyword_worker, keyword)))
+            if len(window) >= workers * 2:
+                collect()
+        while window:
+            collect()
+    return results
 
 def main():
     parser = argparse.ArgumentParser(description='낙장페이지 확인 자동화 프로그램')
-    parser.add_argument('--keyword_file', required=True, help='키워드가 저장된 텍스트 파일 경로')
+    parser.add_argument('--keyword_file', required=True, help="키워드가 저장된 텍스트 파일 경로 ('-'이면 표준 입력)")
+    parser.add_argument('--output', default='outdomain.txt', help='낙장페이지 URL을 기록할 파일')
+    parser.add_argument('--jsonl', default='outdomain.jsonl',
+                        help="URL별 판정/근거/소요 시간을 기록할 JSONL 파일 ('-'이면 기록하지 않음)")
+    parser.add_argument('--cache', default='verdict_cache.db', help='판정 캐시 DB 경로')
+    parser.add_argument('--no_cache', action='store_true', help='판정 캐시를 사용하지 않음')
+    parser.add_argument('--cache_ttl_dead', type=float, default=DEFAULT_TTLS['dead'] / 3600,
+                        help='낙장 판정 캐시 유효 기간 (시간)')
+    parser.add_argument('--cache_ttl_alive', type=float, default=DEFAULT_TTLS['alive'] / 3600,
+                        help='정상 판정 캐시 유효 기간 (시간)')
+    parser.add_argument('--report', default=None, help='키워드별 보고서를 기록할 JSONL 파일 (지정하지 않으면 기록하지 않음)')
+    parser.add_argument('--workers', type=int, default=1, help='키워드를 나누어 처리할 워커 프로세스 수')
     args = parser.parse_args()
     
-    checker = PageChecker()
+    cache_path = None if args.no_cache else args.cache
+    ttls = {
+        'dead': args.cache_ttl_dead * 3600,
+        'alive': args.cache_ttl_alive * 3600
+    }
     
+    # 도메인별 카운터는 CLI 요약표에만 출력 (서비스의 /metrics에는 합계만 노출)
+    metrics.track_domains = True
+
     try:
-        keywords = checker.read_keywords(args.keyword_file)
-        results = checker.process_keywords(keywords)
-        
+        keywords = PageChecker.iter_keywords(args.keyword_file)
+        # 낙장페이지 URL은 확인되는 대로 출력하고 파일에 추가
+        print("\n낙장페이지 URL 목록:")
+        writer = ResultWriter(args.output, None if args.jsonl == '-' else args.jsonl,
+                              report_path=args.report)
+        # 키워드 간 중복 검색/검사를 줄이기 위한 실행 단위 색인
+        index = KeywordIndex()
+        try:
+            if args.workers > 1:
+                results = process_keywords_parallel(keywords, args.workers, cache_path, ttls, writer, index)
+            else:
+                cache = VerdictCache(cache_path, ttls=ttls) if cache_path else None
+                checker = PageChecker(cache=cache)
+                try:
+                    results = checker.process_keywords(keywords, writer, index)
+                finally:
+                    checker.close()
+        finally:
+            writer.close()
+
         # 결과 출력
         print("\n=== 검사 결과 ===")
-        print(f"총 검사한 사이트 수: {results['total_sites']}")
-        print(f"낙장페이지 수: {results['error_pages']}")
-        print("\n낙장페이지 URL 목록:")
-        
-        # outdomain.txt 파일에 낙장페이지 URL 저장
-        with open('outdomain.txt', 'w', encoding='utf-8') as f:
-            for url in results['error_urls']:
-                f.write(f"{url}\n")
-                print(f"- {url}")
-        
-        logger.info(f"낙장페이지 URL 목록이 outdomain.txt 파일에 저장되었습니다.")
+        print(f"총 검사한 사이트 수: {results.total_sites}")
+        print(f"낙장페이지 수: {results.error_pages}")
+        stats = index.stats()
+        print(f"고유 키워드 수: {stats['keywords']} (검색 재사용 {stats['reused_searches']}회)")
+        print(f"여러 키워드에 나온 URL 수: {stats['shared_urls']} / {stats['urls']} ({stats['domains']}개 도메인)")
+        results.close()
+
+        logger.info(f"낙장페이지 URL 목록이 {args.output} 파일에 저장되었습니다.")
+
+        # 단계별 소요 시간과 도메인별 카운터 요약
+        print(metrics.summary())
             
     except Exception as e:
         logger.error(f"프로그램 실행 중 에러 발생: {str(e)}")
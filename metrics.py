@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict
+
+METRIC_PREFIX = 'finddomain'
+
+class Metrics:
+    """처리 단계별 소요 시간과 도메인별 카운터를 모으는 레지스트리
+
+    카운터와 소요 시간은 (이름, 레이블) 단위로 모으며, Prometheus 텍스트 형식
+    또는 CLI용 요약표로 출력할 수 있다. domain은 레이블로 쓰지 않고 합계에만
+    더하므로 블로그가 아무리 많아도 Prometheus 시계열 수는 늘지 않는다.
+    도메인별 상세는 track_domains가 켜진 경우(CLI 실행)에만 따로 모아 요약표에 출력한다.
+    """
+    def __init__(self, track_domains: bool = False):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)  # (이름, 레이블) -> 값
+        self._timings = {}  # (이름, 레이블) -> [횟수, 합계, 최대]
+        self.track_domains = track_domains
+        self._domains = defaultdict(lambda: defaultdict(float))  # 도메인 -> 이름 -> 값
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> tuple:
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name: str, amount: float = 1, domain: str = None, **labels):
+        """카운터 증가 (domain은 track_domains가 켜진 경우에만 따로 기록)"""
+        with self._lock:
+            self._counters[self._key(name, labels)] += amount
+            if domain and self.track_domains:
+                self._domains[domain][name] += amount
+
+    def observe(self, name: str, seconds: float, **labels):
+        """소요 시간 기록"""
+        key = self._key(name, labels)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                self._timings[key] = [1, seconds, seconds]
+            else:
+                timing[0] += 1
+                timing[1] += seconds
+                timing[2] = max(timing[2], seconds)
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """with 블록의 소요 시간 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def drain(self) -> Dict:
+        """지금까지 모은 값을 반환하고 초기화 (워커 프로세스 → 부모 전달용)"""
+        with self._lock:
+            snapshot = {
+                'counters': dict(self._counters),
+                'timings': self._timings,
+                'domains': {domain: dict(values) for domain, values in self._domains.items()}
+            }
+            self._counters = defaultdict(float)
+            self._timings = {}
+            self._domains = defaultdict(lambda: defaultdict(float))
+        return snapshot
+
+    def merge(self, snapshot: Dict):
+        """다른 프로세스에서 drain한 값을 합침"""
+        with self._lock:
+            for key, value in snapshot['counters'].items():
+                self._counters[key] += value
+            for key, (count, total, maximum) in snapshot['timings'].items():
+                timing = self._timings.get(key)
+                if timing is None:
+                    self._timings[key] = [count, total, maximum]
+                else:
+                    timing[0] += count
+                    timing[1] += total
+                    timing[2] = max(timing[2], maximum)
+            for domain, values in snapshot.get('domains', {}).items():
+                for name, value in values.items():
+                    self._domains[domain][name] += value
+
+    @staticmethod
+    def _format_labels(labels: tuple) -> str:
+        if not labels:
+            return ''
+        pairs = []
+        for name, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            pairs.append(f'{name}="{value}"')
+        return '{' + ','.join(pairs) + '}'
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timings = sorted((key, list(value)) for key, value in self._timings.items())
+
+        lines = []
+        declared = set()
+        for (name, labels), value in counters:
+            metric = f'{METRIC_PREFIX}_{name}_total'
+            if metric not in declared:
+                lines.append(f'# TYPE {metric} counter')
+                declared.add(metric)
+            lines.append(f'{metric}{self._format_labels(labels)} {value:g}')
+
+        for (name, labels), (count, total, maximum) in timings:
+            metric = f'{METRIC_PREFIX}_{name}_seconds'
+            if metric not in declared:
+                lines.append(f'# TYPE {metric} summary')
+                lines.append(f'# TYPE {metric}_max gauge')
+                declared.add(metric)
+            label_text = self._format_labels(labels)
+            lines.append(f'{metric}_count{label_text} {count}')
+            lines.append(f'{metric}_sum{label_text} {total:.6f}')
+            lines.append(f'{metric}_max{label_text} {maximum:.6f}')
+        return '\n'.join(lines) + '\n'
+
+    def summary(self, top_domains: int = 10) -> str:
+        """CLI 실행 종료 시 출력할 요약표"""
+        with self._lock:
+            counters = dict(self._counters)
+            timings = {key: list(value) for key, value in self._timings.items()}
+            per_domain = {domain: dict(values) for domain, values in self._domains.items()}
+
+        lines = ["\n=== 단계별 소요 시간 ==="]
+        lines.append(f"{'단계':<20} {'횟수':>8} {'합계 s':>10} {'평균 ms':>10} {'최대 ms':>10}")
+        for (name, labels), (count, total, maximum) in sorted(timings.items(), key=lambda item: -item[1][1]):
+            label_text = ','.join(f'{key}={value}' for key, value in labels)
+            stage = f'{name}[{label_text}]' if label_text else name
+            lines.append(
+                f"{stage:<20} {count:>8} {total:>10.2f} {total / count * 1000:>10.1f} {maximum * 1000:>10.1f}"
+            )
+
+        totals = defaultdict(float)
+        for (name, labels), value in counters.items():
+            totals[name] += value
+
+        lines.append("\n=== 카운터 ===")
+        for name, value in sorted(totals.items()):
+            lines.append(f"{name:<20} {value:>10g}")
+
+        if per_domain:
+            lines.append(f"\n=== 도메인별 (검사 수 상위 {top_domains}개) ===")
+            lines.append(f"{'도메인':<40} {'검사':>6} {'낙장':>6} {'시간초과':>8}")
+            ranked = sorted(per_domain.items(), key=lambda item: -item[1].get('urls_checked', 0))
+            for domain, values in ranked[:top_domains]:
+                lines.append(
+                    f"{domain:<40} {values.get('urls_checked', 0):>6g} {values.get('urls_dead', 0):>6g} "
+                    f"{values.get('timeouts', 0):>8g}"
+                )
+        return '\n'.join(lines)
+
+# 프로세스 전역 레지스트리
+metrics = Metrics()
@@ -0,0 +1,156 @@
+import asyncio
+import os
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from metrics import metrics
+from rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+class EgressProxy:
+    """출구 프록시 하나의 상태 (건강 점수와 요청 예산)"""
+    def __init__(self, url: str, rate: float, burst: float):
+        parts = urlparse(url)
+        self.url = url
+        # 로그와 /metrics에 남기는 이름 (URL에 들어 있는 인증 정보는 빼고 호스트:포트만)
+        host = f'[{parts.hostname}]' if parts.hostname and ':' in parts.hostname else (parts.hostname or 'proxy')
+        self.label = f'{host}:{parts.port}' if parts.port else host
+        # Chrome의 --proxy-server는 URL의 인증 정보를 무시하므로 브라우저에는 배정하지 않음
+        self.has_auth = parts.username is not None
+        self.bucket = TokenBucket(rate, burst)
+        self.score = 1.0  # 최근 요청 성공률을 반영한 건강 점수 (0~1)
+        self.cooldown_until = 0.0  # 요청 제한을 받으면 이 시각까지 배정하지 않음
+        self.requests = 0
+        self.failures = 0
+
+class ProxyPool:
+    """요청을 여러 출구 프록시에 나누어 보내는 프록시 풀
+
+    프록시마다 초당 rate개의 요청 예산과 건강 점수를 두고, 같은 키(호스트)의
+    요청은 배정된 프록시의 예산이 남아 있는 동안 같은 프록시로 보내 연결을
+    재사용한다. 예산을 다 쓰면 가장 빨리 쓸 수 있는 프록시로 옮겨 배정하므로
+    한 호스트에 요청이 몰려도 모든 프록시로 나뉜다. 연결 실패는 점수를
+    깎고, 요청 제한(429/503, 캡차)을 받았거나 점수가 min_score 아래로 떨어진
+    프록시는 cooldown초 동안 쉬게 한 뒤 min_score에서 다시 시작한다.
+    모든 프록시가 쉬는 중이면 점수가 가장 높은 프록시를 계속 사용한다.
+    """
+    def __init__(self, proxies: List[str], rate: float = 5.0, burst: float = 2.0,
+                 min_score: float = 0.3, cooldown: float = 30.0, max_sticky: int = 10000):
+        if not proxies:
+            raise ValueError("프록시 목록이 비어 있습니다.")
+        self.proxies = [EgressProxy(url, rate, burst) for url in proxies]
+        self.min_score = min_score
+        self.cooldown = cooldown
+        self.max_sticky = max_sticky
+        self._sticky = OrderedDict()  # 키 -> 배정된 프록시
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional['ProxyPool']:
+        """EGRESS_PROXIES(쉼표로 구분한 프록시 URL)로 풀 생성 (설정이 없으면 None)"""
+        proxies = [url.strip() for url in os.environ.get('EGRESS_PROXIES', '').split(',') if url.strip()]
+        if not proxies:
+            return None
+        return cls(
+            proxies,
+            rate=float(os.environ.get('EGRESS_PROXY_RATE', 5.0)),
+            cooldown=float(os.environ.get('EGRESS_PROXY_COOLDOWN', 30.0))
+        )
+
+    def _healthy(self, now: float) -> List[EgressProxy]:
+        healthy = [proxy for proxy in self.proxies if proxy.cooldown_until <= now]
+        return healthy or [max(self.proxies, key=lambda proxy: proxy.score)]
+
+    @staticmethod
+    def _wait_time(proxy: EgressProxy, now: float) -> float:
+        """토큰을 쓰지 않고 다음 요청까지 기다려야 하는 시간 추정"""
+        bucket = proxy.bucket
+        tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+        return max(0.0, (1 - tokens) / bucket.rate)
+
+    def choose(self, key: str) -> EgressProxy:
+        """키에 배정된 프록시 반환 (없거나 쉬는 중이거나 예산이 없으면 가장 빨리 쓸 수 있는 프록시 배정)"""
+        with self._lock:
+            now = time.monotonic()
+            healthy = self._healthy(now)
+            proxy = self._sticky.get(key)
+            if proxy is not None and proxy in healthy and self._wait_time(proxy, now) == 0:
+                self._sticky.move_to_end(key)
+                return proxy
+            proxy = min(healthy, key=lambda proxy: (self._wait_time(proxy, now), -proxy.score, proxy.requests))
+            self._sticky[key] = proxy
+            self._sticky.move_to_end(key)
+            if len(self._sticky) > self.max_sticky:
+                self._sticky.popitem(last=False)
+            return proxy
+
+    def next(self, browser: bool = False) -> Optional[EgressProxy]:
+        """오래 쓰는 연결(브라우저 등)에 건강한 프록시를 돌아가며 배정
+
+        browser가 True이면 인증이 필요 없는 프록시만 배정하고, 그런 프록시가 없으면 None이다.
+        """
+        with self._lock:
+            healthy = self._healthy(time.monotonic())
+            if browser:
+                healthy = [proxy for proxy in healthy if not proxy.has_auth]
+                if not healthy:
+                    healthy = [proxy for proxy in self.proxies if not proxy.has_auth]
+                if not healthy:
+                    return None
+            proxy = healthy[self._next % len(healthy)]
+            self._next += 1
+            return proxy
+
+    def reserve(self, proxy: EgressProxy) -> float:
+        """프록시 예산에서 요청 한 건을 예약하고 기다려야 하는 시간(초) 반환"""
+        with self._lock:
+            proxy.requests += 1
+            return proxy.bucket.reserve()
+
+    def acquire(self, proxy: EgressProxy):
+        """프록시 예산이 허용할 때까지 대기"""
+        delay = self.reserve(proxy)
+        if delay > 0:
+            metrics.observe('egress_wait', delay)
+            time.sleep(delay)
+
+    async def acquire_async(self, proxy: EgressProxy):
+        """프록시 예산이 허용할 때까지 비동기 대기"""
+        delay = self.reserve(proxy)
+        if delay > 0:
+            metrics.observe('egress_wait', delay)
+            await asyncio.sleep(delay)
+
+    def report(self, proxy: EgressProxy, failed: bool = False, throttled: bool = False):
+        """요청 결과로 프록시 건강 점수 갱신"""
+        with self._lock:
+            if throttled or failed:
+                proxy.failures += 1
+                proxy.score *= 0.5
+                if throttled or proxy.score < self.min_score:
+                    proxy.score = max(proxy.score, self.min_score)
+                    proxy.cooldown_until = time.monotonic() + self.cooldown
+                    logger.warning(f"프록시 {'요청 제한' if throttled else '연결 실패'} 감지, "
+                                   f"{self.cooldown:g}초 동안 제외: {proxy.label}")
+            else:
+                proxy.score += (1.0 - proxy.score) * 0.2
+        if failed or throttled:
+            metrics.inc('egress_failures', proxy=proxy.label)
+
+    def snapshot(self) -> List[Dict]:
+        """프록시별 상태 (모니터링용)"""
+        with self._lock:
+            now = time.monotonic()
+            return [{
+                'proxy': proxy.label,
+                'score': round(proxy.score, 3),
+                'cooling_down': proxy.cooldown_until > now,
+                'requests': proxy.requests,
+                'failures': proxy.failures
+            } for proxy in self.proxies]
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+import logging
+from typing import Dict
+from urllib.parse import urlparse
+
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 호스트 접미사별 초기/최대 초당 요청 수
+DEFAULT_HOST_RATES = {
+    'naver.com': {'initial_rate': 0.5, 'max_rate': 2.0},
+}
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지는 버킷"""
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 사용 가능해질 때까지 기다려야 하는 시간 반환"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 속도 제한기 (AIMD 방식으로 속도 조절)
+
+    호스트마다 별도의 요청 예산을 두어 서로 다른 호스트의 요청은 서로 기다리지 않는다.
+    egress(출구 프록시)를 지정하면 프록시마다 호스트별 예산을 따로 둔다.
+    정상 응답이 오면 초당 요청 수를 increase만큼 올리고, 429/503이나 캡차 응답이면
+    decrease 배로 줄인다. 여러 프로세스가 각자 제한기를 두고 같은 호스트에 요청하면
+    share에 프로세스 수를 주어 호스트 예산(초당 요청 수)을 프로세스끼리 나눈다.
+    """
+    def __init__(self, initial_rate: float = 1.0, min_rate: float = 0.1, max_rate: float = 5.0,
+                 increase: float = 0.1, decrease: float = 0.5, burst: float = 1.0,
+                 host_rates: Dict[str, Dict[str, float]] = None, share: int = 1):
+        self.share = max(1, share)
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate / self.share
+        self.max_rate = max_rate
+        self.increase = increase / self.share
+        self.decrease = decrease
+        self.burst = burst
+        self.host_rates = DEFAULT_HOST_RATES if host_rates is None else host_rates
+        self._buckets = {}
+        self._max_rates = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        """URL 또는 호스트 이름에서 호스트 키 추출"""
+        if '://' in url_or_host:
+            return urlparse(url_or_host).netloc.lower()
+        return url_or_host.lower()
+
+    def _bucket(self, host: str, egress: str = None) -> TokenBucket:
+        key = host if egress is None else (host, egress)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rates = {}
+            for suffix, config in self.host_rates.items():
+                if host == suffix or host.endswith('.' + suffix):
+                    rates = config
+                    break
+            bucket = TokenBucket(rates.get('initial_rate', self.initial_rate) / self.share, self.burst)
+            self._buckets[key] = bucket
+            self._max_rates[key] = rates.get('max_rate', self.max_rate) / self.share
+        return bucket
+
+    def reserve(self, url_or_host: str, egress: str = None) -> float:
+        """요청 한 건을 예약하고 기다려야 하는 시간(초) 반환"""
+        with self._lock:
+            return self._bucket(self.host_of(url_or_host), egress).reserve()
+
+    def acquire(self, url_or_host: str, egress: str = None):
+        """호스트 예산이 허용할 때까지 대기"""
+        delay = self.reserve(url_or_host, egress)
+        if delay > 0:
+            metrics.observe('rate_limit_wait', delay)
+            time.sleep(delay)
+
+    async def acquire_async(self, url_or_host: str, egress: str = None):
+        """호스트 예산이 허용할 때까지 비동기 대기"""
+        delay = self.reserve(url_or_host, egress)
+        if delay > 0:
+            metrics.observe('rate_limit_wait', delay)
+            await asyncio.sleep(delay)
+
+    def feedback(self, url_or_host: str, status_code: int = None, throttled: bool = False,
+                 egress: str = None):
+        """응답 결과로 호스트의 요청 속도 조절"""
+        host = self.host_of(url_or_host)
+        key = host if egress is None else (host, egress)
+        with self._lock:
+            bucket = self._bucket(host, egress)
+            if throttled or status_code in (429, 503):
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                # 이미 쌓인 토큰도 버려서 바로 속도를 늦춤
+                bucket.tokens = min(bucket.tokens, 0)
+                logger.warning(f"요청 제한 감지, 속도 감소: {host} ({bucket.rate:.2f}/s)")
+            else:
+                bucket.rate = min(self._max_rates[key], bucket.rate + self.increase)
+
+    def rate(self, url_or_host: str) -> float:
+        """호스트의 현재 초당 요청 수"""
+        with self._lock:
+            return self._bucket(self.host_of(url_or_host)).rate
@@ -0,0 +1,236 @@
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+# 모든 플랫폼에 공통으로 쓰는 에러 문구
+COMMON_ERROR_TEXTS = [
+    "존재하지 않는",
+    "찾을 수 없는",
+    "삭제된",
+    "없는 페이지",
+    "Error",
+    "에러",
+    "404",
+    "페이지를 찾을 수 없습니다"
+]
+
+# 모든 플랫폼에 공통으로 쓰는 블로그 삭제/이용 제한 안내 문구
+COMMON_GONE_TEXTS = [
+    "삭제된 블로그",
+    "존재하지 않는 블로그",
+    "폐쇄된 블로그",
+    "이용이 제한된 블로그",
+    "이용 제한된 블로그"
+]
+
+# 글마다 내용이 달라 구조 지문에서 제외하는 본문 영역의 class (공통)
+COMMON_ARTICLE_BODY_CLASSES = ['entry-content', 'post-content']
+
+# 검색 결과 선택자 형식: [.컨테이너 class ]태그[.class][[href*="문자열"]]
+SERP_SELECTOR_RE = re.compile(r'^(?:\.([\w-]+)\s+)?([a-z][a-z0-9]*)?(?:\.([\w-]+))?(?:\[href\*="([^"]+)"\])?$')
+
+class SerpSelector:
+    """검색 결과 링크 선택자 하나
+
+    브라우저에서는 CSS 선택자 그대로 querySelectorAll에 쓰고, HTTP로 받은 검색 결과는
+    SerpLinkParser가 matches()로 같은 조건을 확인한다. 파서가 흉내 낼 수 있도록
+    컨테이너 class 하나, 태그, class 하나, href 부분 일치만 지원한다.
+    """
+    def __init__(self, css: str):
+        match = SERP_SELECTOR_RE.match(css.strip())
+        if match is None or not any(match.groups()[1:]):
+            raise ValueError(f"지원하지 않는 검색 결과 선택자: {css}")
+        self.css = css.strip()
+        self.container, self.tag, self.css_class, self.href = match.groups()
+
+    def matches(self, tag: str, classes: List[str], href: str, open_containers: Dict[str, int]) -> bool:
+        """href가 있는 시작 태그가 이 선택자에 해당하는지 (open_containers는 열린 컨테이너 수)"""
+        return ((self.tag is None or tag == self.tag)
+                and (self.css_class is None or self.css_class in classes)
+                and (self.href is None or self.href in href)
+                and (self.container is None or open_containers.get(self.container, 0) > 0))
+
+def default_serp_selectors(domains: Iterable[str]) -> List[str]:
+    """네이버 통합 검색의 제목 링크와 결과 영역 안의 도메인 링크 선택자"""
+    domains = list(domains)
+    return (['a.link_tit']
+            + [f'.total_area a[href*="{domain}"]' for domain in domains]
+            + ['.sh_blog_title']
+            + [f'.total_wrap a[href*="{domain}"]' for domain in domains])
+
+class PlatformRules:
+    """블로그 플랫폼 하나의 판정 규칙 (도메인, 검색 결과 선택자, 에러 요소/문구, 블로그 삭제 문구)
+
+    선택자와 문구, 에러 요소 이름은 생성할 때 한 번만 해석/컴파일해 두고
+    URL마다 다시 만들지 않는다. serp_selectors를 주지 않으면 네이버 통합 검색의
+    기본 선택자(default_serp_selectors)를 사용한다. blog_in_path가 True인 플랫폼
+    (네이버 블로그처럼 호스트 하나에 여러 블로그가 있는 경우)은 경로의 첫 부분까지를
+    블로그로 본다.
+    """
+    def __init__(self, name: str, domains: Iterable[str], error_patterns: List[Dict] = (),
+                 error_texts: Iterable[str] = (), gone_texts: Iterable[str] = (),
+                 article_body_classes: Iterable[str] = (), blog_in_path: bool = False,
+                 serp_selectors: Iterable[str] = None):
+        self.name = name
+        self.domains = [domain.lower() for domain in domains]
+        if serp_selectors is None:
+            serp_selectors = default_serp_selectors(self.domains)
+        self.serp_selectors = [SerpSelector(css) for css in serp_selectors]
+        self.error_patterns = list(error_patterns)
+        self.blog_in_path = blog_in_path
+        # 에러 문구 전체를 한 번에 찾는 정규식 (대소문자 무시)
+        texts = COMMON_ERROR_TEXTS + [text for text in error_texts if text not in COMMON_ERROR_TEXTS]
+        self.error_text_re = re.compile('|'.join(re.escape(text) for text in texts), re.IGNORECASE)
+        gone = COMMON_GONE_TEXTS + [text for text in gone_texts if text not in COMMON_GONE_TEXTS]
+        self.gone_re = re.compile('|'.join(re.escape(text) for text in gone), re.IGNORECASE)
+        self.article_body_classes = set(COMMON_ARTICLE_BODY_CLASSES).union(article_body_classes)
+        # 본문 영역 안에 있어도 구조 지문에 남기는 에러 요소의 class/id
+        self.error_element_names = {
+            pattern[key] for pattern in self.error_patterns for key in ('class', 'id') if key in pattern
+        }
+
+    def blog_root(self, url: str) -> str:
+        """URL이 속한 블로그의 루트 주소"""
+        parts = urlparse(url)
+        if self.blog_in_path:
+            segment = parts.path.lstrip('/').split('/', 1)[0]
+            if segment:
+                return f'{parts.scheme}://{parts.netloc}/{segment}'
+        return f'{parts.scheme}://{parts.netloc}/'
+
+TISTORY = PlatformRules(
+    'tistory',
+    domains=['tistory.com'],
+    error_patterns=[
+        # 패턴 1: 기본 에러 메시지
+        {'tag': 'h2', 'class': 'tit_error'},
+        {'tag': 'strong', 'class': 'tit_error'},
+        {'tag': 'p', 'class': 'desc_error'},
+
+        # 패턴 2: 스킨별 에러 메시지
+        {'tag': 'h2', 'id': 'kakaoBody'},
+        {'tag': 'div', 'class': 'error-page'},
+        {'tag': 'div', 'class': 'errorPage'},
+
+        # 패턴 3: 커스텀 에러 페이지
+        {'tag': 'div', 'class': '404'},
+        {'tag': 'div', 'class': 'error404'}
+    ],
+    article_body_classes=[
+        'article-view', 'tt_article_useless_p_margin', 'contents_style', 'article_content', 'area_view'
+    ]
+)
+
+NAVER_BLOG = PlatformRules(
+    'naver_blog',
+    domains=['blog.naver.com'],
+    error_patterns=[
+        {'tag': 'div', 'class': 'error_content'},
+        {'tag': 'p', 'class': 'error_desc'},
+        {'tag': 'div', 'class': 'no_post'}
+    ],
+    error_texts=["삭제되었거나", "비공개", "게시물이 없습니다"],
+    gone_texts=["블로그가 없습니다", "운영 정책에 의해"],
+    article_body_classes=['se-main-container', 'post-view', 'se_component_wrap'],
+    blog_in_path=True,
+    # 통합 검색의 기본 선택자에 더해 블로그 영역의 제목 링크도 수집
+    serp_selectors=default_serp_selectors(['blog.naver.com']) + ['a.title_link[href*="blog.naver.com"]']
+)
+
+BLOGSPOT = PlatformRules(
+    'blogspot',
+    domains=['blogspot.com'],
+    error_patterns=[
+        {'tag': 'div', 'class': 'status-msg-body'},
+        {'tag': 'div', 'class': 'status-msg-wrap'}
+    ],
+    error_texts=["does not exist", "not found", "찾고 있는 페이지가 없습니다"],
+    gone_texts=["Blog not found", "Blog has been removed", "블로그를 찾을 수 없습니다"],
+    article_body_classes=['post-body', 'entry-content']
+)
+
+WORDPRESS = PlatformRules(
+    'wordpress',
+    domains=['wordpress.com'],
+    error_patterns=[
+        {'tag': 'section', 'class': 'error-404'},
+        {'tag': 'div', 'class': 'error-404'},
+        {'tag': 'h1', 'class': 'page-title'}
+    ],
+    error_texts=["Page not found", "Nothing Found", "can’t be found", "can't be found"],
+    gone_texts=["is no longer available", "doesn't exist", "has been deleted", "archived or suspended"],
+    article_body_classes=['entry-content', 'wp-block-post-content']
+)
+
+# 사용할 수 있는 플랫폼 규칙 (TARGET_PLATFORMS에 이름으로 지정)
+PLATFORMS = {rules.name: rules for rules in (TISTORY, NAVER_BLOG, BLOGSPOT, WORDPRESS)}
+
+class RuleSet:
+    """대상 플랫폼 규칙들을 호스트 접미사로 찾는 판정기
+
+    도메인 접미사 -> 규칙 사전을 한 번 만들어 두고, URL마다 호스트를 점 단위로
+    잘라 긴 접미사부터 사전을 찾으므로 플랫폼 수와 관계없이 호스트 라벨 수만큼만
+    조회한다. 검색 결과 선택자는 플랫폼 순서대로 합치되 같은 선택자는 한 번만 쓴다.
+    어느 플랫폼에도 해당하지 않는 URL의 에러 판정에는 첫 번째 규칙을 사용한다.
+    """
+    def __init__(self, platforms: Iterable[PlatformRules]):
+        self.platforms = list(platforms)
+        if not self.platforms:
+            raise ValueError("대상 플랫폼이 비어 있습니다.")
+        self.default = self.platforms[0]
+        self._by_suffix = {}  # 도메인 접미사 -> 규칙
+        for rules in self.platforms:
+            for domain in rules.domains:
+                self._by_suffix.setdefault(domain, rules)
+        self._max_labels = max(domain.count('.') + 1 for domain in self._by_suffix)
+        # 모든 플랫폼의 검색 결과 선택자 (SerpLinkParser와 브라우저가 같은 순서로 사용)
+        selectors = {}
+        for rules in self.platforms:
+            for selector in rules.serp_selectors:
+                selectors.setdefault(selector.css, selector)
+        self.serp_selector_specs = list(selectors.values())
+        self.serp_selectors = list(selectors)
+        # 검색 결과 파서가 열림/닫힘을 추적할 컨테이너 class
+        self.serp_containers = sorted({
+            selector.container for selector in self.serp_selector_specs if selector.container
+        })
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> 'RuleSet':
+        """플랫폼 이름 목록으로 판정기 생성"""
+        names = [name.strip().lower() for name in names if name.strip()]
+        unknown = [name for name in names if name not in PLATFORMS]
+        if unknown:
+            raise ValueError(f"알 수 없는 플랫폼: {', '.join(unknown)} (사용 가능: {', '.join(PLATFORMS)})")
+        return cls(PLATFORMS[name] for name in names)
+
+    @classmethod
+    def from_env(cls) -> 'RuleSet':
+        """TARGET_PLATFORMS(쉼표로 구분한 플랫폼 이름, 기본 tistory)로 판정기 생성"""
+        return cls.from_names(os.environ.get('TARGET_PLATFORMS', 'tistory').split(','))
+
+    def match_host(self, host: str) -> Optional[PlatformRules]:
+        """호스트가 속한 플랫폼 규칙 (대상 플랫폼이 아니면 None)"""
+        labels = host.lower().rstrip('.').split('.')
+        for start in range(max(0, len(labels) - self._max_labels), len(labels)):
+            rules = self._by_suffix.get('.'.join(labels[start:]))
+            if rules is not None:
+                return rules
+        return None
+
+    def match(self, url: str) -> Optional[PlatformRules]:
+        """URL이 속한 플랫폼 규칙 (대상 플랫폼이 아니면 None)"""
+        return self.match_host(urlparse(url).hostname or '')
+
+    def for_url(self, url: Optional[str]) -> PlatformRules:
+        """URL의 에러 판정에 사용할 규칙 (URL이 없거나 대상 플랫폼이 아니면 기본 규칙)"""
+        if url:
+            rules = self.match(url)
+            if rules is not None:
+                return rules
+        return self.default
+
+    def blog_root(self, url: str) -> str:
+        """URL이 속한 블로그의 루트 주소"""
+        return self.for_url(url).blog_root(url)
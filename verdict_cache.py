@@ -0,0 +1,114 @@
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# 판정 종류별 기본 유효 기간 (초)
+DEFAULT_TTLS = {
+    'dead': 7 * 24 * 3600,   # 낙장 판정은 잘 바뀌지 않으므로 길게
+    'alive': 24 * 3600       # 정상 페이지는 삭제될 수 있으므로 짧게
+}
+
+# 캐시 키에서 제외할 추적용 쿼리 파라미터
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid')
+
+def normalize_url(url: str) -> str:
+    """캐시 키로 사용할 정규화된 URL 반환"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith(TRACKING_PARAMS)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+class CacheEntry(NamedTuple):
+    url: str
+    is_error: bool
+    status_code: Optional[int]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    checked_at: float
+    fresh: bool
+
+class VerdictCache:
+    """URL별 낙장 판정 결과를 저장하는 SQLite 캐시"""
+    def __init__(self, path: str = 'verdict_cache.db', ttls: Dict[str, float] = None):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # 여러 프로세스가 같은 캐시 파일을 동시에 읽고 쓸 수 있도록 WAL 모드 사용
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS verdicts (
+                url TEXT PRIMARY KEY,
+                is_error INTEGER NOT NULL,
+                status_code INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """캐시된 판정 조회 (없으면 None, 만료 여부는 fresh로 표시)"""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT is_error, status_code, etag, last_modified, checked_at FROM verdicts WHERE url = ?',
+                (key,)
+            ).fetchone()
+        if not row:
+            return None
+
+        is_error, status_code, etag, last_modified, checked_at = row
+        ttl = self.ttls['dead' if is_error else 'alive']
+        return CacheEntry(
+            url=key,
+            is_error=bool(is_error),
+            status_code=status_code,
+            etag=etag,
+            last_modified=last_modified,
+            checked_at=checked_at,
+            fresh=(time.time() - checked_at) < ttl
+        )
+
+    def put(self, url: str, is_error: bool, status_code: int = None,
+            etag: str = None, last_modified: str = None):
+        """판정 결과 저장"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?, ?)',
+                (normalize_url(url), int(is_error), status_code, etag, last_modified, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """재검증(304)된 판정의 유효 기간 갱신"""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE verdicts SET checked_at = ? WHERE url = ?',
+                (time.time(), normalize_url(url))
+            )
+            self._conn.commit()
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
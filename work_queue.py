@@ -0,0 +1,288 @@
+import json
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 작업 항목 종류: 키워드 검색 / URL 묶음 검사
+KEYWORD_ITEM = 'keyword'
+URLS_ITEM = 'urls'
+
+# 이 횟수만큼 실패한 항목은 더 이상 재시도하지 않고 실패 결과로 보고
+MAX_ATTEMPTS = 3
+
+class WorkItem:
+    """워커가 빌려 간 작업 항목"""
+    def __init__(self, item_id: str, task_id: str, kind: str, payload: Dict, attempts: int = 0):
+        self.item_id = item_id
+        self.task_id = task_id
+        self.kind = kind
+        self.payload = payload
+        self.attempts = attempts
+
+class SQLiteWorkQueue:
+    """SQLite 파일 하나를 여러 프로세스가 공유하는 작업 대기열
+
+    워커는 항목을 lease_seconds 동안 빌려 가고, 그 안에 완료를 보고하지 않으면
+    (워커가 죽은 경우 등) 다른 워커가 다시 빌려 간다. 결과는 작업별로 쌓이며
+    조정자가 마지막으로 읽은 위치부터 가져간다. 같은 호스트나 공유 파일
+    시스템의 워커끼리만 사용할 수 있다.
+    """
+    def __init__(self, path: str = 'work_queue.db'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS work_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                leased_until REAL NOT NULL DEFAULT 0,
+                worker TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS work_items_lease ON work_items (leased_until, id);
+            CREATE TABLE IF NOT EXISTS work_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id TEXT NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS work_results_task ON work_results (task_id, id);
+        ''')
+
+    def put(self, task_id: str, kind: str, payload: Dict):
+        """작업 항목 추가"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO work_items (task_id, kind, payload) VALUES (?, ?, ?)',
+                (task_id, kind, json.dumps(payload, ensure_ascii=False))
+            )
+
+    def lease(self, worker: str, lease_seconds: float = 120.0) -> Optional[WorkItem]:
+        """대기 중이거나 대여 기간이 끝난 항목 하나를 빌려 감 (없으면 None)"""
+        now = time.time()
+        with self._lock:
+            # 다른 프로세스와 같은 항목을 빌려 가지 않도록 쓰기 잠금을 먼저 잡음
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT id, task_id, kind, payload, attempts FROM work_items '
+                    'WHERE leased_until < ? ORDER BY id LIMIT 1',
+                    (now,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute('COMMIT')
+                    return None
+                item_id, task_id, kind, payload, attempts = row
+                self._conn.execute(
+                    'UPDATE work_items SET leased_until = ?, worker = ?, attempts = attempts + 1 WHERE id = ?',
+                    (now + lease_seconds, worker, item_id)
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return WorkItem(str(item_id), task_id, kind, json.loads(payload), attempts + 1)
+
+    def complete(self, item: WorkItem, result: Dict):
+        """항목을 대기열에서 지우고 결과 기록
+
+        이미 다른 워커가 완료했거나 정리된 항목이면 결과를 기록하지 않는다.
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                deleted = self._conn.execute(
+                    'DELETE FROM work_items WHERE id = ?', (int(item.item_id),)
+                ).rowcount
+                if deleted:
+                    self._conn.execute(
+                        'INSERT INTO work_results (task_id, payload) VALUES (?, ?)',
+                        (item.task_id, json.dumps(result, ensure_ascii=False))
+                    )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def release(self, item: WorkItem):
+        """처리하지 못한 항목을 바로 다른 워커가 가져갈 수 있게 반납"""
+        with self._lock:
+            self._conn.execute('UPDATE work_items SET leased_until = 0 WHERE id = ?', (int(item.item_id),))
+
+    def results(self, task_id: str, after: int = 0, limit: int = 1000) -> Tuple[List[Dict], int]:
+        """after 이후에 쌓인 작업 결과와 다음 조회 위치"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, payload FROM work_results WHERE task_id = ? AND id > ? ORDER BY id LIMIT ?',
+                (task_id, after, limit)
+            ).fetchall()
+        if not rows:
+            return [], after
+        return [json.loads(payload) for _, payload in rows], rows[-1][0]
+
+    def pending(self, task_id: str = None) -> int:
+        """남은 항목 수 (task_id가 없으면 전체)"""
+        with self._lock:
+            if task_id is None:
+                return self._conn.execute('SELECT COUNT(*) FROM work_items').fetchone()[0]
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM work_items WHERE task_id = ?', (task_id,)
+            ).fetchone()[0]
+
+    def purge(self, task_id: str):
+        """작업의 남은 항목과 결과 삭제 (취소/완료 후 정리)"""
+        with self._lock:
+            self._conn.execute('DELETE FROM work_items WHERE task_id = ?', (task_id,))
+            self._conn.execute('DELETE FROM work_results WHERE task_id = ?', (task_id,))
+
+# 대여 기간이 끝난 항목을 대기 리스트 앞쪽으로 되돌린 뒤 남아 있는 항목 하나를 빌려 감
+# KEYS: pending, leased / ARGV: 현재 시각, 대여 만료 시각, 항목 키 접두사
+LEASE_SCRIPT = """
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], 0, ARGV[1])) do
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('LPUSH', KEYS[1], id)
+end
+while true do
+    local id = redis.call('LPOP', KEYS[1])
+    if not id then
+        return nil
+    end
+    local key = ARGV[3] .. id
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('ZADD', KEYS[2], ARGV[2], id)
+        local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+        local fields = redis.call('HMGET', key, 'task_id', 'kind', 'payload')
+        return {id, fields[1], fields[2], fields[3], attempts}
+    end
+end
+"""
+
+# 빌려 간 항목을 대기 리스트로 반납
+# KEYS: pending, leased / ARGV: 항목 id
+RELEASE_SCRIPT = """
+if redis.call('ZREM', KEYS[2], ARGV[1]) == 1 then
+    redis.call('LPUSH', KEYS[1], ARGV[1])
+end
+"""
+
+# 항목이 남아 있을 때만 지우고 결과 기록 (이미 완료되었거나 정리된 항목이면 0)
+# KEYS: leased, 항목, 결과 리스트, 남은 항목 수, 작업의 항목 집합 / ARGV: 항목 id, 결과
+COMPLETE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+if redis.call('DEL', KEYS[2]) == 0 then
+    return 0
+end
+redis.call('SREM', KEYS[5], ARGV[1])
+redis.call('RPUSH', KEYS[3], ARGV[2])
+redis.call('DECR', KEYS[4])
+return 1
+"""
+
+# 작업의 대기/대여 중인 항목과 결과 삭제 (대기 리스트에 남은 id는 빌려 갈 때 건너뜀)
+# KEYS: 작업의 항목 집합, leased, 결과 리스트, 남은 항목 수 / ARGV: 항목 키 접두사
+PURGE_SCRIPT = """
+for _, id in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    redis.call('DEL', ARGV[1] .. id)
+    redis.call('ZREM', KEYS[2], id)
+end
+redis.call('DEL', KEYS[1], KEYS[3], KEYS[4])
+"""
+
+class RedisWorkQueue:
+    """Redis 호환 서버를 사용하는 작업 대기열 (여러 호스트의 워커가 공유)
+
+    SQLiteWorkQueue와 같은 방식으로 동작한다. 대기 항목은 리스트에, 빌려 간
+    항목의 대여 만료 시각은 정렬 집합에, 작업별 항목 id는 집합에, 결과는 작업별
+    리스트에 쌓는다. 대여/반납/완료/정리는 Lua 스크립트로 한 번에 실행하므로
+    중간에 워커가 죽어도 항목이 사라지지 않고, 정리된 작업의 항목(대여 중인 항목
+    포함)을 늦게 완료해도 결과가 기록되지 않는다. redis 패키지가 설치되어 있어야 한다.
+    """
+    def __init__(self, url: str, prefix: str = 'finddomain'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("Redis 작업 대기열을 사용하려면 redis 패키지를 설치해주세요.")
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self._lease = self._redis.register_script(LEASE_SCRIPT)
+        self._release = self._redis.register_script(RELEASE_SCRIPT)
+        self._complete = self._redis.register_script(COMPLETE_SCRIPT)
+        self._purge = self._redis.register_script(PURGE_SCRIPT)
+
+    def _key(self, *parts: str) -> str:
+        return ':'.join((self.prefix,) + parts)
+
+    def put(self, task_id: str, kind: str, payload: Dict):
+        """작업 항목 추가"""
+        item_id = str(self._redis.incr(self._key('next_id')))
+        pipe = self._redis.pipeline()
+        pipe.hset(self._key('item', item_id), mapping={
+            'task_id': task_id,
+            'kind': kind,
+            'payload': json.dumps(payload, ensure_ascii=False),
+            'attempts': 0
+        })
+        pipe.sadd(self._key('items', task_id), item_id)
+        pipe.rpush(self._key('pending'), item_id)
+        pipe.incr(self._key('count', task_id))
+        pipe.execute()
+
+    def lease(self, worker: str, lease_seconds: float = 120.0) -> Optional[WorkItem]:
+        """대기 중이거나 대여 기간이 끝난 항목 하나를 빌려 감 (없으면 None)"""
+        now = time.time()
+        row = self._lease(
+            keys=[self._key('pending'), self._key('leased')],
+            args=[now, now + lease_seconds, self._key('item', '')]
+        )
+        if row is None:
+            return None
+        item_id, task_id, kind, payload, attempts = row
+        return WorkItem(item_id, task_id, kind, json.loads(payload), int(attempts))
+
+    def complete(self, item: WorkItem, result: Dict):
+        """항목을 대기열에서 지우고 결과 기록
+
+        이미 다른 워커가 완료했거나 정리된 항목이면 결과를 기록하지 않는다.
+        """
+        self._complete(
+            keys=[self._key('leased'), self._key('item', item.item_id), self._key('results', item.task_id),
+                  self._key('count', item.task_id), self._key('items', item.task_id)],
+            args=[item.item_id, json.dumps(result, ensure_ascii=False)]
+        )
+
+    def release(self, item: WorkItem):
+        """처리하지 못한 항목을 바로 다른 워커가 가져갈 수 있게 반납"""
+        self._release(keys=[self._key('pending'), self._key('leased')], args=[item.item_id])
+
+    def results(self, task_id: str, after: int = 0, limit: int = 1000) -> Tuple[List[Dict], int]:
+        """after 이후에 쌓인 작업 결과와 다음 조회 위치"""
+        rows = self._redis.lrange(self._key('results', task_id), after, after + limit - 1)
+        return [json.loads(row) for row in rows], after + len(rows)
+
+    def pending(self, task_id: str = None) -> int:
+        """남은 항목 수 (task_id가 없으면 전체)"""
+        if task_id is None:
+            return self._redis.llen(self._key('pending')) + self._redis.zcard(self._key('leased'))
+        return int(self._redis.get(self._key('count', task_id)) or 0)
+
+    def purge(self, task_id: str):
+        """작업의 남은 항목(대여 중인 항목 포함)과 결과 삭제 (취소/완료 후 정리)"""
+        self._purge(
+            keys=[self._key('items', task_id), self._key('leased'), self._key('results', task_id),
+                  self._key('count', task_id)],
+            args=[self._key('item', '')]
+        )
+
+def open_work_queue(url: str):
+    """주소에 맞는 작업 대기열 생성 (redis://, rediss:// 또는 SQLite 파일 경로)"""
+    if url.startswith(('redis://', 'rediss://')):
+        return RedisWorkQueue(url)
+    if url.startswith('sqlite:///'):
+        url = url[len('sqlite:///'):]
+    return SQLiteWorkQueue(url)
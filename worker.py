@@ -0,0 +1,83 @@
+import argparse
+import logging
+import os
+import socket
+import time
+from typing import Dict
+
+from main import PageChecker
+from verdict_cache import VerdictCache, DEFAULT_TTLS
+from work_queue import open_work_queue, WorkItem, KEYWORD_ITEM, URLS_ITEM, MAX_ATTEMPTS
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def process_item(checker: PageChecker, item: WorkItem) -> Dict:
+    """작업 항목 하나를 처리하고 조정자에게 보낼 결과 반환"""
+    payload = item.payload
+    if item.kind == KEYWORD_ITEM:
+        # 검색 결과 URL만 보고하고, URL 검사는 조정자가 묶음으로 나누어 다시 대기열에 넣음
+        urls = checker.search_keyword(payload['keyword'])
+        return {'kind': KEYWORD_ITEM, 'keyword_idx': payload['keyword_idx'], 'urls': urls}
+    if item.kind == URLS_ITEM:
+        verdicts = []
+        def on_result(url, is_error, elapsed, reason):
+            verdicts.append([url, is_error, reason])
+        checker.check_urls(payload['urls'], on_result=on_result)
+        return {'kind': URLS_ITEM, 'keyword_idx': payload['keyword_idx'], 'chunk': payload['chunk'],
+                'verdicts': verdicts}
+    raise ValueError(f"알 수 없는 작업 종류: {item.kind}")
+
+def run_worker(work_queue, checker: PageChecker, worker_id: str, lease_seconds: float = 120.0,
+               idle_sleep: float = 1.0, exit_when_idle: bool = False):
+    """대기열에서 항목을 빌려 처리하고 결과를 보고하는 루프"""
+    logger.info(f"워커 시작: {worker_id}")
+    while True:
+        item = work_queue.lease(worker_id, lease_seconds)
+        if item is None:
+            if exit_when_idle:
+                logger.info("처리할 항목이 없어 워커 종료")
+                return
+            time.sleep(idle_sleep)
+            continue
+        try:
+            result = process_item(checker, item)
+        except Exception as e:
+            logger.error(f"작업 항목 처리 중 에러 발생: {item.kind} {item.item_id} - {str(e)}")
+            if item.attempts < MAX_ATTEMPTS:
+                work_queue.release(item)
+                continue
+            # 재시도해도 실패하는 항목은 조정자가 기다리지 않도록 실패로 보고
+            result = {'kind': item.kind, 'keyword_idx': item.payload.get('keyword_idx'),
+                      'chunk': item.payload.get('chunk'), 'error': str(e)}
+        work_queue.complete(item, result)
+
+def main():
+    parser = argparse.ArgumentParser(description='작업 대기열의 키워드/URL을 검사하는 워커')
+    parser.add_argument('--queue', default=os.environ.get('WORK_QUEUE', 'work_queue.db'),
+                        help='작업 대기열 주소 (SQLite 파일 경로 또는 redis://...)')
+    parser.add_argument('--cache', default=os.environ.get('VERDICT_CACHE_PATH', 'verdict_cache.db'),
+                        help='판정 캐시 DB 경로')
+    parser.add_argument('--no_cache', action='store_true', help='판정 캐시를 사용하지 않음')
+    parser.add_argument('--lease', type=float, default=120.0, help='항목 대여 시간 (초, 넘기면 다른 워커가 다시 처리)')
+    parser.add_argument('--idle_sleep', type=float, default=1.0, help='대기열이 비었을 때 다시 확인할 간격 (초)')
+    parser.add_argument('--exit_when_idle', action='store_true', help='대기열이 비면 종료')
+    args = parser.parse_args()
+
+    work_queue = open_work_queue(args.queue)
+    cache = None if args.no_cache else VerdictCache(args.cache, ttls=DEFAULT_TTLS)
+    checker = PageChecker(cache=cache)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        run_worker(work_queue, checker, worker_id, args.lease, args.idle_sleep, args.exit_when_idle)
+    except KeyboardInterrupt:
+        logger.info("워커 중지")
+    finally:
+        checker.close()
+
+if __name__ == "__main__":
+    main()